@@ -0,0 +1,511 @@
+"""
+Módulo: Benchmark dos Métodos Numéricos
+Descrição: Mede o desempenho dos métodos de forma estatisticamente confiável,
+substituindo a medição única de tempo feita por testarMetodos.tests.
+
+Uma única medição com perf_counter em torno de uma chamada que leva poucos
+microssegundos é dominada por ruído (interrupções, cache, coletor de lixo).
+Aqui cada método é executado muitas vezes depois de um aquecimento, e o tempo
+é reportado por mediana, percentil 95 e desvio padrão. O custo da primeira
+chamada (compilação da expressão e da derivada) é medido à parte, como
+partida a frio, e as avaliações de f e f' de cada método são contadas pelo
+módulo metodos.instrumentacao.
+
+Os resultados podem ser gravados em JSON, e o modo de comparação aponta as
+regressões entre dois arquivos de resultados.
+
+O modo inicializacao mede a partida de um processo novo que lê uma função,
+compila f e f' e roda o Newton uma vez, como um trabalhador do lote ou uma
+chamada de linha de comando: pelo compilador restrito (sem SymPy) e pelo
+caminho simbólico, além do interpretador vazio como referência.
+
+O modo escala resolve lotes gerados por corpus.gerar_lote, de tamanhos
+crescentes, com os métodos vetorizados de metodos/lote.py, e reporta
+soluções por segundo e o maior erro em relação às raízes de referência.
+
+O modo fundido compara cada método genérico (f e f' compiladas, uma chamada
+por avaliação) com a sua versão fundida (metodos.fundido), em que o laço
+inteiro é gerado com a aritmética de f escrita dentro dele.
+
+Uso:
+    python benchmark.py executar [arquivos...] [--repeticoes N] [--aquecimento K] [--saida res.json]
+    python benchmark.py comparar base.json novo.json [--limiar 0.10]
+    python benchmark.py inicializacao [--funcao "x**2 - 4"] [--repeticoes N] [--saida res.json]
+    python benchmark.py fundido [arquivos...] [--repeticoes N] [--aquecimento K] [--saida res.json]
+    python benchmark.py escala [--n 1000 100000 1000000] [--tamanho 8] [--saida res.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.secante
+import metodos.newton
+import metodos.brent
+import metodos.fundido
+import metodos.halley
+import metodos.householder
+import metodos.portfolio
+from metodos import avaliador
+from metodos.expressao import Expressao
+from metodos.instrumentacao import Instrumento
+
+ARQUIVOS_PADRAO = ["input.txt", "input2.txt", "problema_bacterias.txt", "problema_deslocamento.txt"]
+
+# Cada método recebe (problema, f, df), com problema = (func, a, b, x0, x1, precisao, iteracoes)
+METODOS: Dict[str, Callable] = {
+    "Bissecção": lambda p, f, df: metodos.bisseccao.bisseccao(p[1], p[2], p[6], f, p[5]),
+    "Falsa Posição": lambda p, f, df: metodos.falsaPosicao.falsaPosicao(p[1], p[2], f, p[5], p[6]),
+    "FP Illinois": lambda p, f, df: metodos.falsaPosicao.falsaPosicao(p[1], p[2], f, p[5], p[6], variante='illinois'),
+    "FP Pegasus": lambda p, f, df: metodos.falsaPosicao.falsaPosicao(p[1], p[2], f, p[5], p[6], variante='pegasus'),
+    "FP Anderson-Björck": lambda p, f, df: metodos.falsaPosicao.falsaPosicao(p[1], p[2], f, p[5], p[6],
+                                                                           variante='anderson_bjorck'),
+    "Secante": lambda p, f, df: metodos.secante.secante(p[3], p[4], f, p[5], p[6]),
+    "Newton-Raphson": lambda p, f, df: metodos.newton.newton(p[3], f, df, p[5], p[6]),
+    "Brent": lambda p, f, df: metodos.brent.brent(p[1], p[2], f, p[5], p[6]),
+    "Halley": lambda p, f, df: metodos.halley.halley(p[3], df, p[5], p[6]),
+    "Householder": lambda p, f, df: metodos.householder.householder(p[3], df, p[5], p[6]),
+    "Portfólio": lambda p, f, df: metodos.portfolio.portfolio(p[1], p[2], p[3], p[4], f, p[5], p[6],
+                                                             derivada=df).resultado,
+}
+
+# Métodos que recebem f' além de f
+USAM_DERIVADA = {"Newton-Raphson", "Portfólio"}
+
+# Métodos que recebem, no lugar de f', a função que retorna f e as derivadas
+# até a ordem indicada em uma única avaliação (avaliador.compilar_derivadas)
+FUNDIDAS = {"Halley": 2, "Householder": 3}
+
+
+def cronometrar(chamada: Callable[[], object], repeticoes: int = 200, aquecimento: int = 20,
+                alvo_amostra: float = 1e-4) -> Dict[str, float]:
+    """
+    Mede o tempo de chamada() em regime permanente, em milissegundos.
+
+    Cada amostra executa chamada() tantas vezes quanto necessário para durar
+    pelo menos alvo_amostra segundos (calibrado no aquecimento) e registra o
+    tempo médio por chamada. A saída impressa pela chamada é descartada.
+
+    Retorno:
+        Dicionário com mediana_ms, p95_ms, media_ms, desvio_ms, min_ms,
+        repeticoes e chamadas_por_amostra.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(aquecimento):
+            chamada()
+
+        numero = 1
+        while True:
+            inicio = time.perf_counter()
+            for _ in range(numero):
+                chamada()
+            if time.perf_counter() - inicio >= alvo_amostra or numero >= 1 << 20:
+                break
+            numero *= 2
+
+        amostras = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            for _ in range(numero):
+                chamada()
+            amostras.append((time.perf_counter() - inicio) * 1000 / numero)
+
+    amostras.sort()
+    return {
+        "mediana_ms": statistics.median(amostras),
+        "p95_ms": amostras[min(len(amostras) - 1, math.ceil(0.95 * len(amostras)) - 1)],
+        "media_ms": statistics.fmean(amostras),
+        "desvio_ms": statistics.stdev(amostras) if len(amostras) > 1 else 0.0,
+        "min_ms": amostras[0],
+        "repeticoes": repeticoes,
+        "chamadas_por_amostra": numero,
+    }
+
+
+def medir_metodo(nome: str, problema: tuple, repeticoes: int = 200, aquecimento: int = 20) -> Dict[str, object]:
+    """
+    Mede um método sobre um problema: partida a frio, avaliações e regime permanente.
+    """
+    metodo = METODOS[nome]
+    func = problema[0]
+    usa_derivada = nome in USAM_DERIVADA
+
+    # Partida a frio: compilação da expressão (e da derivada) e primeira chamada
+    avaliador.limpar_cache()
+    if isinstance(func, Expressao):
+        # A Expressao já traz f compilada: a partida a frio parte do texto
+        func = func.texto
+    inicio = time.perf_counter()
+    f = avaliador.compilar(func)
+    if nome in FUNDIDAS:
+        df = avaliador.compilar_derivadas(func, FUNDIDAS[nome])
+    else:
+        df = avaliador.compilar_derivada(func) if usa_derivada else None
+    resultado = metodo(problema, f, df)
+    frio_ms = (time.perf_counter() - inicio) * 1000
+
+    inst = Instrumento()
+    if nome in FUNDIDAS:
+        inst.medir(lambda: metodo(problema, f, inst.envolver(df)))
+        # Cada avaliação fundida conta como uma de f e uma de f', como no Newton
+        inst.avaliacoes_df = inst.avaliacoes_f
+    else:
+        inst.medir(lambda: metodo(problema, inst.envolver(f),
+                                  inst.envolver(df, derivada=True) if usa_derivada else None))
+
+    medida = {
+        "status": resultado.status.name,
+        "convergiu": resultado.convergiu,
+        "iteracoes": resultado.iteracoes if resultado.convergiu else None,
+        "raiz": float(resultado.raiz) if resultado.convergiu else None,
+        "avaliacoes_f": inst.avaliacoes_f,
+        "avaliacoes_df": inst.avaliacoes_df,
+        "fracao_avaliacao": inst.tempo_avaliacao / inst.tempo_total if inst.tempo_total > 0 else 0.0,
+        "frio_ms": frio_ms,
+    }
+    medida.update(cronometrar(lambda: metodo(problema, f, df), repeticoes, aquecimento))
+    return medida
+
+
+def executar_benchmark(arquivos: List[str], repeticoes: int = 200, aquecimento: int = 20) -> Dict[str, object]:
+    """Mede todos os métodos em todos os arquivos de problema."""
+    # Importado aqui porque main importa testarMetodos, que usa cronometrar
+    import main
+
+    problemas = []
+    for nome_arquivo in arquivos:
+        problema = main.ler_problema(nome_arquivo)
+        problemas.append({
+            "arquivo": nome_arquivo,
+            "funcao": str(problema[0]),
+            "metodos": {nome: medir_metodo(nome, problema, repeticoes, aquecimento) for nome in METODOS},
+        })
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticoes": repeticoes,
+        "aquecimento": aquecimento,
+        "problemas": problemas,
+    }
+
+
+# Métodos com versão fundida: (nome em METODOS, chave em metodos.fundido.GENERICOS,
+# chamada da função fundida com o problema)
+FUNDIDOS = [
+    ("Bissecção", "bisseccao", lambda p, fundido: fundido(p[1], p[2], p[6], p[5])),
+    ("Falsa Posição", "falsaPosicao", lambda p, fundido: fundido(p[1], p[2], p[5], p[6])),
+    ("Secante", "secante", lambda p, fundido: fundido(p[3], p[4], p[5], p[6])),
+    ("Newton-Raphson", "newton", lambda p, fundido: fundido(p[3], p[5], p[6])),
+]
+
+
+def medir_fundidos(arquivos: List[str], repeticoes: int = 200, aquecimento: int = 20) -> Dict[str, object]:
+    """
+    Mede cada método genérico contra a sua versão fundida nos arquivos de problema.
+
+    Os dois caminhos partem da mesma expressão do compilador restrito, e
+    os resultados são conferidos (mesmo status, raiz e iterações).
+    """
+    import main
+
+    problemas = []
+    for nome_arquivo in arquivos:
+        problema = main.ler_problema(nome_arquivo)
+        func = problema[0]
+        f = avaliador.compilar(func)
+        df = avaliador.compilar_derivada(func)
+        medidas = {}
+        for nome, metodo, chamar in FUNDIDOS:
+            fundido = metodos.fundido.compilar(func, metodo)
+            if fundido is None:
+                continue
+            generico = METODOS[nome]
+            r_generico = generico(problema, f, df)
+            r_fundido = chamar(problema, fundido)
+            medidas[nome] = {
+                "iguais": (r_generico.status, r_generico.raiz, r_generico.iteracoes)
+                          == (r_fundido.status, r_fundido.raiz, r_fundido.iteracoes),
+                "generico_ms": cronometrar(lambda: generico(problema, f, df), repeticoes, aquecimento)["mediana_ms"],
+                "fundido_ms": cronometrar(lambda: chamar(problema, fundido), repeticoes, aquecimento)["mediana_ms"],
+            }
+        problemas.append({"arquivo": nome_arquivo, "funcao": str(func), "metodos": medidas})
+
+    return {"python": platform.python_version(), "repeticoes": repeticoes, "problemas": problemas}
+
+
+def imprimir_fundidos(resultados: Dict[str, object]):
+    for problema in resultados["problemas"]:
+        print(f"\n{problema['arquivo']}: f(x) = {problema['funcao']}")
+        print("-" * 80)
+        print(f"{'Metodo':<18} {'Generico (ms)':<15} {'Fundido (ms)':<15} {'Ganho':<8} {'Mesmo resultado':<16}")
+        print("-" * 80)
+        for nome, m in problema["metodos"].items():
+            ganho = m["generico_ms"] / m["fundido_ms"] if m["fundido_ms"] > 0 else float("inf")
+            print(f"{nome:<18} {m['generico_ms']:<15.6f} {m['fundido_ms']:<15.6f} {ganho:<8.2f} "
+                  f"{'sim' if m['iguais'] else 'NAO':<16}")
+
+
+def medir_escala(quantidades: List[int], tamanho: int = 8, precisao: float = 1e-10, maxIter: int = 100,
+                 semente: int = 0) -> Dict[str, object]:
+    """Soluções por segundo dos métodos em lote para lotes de cada tamanho em quantidades."""
+    import numpy as np
+
+    import corpus
+    import metodos.lote
+
+    metodos_lote = {
+        "Bissecção": lambda l, p: metodos.lote.bisseccao_lote(l["a"], l["b"], l["funcao"], precisao, maxIter, p),
+        "Falsa Posição": lambda l, p: metodos.lote.falsaPosicao_lote(l["a"], l["b"], l["funcao"], precisao, maxIter, p),
+        "Secante": lambda l, p: metodos.lote.secante_lote(l["x0"], l["x1"], l["funcao"], precisao, maxIter, p),
+        "Newton-Raphson": lambda l, p: metodos.lote.newton_lote(l["x0"], l["funcao"], precisao, maxIter, p),
+    }
+
+    lotes = []
+    for n in quantidades:
+        lote = corpus.gerar_lote(n, tamanho, semente)
+        lote["funcao"] = avaliador.expressao(str(lote["funcao"]))
+        parametros = corpus.parametros_lote(lote)
+        medidas = {}
+        for nome, resolver in metodos_lote.items():
+            inicio = time.perf_counter()
+            raizes, _, status = resolver(lote, parametros)
+            segundos = time.perf_counter() - inicio
+            medidas[nome] = {
+                "segundos": segundos,
+                "solucoes_por_segundo": n / segundos if segundos > 0 else float("inf"),
+                "convergidos": int((status == 0).sum()),
+                "erro_maximo": float(np.nanmax(np.abs(raizes - lote["raiz"]))) if (status == 0).any() else None,
+            }
+        lotes.append({"n": n, "metodos": medidas})
+
+    return {"python": platform.python_version(), "tamanho": tamanho, "precisao": precisao, "lotes": lotes}
+
+
+def imprimir_escala(resultados: Dict[str, object]):
+    print(f"\nFamilia de {resultados['tamanho']} termos, precisao {resultados['precisao']:g}")
+    print("-" * 80)
+    print(f"{'N':<10} {'Metodo':<18} {'Tempo (s)':<12} {'Solucoes/s':<14} {'Convergidos':<13} {'Erro max':<10}")
+    print("-" * 80)
+    for lote in resultados["lotes"]:
+        for nome, m in lote["metodos"].items():
+            erro = f"{m['erro_maximo']:.2e}" if m["erro_maximo"] is not None else "-"
+            print(f"{lote['n']:<10} {nome:<18} {m['segundos']:<12.3f} {m['solucoes_por_segundo']:<14.0f} "
+                  f"{m['convergidos']:<13} {erro:<10}")
+
+
+# Programa executado em cada processo novo; {funcao} é interpretar
+# (compilador restrito) ou expressao (SymPy)
+_PARTIDA = """
+import sys
+from metodos import avaliador
+import metodos.newton
+func = avaliador.{funcao}({texto!r})
+f = avaliador.compilar(func)
+df = avaliador.compilar_derivada(func)
+metodos.newton.newton({x0!r}, f, df, 1e-6, 100)
+print('sympy' in sys.modules)
+"""
+
+
+def medir_inicializacao(texto: str, x0: float, repeticoes: int = 20) -> Dict[str, Dict[str, object]]:
+    """
+    Mede a partida de processos novos do interpretador, em milissegundos.
+
+    Retorno:
+        Para cada caminho (vazio, restrito, simbolico), as estatísticas de
+        cronometrar e se o SymPy foi importado.
+    """
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    programas = {
+        "vazio": "print(False)",
+        "restrito": _PARTIDA.format(funcao="interpretar", texto=texto, x0=x0),
+        "simbolico": _PARTIDA.format(funcao="expressao", texto=texto, x0=x0),
+    }
+
+    medidas = {}
+    for nome, programa in programas.items():
+        comando = [sys.executable, "-c", programa]
+        saida = subprocess.run(comando, cwd=diretorio, capture_output=True, text=True, check=True).stdout
+        medida = cronometrar(lambda: subprocess.run(comando, cwd=diretorio, capture_output=True, check=True),
+                             repeticoes, aquecimento=1)
+        medida["sympy_importado"] = saida.strip() == "True"
+        medidas[nome] = medida
+    return medidas
+
+
+def imprimir_inicializacao(texto: str, medidas: Dict[str, Dict[str, object]]):
+    print(f"\nPartida de um processo novo: f(x) = {texto}")
+    print("-" * 80)
+    print(f"{'Caminho':<12} {'Mediana (ms)':<14} {'p95 (ms)':<12} {'Desvio (ms)':<12} {'SymPy importado':<16}")
+    print("-" * 80)
+    for nome, m in medidas.items():
+        print(f"{nome:<12} {m['mediana_ms']:<14.1f} {m['p95_ms']:<12.1f} {m['desvio_ms']:<12.1f} "
+              f"{'sim' if m['sympy_importado'] else 'nao':<16}")
+    vazio = medidas["vazio"]["mediana_ms"]
+    restrito = medidas["restrito"]["mediana_ms"] - vazio
+    simbolico = medidas["simbolico"]["mediana_ms"] - vazio
+    if restrito > 0:
+        print(f"\nDescontado o interpretador vazio: {simbolico:.1f} ms -> {restrito:.1f} ms "
+              f"({simbolico / restrito:.1f}x mais rapido)")
+
+
+def imprimir_resultados(resultados: Dict[str, object]):
+    """Imprime uma tabela por problema com as estatísticas de cada método."""
+    for problema in resultados["problemas"]:
+        print(f"\n{problema['arquivo']}: f(x) = {problema['funcao']}")
+        print("-" * 100)
+        print(f"{'Metodo':<18} {'Iter':<6} {'Aval f':<8} {'Aval df':<8} {'Frio (ms)':<12} "
+              f"{'Mediana (ms)':<14} {'p95 (ms)':<12} {'Desvio (ms)':<12}")
+        print("-" * 100)
+        for nome, m in problema["metodos"].items():
+            iteracoes = m["iteracoes"] if m["convergiu"] else "-"
+            print(f"{nome:<18} {iteracoes!s:<6} {m['avaliacoes_f']:<8} {m['avaliacoes_df']:<8} "
+                  f"{m['frio_ms']:<12.4f} {m['mediana_ms']:<14.6f} {m['p95_ms']:<12.6f} {m['desvio_ms']:<12.6f}")
+
+        # Latência do portfólio contra o melhor método isolado que convergiu
+        carteira = problema["metodos"].get("Portfólio")
+        isolados = [(m["mediana_ms"], nome) for nome, m in problema["metodos"].items()
+                    if nome != "Portfólio" and m["convergiu"]]
+        if carteira and carteira["convergiu"] and isolados:
+            melhor_ms, melhor = min(isolados)
+            print(f"Portfolio: {carteira['mediana_ms']:.6f} ms contra {melhor_ms:.6f} ms do melhor "
+                  f"metodo isolado ({melhor}), {carteira['mediana_ms'] / melhor_ms:.2f}x")
+
+
+def comparar(base: Dict[str, object], novo: Dict[str, object], limiar: float = 0.10) -> List[str]:
+    """
+    Compara dois resultados e retorna a descrição de cada regressão.
+
+    Há regressão quando a mediana piora mais que limiar (fração) e a
+    diferença supera o desvio padrão da base, ou quando o método passa a
+    avaliar f ou f' mais vezes, ou deixa de convergir.
+    """
+    anteriores = {p["arquivo"]: p for p in base["problemas"]}
+    regressoes = []
+
+    for problema in novo["problemas"]:
+        anterior = anteriores.get(problema["arquivo"])
+        if anterior is None:
+            continue
+        for nome, m in problema["metodos"].items():
+            b = anterior["metodos"].get(nome)
+            if b is None:
+                continue
+            local = f"{problema['arquivo']} / {nome}"
+
+            if b["convergiu"] and not m["convergiu"]:
+                regressoes.append(f"{local}: deixou de convergir")
+                continue
+
+            razao = m["mediana_ms"] / b["mediana_ms"] if b["mediana_ms"] > 0 else 1.0
+            if razao > 1 + limiar and m["mediana_ms"] - b["mediana_ms"] > b["desvio_ms"]:
+                regressoes.append(f"{local}: mediana {b['mediana_ms']:.6f} -> {m['mediana_ms']:.6f} ms "
+                                  f"(+{(razao - 1) * 100:.1f}%)")
+
+            for chave in ("avaliacoes_f", "avaliacoes_df"):
+                if m[chave] > b[chave]:
+                    regressoes.append(f"{local}: {chave} {b[chave]} -> {m[chave]}")
+
+    return regressoes
+
+
+def main_benchmark(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dos métodos de busca de zeros.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    executar = comandos.add_parser("executar", help="Mede os métodos nos arquivos de problema")
+    executar.add_argument("arquivos", nargs="*", default=ARQUIVOS_PADRAO)
+    executar.add_argument("--repeticoes", type=int, default=200)
+    executar.add_argument("--aquecimento", type=int, default=20)
+    executar.add_argument("--saida", help="Grava os resultados em JSON neste arquivo")
+
+    comparacao = comandos.add_parser("comparar", help="Aponta regressões entre dois resultados")
+    comparacao.add_argument("base")
+    comparacao.add_argument("novo")
+    comparacao.add_argument("--limiar", type=float, default=0.10,
+                            help="Piora relativa da mediana considerada regressão (padrão: 0.10)")
+
+    inicializacao = comandos.add_parser("inicializacao", help="Mede a partida de um processo novo")
+    inicializacao.add_argument("--funcao", default="80*exp(-2*x) + 20*exp(-0.1*x) - 10")
+    inicializacao.add_argument("--x0", type=float, default=1.0)
+    inicializacao.add_argument("--repeticoes", type=int, default=20)
+    inicializacao.add_argument("--saida", help="Grava os resultados em JSON neste arquivo")
+
+    fundidos = comandos.add_parser("fundido", help="Compara os métodos genéricos com as versões fundidas")
+    fundidos.add_argument("arquivos", nargs="*", default=ARQUIVOS_PADRAO)
+    fundidos.add_argument("--repeticoes", type=int, default=200)
+    fundidos.add_argument("--aquecimento", type=int, default=20)
+    fundidos.add_argument("--saida", help="Grava os resultados em JSON neste arquivo")
+
+    escala = comandos.add_parser("escala", help="Soluções por segundo dos métodos em lote em lotes gerados")
+    escala.add_argument("--n", type=int, nargs="+", default=[1000, 100000, 1000000], help="Tamanhos dos lotes")
+    escala.add_argument("--tamanho", type=int, default=8, help="Termos da família de funções (padrão: 8)")
+    escala.add_argument("--precisao", type=float, default=1e-10)
+    escala.add_argument("--iteracoes", type=int, default=100)
+    escala.add_argument("--semente", type=int, default=0)
+    escala.add_argument("--saida", help="Grava os resultados em JSON neste arquivo")
+
+    args = parser.parse_args(argv)
+
+    if args.comando == "escala":
+        resultados = medir_escala(args.n, args.tamanho, args.precisao, args.iteracoes, args.semente)
+        imprimir_escala(resultados)
+        if args.saida:
+            with open(args.saida, "w") as arquivo:
+                json.dump(resultados, arquivo, indent=2)
+        return 0
+
+    if args.comando == "fundido":
+        resultados = medir_fundidos(args.arquivos, args.repeticoes, args.aquecimento)
+        imprimir_fundidos(resultados)
+        if args.saida:
+            with open(args.saida, "w") as arquivo:
+                json.dump(resultados, arquivo, indent=2)
+        return 0
+
+    if args.comando == "inicializacao":
+        medidas = medir_inicializacao(args.funcao, args.x0, args.repeticoes)
+        imprimir_inicializacao(args.funcao, medidas)
+        if args.saida:
+            with open(args.saida, "w") as arquivo:
+                json.dump({"python": platform.python_version(), "funcao": args.funcao,
+                           "caminhos": medidas}, arquivo, indent=2)
+        return 0
+
+    if args.comando == "executar":
+        resultados = executar_benchmark(args.arquivos, args.repeticoes, args.aquecimento)
+        imprimir_resultados(resultados)
+        if args.saida:
+            with open(args.saida, "w") as arquivo:
+                json.dump(resultados, arquivo, indent=2)
+        return 0
+
+    with open(args.base) as arquivo:
+        base = json.load(arquivo)
+    with open(args.novo) as arquivo:
+        novo = json.load(arquivo)
+
+    regressoes = comparar(base, novo, args.limiar)
+    if not regressoes:
+        print("[OK] Nenhuma regressao encontrada")
+        return 0
+    print(f"[ERRO] {len(regressoes)} regressao(oes) encontrada(s):")
+    for regressao in regressoes:
+        print(f"   - {regressao}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main_benchmark())
@@ -0,0 +1,197 @@
+"""
+Módulo: Teste de Carga do Serviço HTTP
+Descrição: Dispara pedidos simultâneos contra o serviço de servico.py e
+reporta a vazão (pedidos por segundo) e a latência (mediana, p95 e p99).
+
+Cada cliente é uma thread com a sua própria conexão HTTP/1.1 mantida aberta,
+enviando um pedido de cada vez. Todos os pedidos usam a mesma função com
+intervalos e estimativas diferentes, o caso em que o serviço agrupa pedidos.
+Com --iniciar, o serviço é iniciado no próprio processo, em uma porta livre,
+para uma medição sem configuração.
+
+Com --cruzamento, mede sem HTTP o tempo de um grupo de pedidos pelos métodos
+escalares e pelo lote vetorizado, para cada tamanho de grupo, e indica o
+menor tamanho em que o lote compensa: o valor de --minimo do serviço.
+
+Uso:
+    python carga_servico.py [--url http://127.0.0.1:8080 | --iniciar] [--clientes 64]
+                            [--pedidos 50] [--metodo bisseccao] [--janela 2] [--saida res.json]
+    python carga_servico.py --cruzamento [--metodo bisseccao]
+"""
+
+import argparse
+import http.client
+import json
+import math
+import random
+import statistics
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+FUNCAO_PADRAO = "80*exp(-2*x) + 20*exp(-0.1*x) - 10"
+TAMANHOS_PADRAO = (8, 16, 24, 32, 40, 48, 64, 96, 128)
+
+
+def _percentil(ordenadas: List[float], fracao: float) -> float:
+    return ordenadas[min(len(ordenadas) - 1, math.ceil(fracao * len(ordenadas)) - 1)]
+
+
+def _cliente(url: str, problemas: List[Dict[str, object]], latencias: List[float], erros: List[str]):
+    partes = urlsplit(url)
+    conexao = http.client.HTTPConnection(partes.hostname, partes.port or 80, timeout=30)
+    try:
+        for problema in problemas:
+            corpo = json.dumps(problema)
+            inicio = time.perf_counter()
+            conexao.request("POST", "/resolver", corpo, {"Content-Type": "application/json"})
+            resposta = conexao.getresponse()
+            dados = resposta.read()
+            latencias.append(time.perf_counter() - inicio)
+            if resposta.status != 200 or json.loads(dados).get("erro"):
+                erros.append(dados.decode(errors="replace"))
+    except OSError as e:
+        erros.append(str(e))
+    finally:
+        conexao.close()
+
+
+def _problemas(sorteio: random.Random, n: int, metodo: str, funcao: str) -> List[Dict[str, object]]:
+    problemas = []
+    for _ in range(n):
+        x0 = sorteio.uniform(0, 6)
+        problemas.append({"funcao": funcao, "metodo": metodo, "a": 0, "b": sorteio.uniform(8, 30),
+                          "x0": x0, "x1": x0 + 0.5})
+    return problemas
+
+
+def medir_carga(url: str, clientes: int = 64, pedidos: int = 50, metodo: str = "bisseccao",
+                funcao: str = FUNCAO_PADRAO, semente: int = 0) -> Dict[str, object]:
+    """
+    Executa clientes threads com pedidos pedidos cada e mede vazão e latência.
+
+    Retorno:
+        Dicionário com pedidos, erros, segundos, pedidos_por_segundo e
+        mediana_ms, p95_ms, p99_ms e max_ms da latência.
+    """
+    sorteio = random.Random(semente)
+    cargas = [_problemas(sorteio, pedidos, metodo, funcao) for _ in range(clientes)]
+
+    latencias: List[float] = []
+    erros: List[str] = []
+    threads = [threading.Thread(target=_cliente, args=(url, carga, latencias, erros)) for carga in cargas]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    segundos = time.perf_counter() - inicio
+
+    latencias.sort()
+    if not latencias:
+        return {"pedidos": 0, "erros": len(erros), "segundos": segundos, "pedidos_por_segundo": 0.0}
+    return {
+        "pedidos": len(latencias),
+        "erros": len(erros),
+        "segundos": segundos,
+        "pedidos_por_segundo": len(latencias) / segundos,
+        "mediana_ms": statistics.median(latencias) * 1000,
+        "p95_ms": _percentil(latencias, 0.95) * 1000,
+        "p99_ms": _percentil(latencias, 0.99) * 1000,
+        "max_ms": latencias[-1] * 1000,
+    }
+
+
+def medir_cruzamento(metodo: str = "bisseccao", funcao: str = FUNCAO_PADRAO,
+                     tamanhos: Sequence[int] = TAMANHOS_PADRAO, repeticoes: int = 20,
+                     semente: int = 0) -> List[Tuple[int, float, float]]:
+    """
+    Mede o tempo de um grupo de pedidos pelos dois caminhos do agrupador.
+
+    Retorno:
+        Lista de (tamanho, escalar_ms, vetorizado_ms), com a mediana de
+        repeticoes execuções de um grupo de cada tamanho.
+    """
+    import benchmark
+    import fluxo
+    import servico
+
+    sorteio = random.Random(semente)
+    medidas = []
+    for tamanho in tamanhos:
+        problemas = [{**fluxo.PADROES, **p} for p in _problemas(sorteio, tamanho, metodo, funcao)]
+        chave = servico._chave(problemas[0])
+        if chave is None:
+            raise ValueError(f"Metodo sem versao vetorizada: {metodo}")
+        escalar = benchmark.cronometrar(lambda: servico._resolver_grupo(chave, problemas, tamanho + 1),
+                                        repeticoes)['mediana_ms']
+        vetorizado = benchmark.cronometrar(lambda: servico._resolver_grupo(chave, problemas, tamanho),
+                                           repeticoes)['mediana_ms']
+        medidas.append((tamanho, escalar, vetorizado))
+    return medidas
+
+
+def main_carga(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Teste de carga do serviço HTTP de zeros de funções.")
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--iniciar", action="store_true", help="Inicia o serviço no próprio processo")
+    parser.add_argument("--janela", type=float, default=2.0,
+                        help="Janela de agrupamento do serviço iniciado, em milissegundos (padrão: 2)")
+    parser.add_argument("--minimo", type=int,
+                        help="Tamanho mínimo de grupo para o lote vetorizado no serviço iniciado "
+                             "(padrão: o do serviço)")
+    parser.add_argument("--clientes", type=int, default=64,
+                        help="Clientes simultâneos; limitam o tamanho dos grupos (padrão: 64)")
+    parser.add_argument("--pedidos", type=int, default=200, help="Pedidos por cliente (padrão: 50)")
+    parser.add_argument("--metodo", default="bisseccao")
+    parser.add_argument("--funcao", default=FUNCAO_PADRAO)
+    parser.add_argument("--saida", help="Grava as medidas em JSON")
+    parser.add_argument("--cruzamento", action="store_true",
+                        help="Mede o tamanho de grupo a partir do qual o lote vetorizado compensa")
+    args = parser.parse_args(argv)
+
+    if args.cruzamento:
+        medidas = medir_cruzamento(args.metodo, args.funcao)
+        print(f"{'Grupo':>6} {'Escalar (ms)':>13} {'Lote (ms)':>10}")
+        for tamanho, escalar, vetorizado in medidas:
+            print(f"{tamanho:>6} {escalar:>13.3f} {vetorizado:>10.3f}")
+        compensa = [tamanho for tamanho, escalar, vetorizado in medidas if vetorizado < escalar]
+        print(f"Lote compensa a partir de {compensa[0]} pedidos por grupo" if compensa
+              else "Lote nao compensou em nenhum tamanho medido")
+        return 0
+
+    url = args.url
+    servico = None
+    if args.iniciar:
+        import servico as modulo_servico
+
+        servico = modulo_servico.iniciar(janela=args.janela / 1000, minimo=args.minimo or modulo_servico.MINIMO)
+        url = servico.url
+    try:
+        medidas = medir_carga(url, args.clientes, args.pedidos, args.metodo, args.funcao)
+    finally:
+        if servico is not None:
+            servico.shutdown()
+            servico.server_close()
+
+    print(f"{medidas['pedidos']} pedidos ({medidas['erros']} erros) em {medidas['segundos']:.2f} s: "
+          f"{medidas['pedidos_por_segundo']:.0f} pedidos/s")
+    if medidas["pedidos"]:
+        print(f"Latencia: mediana {medidas['mediana_ms']:.2f} ms, p95 {medidas['p95_ms']:.2f} ms, "
+              f"p99 {medidas['p99_ms']:.2f} ms, max {medidas['max_ms']:.2f} ms")
+    if servico is not None:
+        agrupador = servico.agrupador
+        if agrupador.lotes:
+            print(f"Agrupamento: {agrupador.agrupados} pedidos em {agrupador.lotes} lotes "
+                  f"({agrupador.agrupados / agrupador.lotes:.1f} por lote), "
+                  f"{agrupador.vetorizados} no lote vetorizado")
+    if args.saida:
+        with open(args.saida, "w") as arquivo:
+            json.dump(medidas, arquivo, indent=2)
+    return 1 if medidas["erros"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_carga())
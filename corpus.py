@@ -0,0 +1,362 @@
+"""
+Módulo: Corpus de Problemas e Gerador em Escala
+Descrição: Conjunto curado de funções de teste clássicas para métodos de
+busca de zeros e geradores de conjuntos de problemas de qualquer tamanho,
+no formato de 7 linhas de input.txt ou em arrays para os métodos em lote.
+
+Os quatro arquivos de exemplo e os casos de exemplo_uso.py são poucos para
+dizer algo sobre o comportamento dos métodos em escala. O corpus reúne
+funções que exercitam os pontos fracos de cada método, em cinco categorias:
+
+    - multiplas:        raízes múltiplas (convergência linear do Newton,
+                        raízes pares sem mudança de sinal)
+    - planas:           regiões quase planas (passos enormes do Newton,
+                        falsa convergência pelo resíduo absoluto)
+    - oscilatorias:     várias raízes no intervalo e oscilação rápida
+    - caras:            transcendentais compostas, caras de avaliar
+    - quase_singulares: derivada nula ou quase nula perto da raiz, polos
+                        e ciclos do Newton
+
+Cada caso traz o intervalo, as estimativas iniciais e as raízes de
+referência no intervalo (calculadas com o mpmath), para conferir a precisão
+dos resultados e não só o status.
+
+Os geradores são determinísticos pela semente:
+    - gerar_problemas: N funções aleatórias de M termos (potências, exp,
+      trigonométricas, atan, tanh, log e sqrt), com um intervalo em que f
+      troca de sinal verificado numericamente e a raiz fora do ponto médio;
+      gravar_problemas as grava como arquivos de 7 linhas
+    - gerar_lote: família paramétrica f(x) = sum c_k g_k(x) - y, com g_k
+      crescentes e c_k > 0, de modo que cada [a, b] tem exatamente uma raiz;
+      os coeficientes de cada problema ficam em arrays, prontos para
+      metodos/lote.py
+
+Uso:
+    python corpus.py corpus <diretorio> [--categoria planas] [--precisao 1e-6] [--iteracoes 100]
+    python corpus.py gerar <diretorio> --n 10000 --tamanho 8 [--semente 0]
+    python corpus.py lote <lote.npz> --n 1000000 --tamanho 8 [--semente 0]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import sympy as sp
+
+from metodos import avaliador
+
+CATEGORIAS = ("multiplas", "planas", "oscilatorias", "caras", "quase_singulares")
+
+
+class Caso:
+    """Função de teste do corpus, com intervalo, estimativas e raízes de referência."""
+
+    __slots__ = ("nome", "categoria", "funcao", "a", "b", "x0", "x1", "raizes", "descricao")
+
+    def __init__(self, nome: str, categoria: str, funcao: str, a: float, b: float, x0: float, x1: float,
+                 raizes: Tuple[float, ...], descricao: str):
+        self.nome = nome
+        self.categoria = categoria
+        self.funcao = funcao
+        self.a = a
+        self.b = b
+        self.x0 = x0
+        self.x1 = x1
+        self.raizes = raizes
+        self.descricao = descricao
+
+    def problema(self, precisao: float = 1e-6, iteracoes: int = 100) -> tuple:
+        """Tupla (func, a, b, x0, x1, precisao, iteracoes), como a de main.ler_problema."""
+        return (avaliador.interpretar(self.funcao), self.a, self.b, self.x0, self.x1, precisao, iteracoes)
+
+    def __repr__(self) -> str:
+        return f"Caso({self.nome!r}, {self.categoria}, f(x) = {self.funcao})"
+
+
+CORPUS: List[Caso] = [
+    # Raízes múltiplas
+    Caso("raiz_tripla", "multiplas", "(x - 1)**3", 0, 2.5, 2, 2.2, (1.0,),
+         "Raiz tripla: Newton e Secante convergem só linearmente"),
+    Caso("acelerador", "multiplas", "x**3 - 5*x**2 + 8*x - 4", 0, 3, 2.5, 3, (1.0, 2.0),
+         "Exemplo do trabalho: raiz simples em 1 e dupla em 2, sem troca de sinal"),
+    Caso("raiz_quintupla", "multiplas", "(x - 2)**5", 0, 3.7, 3, 3.2, (2.0,),
+         "Raiz de multiplicidade 5: |f| < precisao longe da raiz"),
+    Caso("exp_tripla", "multiplas", "exp(x) - 1 - x - x**2/2", -1, 1.3, 1, 1.1, (0.0,),
+         "Raiz tripla com cancelamento catastrófico perto de x = 0"),
+    Caso("dupla_sem_troca", "multiplas", "(x - 1.5)**2*(x + 2)", 0, 3, 2.5, 2.7, (1.5,),
+         "Raiz dupla sem mudança de sinal: os métodos de intervalo falham"),
+
+    # Regiões planas
+    Caso("potencia_20", "planas", "x**20 - 1", 0, 1.6, 0.5, 0.6, (1.0,),
+         "Plana em [0, 1) e íngreme depois: o primeiro passo do Newton vai longe"),
+    Caso("inclinacao_minima", "planas", "1e-7*(x - 1.5)", 0, 2.2, 0.3, 0.4, (1.5,),
+         "|f| < 1e-6 em todo o intervalo: falsa convergência pelo resíduo"),
+    Caso("cauda_exponencial", "planas", "exp(-x) - 1e-6", 0, 20.3, 5, 6, (13.815510557964274,),
+         "Cauda quase plana: Newton avança cerca de 1 por iteração"),
+
+    # Oscilatórias
+    Caso("cos_x", "oscilatorias", "cos(x) - x", 0, 1.3, 0.5, 0.6, (0.7390851332151607,),
+         "Caso clássico bem comportado, referência para os demais"),
+    Caso("seno_10x", "oscilatorias", "sin(10*x) + cos(3*x)", 0, 1, 0.3, 0.35,
+         (0.36249146002959154, 0.6731984257692414, 0.8458134067357136),
+         "Três raízes no intervalo"),
+    Caso("deslocamento", "oscilatorias", "10*exp(-0.5*x)*cos(2*x) - 5", 0, 5, 0.5, 1.5,
+         (0.44757456251232514,), "Problema 2 do trabalho: oscilação amortecida"),
+    Caso("seno_x_100", "oscilatorias", "sin(x) - x/100", 0.5, 30, 3, 3.1,
+         (3.1104828076215054, 6.346694942064703, 9.331328721296261, 12.693650500389035,
+          15.551811341312085, 19.041137088484657, 21.771674093496973, 25.389445764018806,
+          27.99063729983955),
+         "Nove raízes: qual delas cada método encontra depende do ponto de partida"),
+    Caso("x_sen_1_x", "oscilatorias", "x*sin(1/x) - 0.2", 0.05, 1, 0.6, 0.7, (0.38524673294008954,),
+         "Oscilação cada vez mais rápida perto de x = 0"),
+
+    # Transcendentais caras
+    Caso("colebrook", "caras", "1/sqrt(x) + 2*log(2.51/(1e5*sqrt(x)) + 1e-4/3.7)/log(10)", 0.008, 0.1,
+         0.02, 0.03, (0.018513866077471644,),
+         "Equação de Colebrook (fator de atrito, Re = 1e5, rugosidade relativa 1e-4)"),
+    Caso("wien", "caras", "5*exp(-x) + x - 5", 1, 10, 4, 5, (4.965114231744276,),
+         "Lei do deslocamento de Wien"),
+    Caso("bacterias", "caras", "80*exp(-2*x) + 20*exp(-0.1*x) - 10", 0, 10, 1, 2, (6.931548088196803,),
+         "Problema 1 do trabalho: concentração de bactérias"),
+    Caso("cadeia_transcendental", "caras",
+         "exp(sin(x))*log(2 + cos(x)**2) + atan(sqrt(1 + x**2)) - tanh(x/3) - 2", 1, 4, 2.5, 3,
+         (2.7971151342199008,), "Composição de oito funções transcendentais por avaliação"),
+
+    # Derivada quase singular
+    Caso("ciclo_newton", "quase_singulares", "x**3 - 2*x + 2", -3, 0, 0, 1, (-1.7692923542386314,),
+         "Newton a partir de x0 = 0 entra no ciclo 0, 1, 0, ..."),
+    Caso("kepler_0_99", "quase_singulares", "x - 0.99*sin(x) - 0.01", 0, 1, 0.001, 0.002,
+         (0.3422703164917751,), "Equação de Kepler com excentricidade 0.99: f'(0) = 0.01"),
+    Caso("kepler_0_9", "quase_singulares", "x - 0.9*sin(x) - 0.5", 0, 3, 0, 0.1, (1.3844127202021626,),
+         "Equação de Kepler com excentricidade 0.9"),
+    Caso("raizes_proximas", "quase_singulares", "(x - 1)**2 - 1e-10", 1, 2, 1, 1.2, (1.00001,),
+         "Raízes em 1 +- 1e-5; f'(1) = 0 exatamente"),
+    Caso("polo", "quase_singulares", "1/(x - 0.5) + 3", 0, 0.45, 0.4, 0.3, (0.16666666666666666,),
+         "Polo em x = 0.5, logo depois do intervalo"),
+    Caso("atan", "quase_singulares", "atan(x)", -1, 2.5, 1.5, 1.6, (0.0,),
+         "Newton diverge para |x0| > 1.3917 (derivada pequena longe da raiz)"),
+]
+
+
+def casos(categoria: Optional[str] = None) -> List[Caso]:
+    """Casos do corpus, todos ou só os de uma categoria."""
+    if categoria is None:
+        return list(CORPUS)
+    if categoria not in CATEGORIAS:
+        raise ValueError(f"Categoria desconhecida: {categoria}")
+    return [caso for caso in CORPUS if caso.categoria == categoria]
+
+
+def caso(nome: str) -> Caso:
+    for c in CORPUS:
+        if c.nome == nome:
+            return c
+    raise KeyError(nome)
+
+
+# Formato de 7 linhas (main.ler_problema)
+
+def linhas_problema(funcao: str, a: float, b: float, x0: float, x1: float,
+                    precisao: float = 1e-6, iteracoes: int = 100) -> str:
+    """Texto do arquivo de problema no formato de input.txt."""
+    return "\n".join([funcao, repr(a), repr(b), repr(x0), repr(x1), repr(precisao), str(iteracoes)]) + "\n"
+
+
+def gravar_problema(caminho: str, funcao: str, a: float, b: float, x0: float, x1: float,
+                    precisao: float = 1e-6, iteracoes: int = 100):
+    with open(caminho, "w") as arquivo:
+        arquivo.write(linhas_problema(funcao, a, b, x0, x1, precisao, iteracoes))
+
+
+def gravar_corpus(diretorio: str, categoria: Optional[str] = None, precisao: float = 1e-6,
+                  iteracoes: int = 100) -> List[str]:
+    """Grava os casos do corpus como corpus_<nome>.txt; retorna os caminhos."""
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = []
+    for c in casos(categoria):
+        caminho = os.path.join(diretorio, f"corpus_{c.nome}.txt")
+        gravar_problema(caminho, c.funcao, c.a, c.b, c.x0, c.x1, precisao, iteracoes)
+        caminhos.append(caminho)
+    return caminhos
+
+
+# Problemas aleatórios de M termos
+
+# Termos das funções aleatórias: c e d são coeficientes sorteados
+TERMOS = (
+    "{c}*x**{k}",
+    "{c}*exp({d}*x)",
+    "{c}*sin({d}*x)",
+    "{c}*cos({d}*x)",
+    "{c}*atan({d}*x)",
+    "{c}*tanh({d}*x)",
+    "{c}*log(1 + x**2)",
+    "{c}*sqrt(1 + x**2)",
+)
+
+
+def _termo(gerador: random.Random) -> str:
+    modelo = gerador.choice(TERMOS)
+    c = round(gerador.uniform(-3, 3), 3) or 1.0
+    d = round(gerador.uniform(-1.5, 1.5), 3) or 1.0
+    return modelo.format(c=c, d=d, k=gerador.randint(1, 5)).replace("x**1", "x")
+
+
+def _intervalo(f, r: float, gerador: random.Random) -> Optional[Tuple[float, float]]:
+    """Intervalo com troca de sinal em volta de r, com r fora do ponto médio."""
+    largura = gerador.uniform(0.5, 2.0)
+    for _ in range(40):
+        a = round(r - largura * gerador.uniform(0.2, 1.0), 6)
+        b = round(r + largura * gerador.uniform(0.2, 1.0), 6)
+        fa, fb = f(a), f(b)
+        if math.isfinite(fa) and math.isfinite(fb) and fa * fb < 0:
+            return a, b
+        largura /= 2
+    return None
+
+
+def gerar_problemas(n: int, tamanho: int, semente: int = 0) -> List[Tuple[str, float, float, float, float]]:
+    """
+    Gera n problemas (funcao, a, b, x0, x1) com funções de tamanho termos.
+
+    Cada função é g(x) - g(r), com g uma soma de termos sorteados e r um
+    ponto sorteado em [-3, 3]; o intervalo [a, b] é reduzido em volta de r
+    até f trocar de sinal (com o mesmo sinal em f(a) e f(b), r é sorteado
+    de novo). x0 e x1 ficam dentro do intervalo.
+    """
+    gerador = random.Random(semente)
+    problemas = []
+    while len(problemas) < n:
+        g = " + ".join(_termo(gerador) for _ in range(tamanho)).replace("+ -", "- ")
+        r = round(gerador.uniform(-3, 3), 6)
+        valor = avaliador.compilar(g)(r)
+        if not math.isfinite(valor):
+            continue
+        funcao = f"{g} - {valor!r}" if valor >= 0 else f"{g} + {-valor!r}"
+        intervalo = _intervalo(avaliador.compilar(funcao), r, gerador)
+        if intervalo is None:
+            continue
+        a, b = intervalo
+        x0 = round(gerador.uniform(a, b), 6)
+        x1 = round(x0 + (b - a) / 10, 6)
+        problemas.append((funcao, a, b, x0, x1))
+    return problemas
+
+
+def gravar_problemas(diretorio: str, n: int, tamanho: int, semente: int = 0, precisao: float = 1e-6,
+                     iteracoes: int = 100) -> List[str]:
+    """Grava gerar_problemas(n, tamanho, semente) como problema_000000.txt, ...; retorna os caminhos."""
+    os.makedirs(diretorio, exist_ok=True)
+    caminhos = []
+    for k, (funcao, a, b, x0, x1) in enumerate(gerar_problemas(n, tamanho, semente)):
+        caminho = os.path.join(diretorio, f"problema_{k:06d}.txt")
+        gravar_problema(caminho, funcao, a, b, x0, x1, precisao, iteracoes)
+        caminhos.append(caminho)
+    return caminhos
+
+
+# Lotes paramétricos para metodos/lote.py
+
+# Funções crescentes em toda a reta; o termo k usa a base k % len, com a
+# escala de x aumentando a cada volta
+BASES = ("x/{s}", "(x/{s})**3", "exp(x/{s})", "atan(x/{s})", "sinh(x/{s})", "tanh(x/{s})")
+
+
+def funcao_lote(tamanho: int) -> str:
+    """Texto da família c0*g0(x) + ... + c{M-1}*g{M-1}(x) - y."""
+    termos = [f"c{k}*" + BASES[k % len(BASES)].format(s=2 + k // len(BASES)) for k in range(tamanho)]
+    return " + ".join(termos) + " - y"
+
+
+def gerar_lote(n: int, tamanho: int, semente: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Gera n problemas da família funcao_lote(tamanho) em arrays.
+
+    Os c_k > 0 tornam f crescente, e y = f(r) para r sorteado em cada [a, b];
+    assim cada problema tem exatamente uma raiz, a referência r.
+
+    Retorno:
+        Dicionário com funcao (texto), a, b, x0, x1, raiz e os parâmetros
+        c0..c{M-1} e y; parametros_lote(lote) monta o argumento parametros
+        dos métodos em lote.
+    """
+    gerador = np.random.default_rng(semente)
+    a = gerador.uniform(-4, -1, n)
+    b = gerador.uniform(1, 4, n)
+    raiz = a + (b - a) * gerador.uniform(0.05, 0.95, n)
+    coeficientes = {f"c{k}": gerador.uniform(0.5, 2, n) for k in range(tamanho)}
+
+    funcao = funcao_lote(tamanho)
+    g = avaliador.compilar_vetorial(funcao.rsplit(" - y", 1)[0], sp.symbols(tuple(coeficientes)))
+    y = g(raiz, *coeficientes.values())
+
+    x0 = np.clip(raiz + (b - a) * gerador.uniform(-0.2, 0.2, n), a, b)
+    return {"funcao": np.array(funcao), "a": a, "b": b, "x0": x0, "x1": x0 + (b - a) / 10,
+            "raiz": raiz, **coeficientes, "y": y}
+
+
+def parametros_lote(lote: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Argumento parametros dos métodos em lote: {c0: ..., y: ...}."""
+    return {nome: valores for nome, valores in lote.items() if nome == "y" or nome[0] == "c"}
+
+
+def gravar_lote(caminho: str, lote: Dict[str, np.ndarray]):
+    np.savez(caminho, **lote)
+
+
+def abrir_lote(caminho: str) -> Dict[str, np.ndarray]:
+    with np.load(caminho) as dados:
+        lote = {nome: dados[nome] for nome in dados.files}
+    lote["funcao"] = str(lote["funcao"])
+    return lote
+
+
+def main_corpus(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Corpus de funções de teste e gerador de problemas em escala.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    corpus = comandos.add_parser("corpus", help="Grava os casos do corpus em arquivos de 7 linhas")
+    corpus.add_argument("diretorio")
+    corpus.add_argument("--categoria", choices=CATEGORIAS)
+    corpus.add_argument("--precisao", type=float, default=1e-6)
+    corpus.add_argument("--iteracoes", type=int, default=100)
+
+    gerar = comandos.add_parser("gerar", help="Gera N problemas aleatórios de M termos em arquivos de 7 linhas")
+    gerar.add_argument("diretorio")
+    gerar.add_argument("--n", type=int, required=True)
+    gerar.add_argument("--tamanho", type=int, default=4, help="Termos por função (padrão: 4)")
+    gerar.add_argument("--semente", type=int, default=0)
+    gerar.add_argument("--precisao", type=float, default=1e-6)
+    gerar.add_argument("--iteracoes", type=int, default=100)
+
+    lote = comandos.add_parser("lote", help="Gera N problemas da família paramétrica em um arquivo .npz")
+    lote.add_argument("arquivo")
+    lote.add_argument("--n", type=int, required=True)
+    lote.add_argument("--tamanho", type=int, default=4, help="Termos da família (padrão: 4)")
+    lote.add_argument("--semente", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.comando == "corpus":
+            caminhos = gravar_corpus(args.diretorio, args.categoria, args.precisao, args.iteracoes)
+            print(f"{len(caminhos)} casos gravados em {args.diretorio}")
+        elif args.comando == "gerar":
+            caminhos = gravar_problemas(args.diretorio, args.n, args.tamanho, args.semente,
+                                        args.precisao, args.iteracoes)
+            print(f"{len(caminhos)} problemas gravados em {args.diretorio}")
+        else:
+            gravar_lote(args.arquivo, gerar_lote(args.n, args.tamanho, args.semente))
+            print(f"{args.n} problemas gravados em {args.arquivo}")
+    except (OSError, ValueError) as e:
+        print(f"[ERRO] {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_corpus())
@@ -124,6 +124,7 @@ def exemplo_com_metodo_individual():
     print("="*80)
     
     import metodos.bisseccao
+    from metodos import avaliador
     
     func = sp.sympify("x**2 - 4")
     a = 1.0
@@ -133,12 +134,13 @@ def exemplo_com_metodo_individual():
     
     resultado = metodos.bisseccao.bisseccao(a, b, max_iter, func, precisao)
     
-    if resultado[0] != -1:
-        print(f"[OK] Raiz encontrada: {resultado[1]:.10f}")
-        print(f"Iteracoes: {resultado[0] + 1}")
-        print(f"Verificacao: f({resultado[1]:.8f}) = {float(func.subs(x, resultado[1])):.2e}")
+    if resultado.convergiu:
+        print(f"[OK] Raiz encontrada: {resultado.raiz:.10f}")
+        print(f"Iteracoes: {resultado.iteracoes}")
+        print(f"Avaliacoes de f: {resultado.avaliacoes_f}")
+        print(f"Verificacao: f({resultado.raiz:.8f}) = {avaliador.compilar(func)(resultado.raiz):.2e}")
     else:
-        print("[ERRO] Metodo nao convergiu")
+        print(f"[ERRO] Metodo nao convergiu ({resultado.status.name})")
 
 def main():
     """
@@ -0,0 +1,215 @@
+"""
+Módulo: Solução em Fluxo (JSON Lines)
+Descrição: Lê problemas em JSON Lines da entrada padrão (ou de um pipe),
+resolve-os em um pool de processos e escreve os resultados na saída padrão
+à medida que ficam prontos, em um único processo de longa duração.
+
+Cada linha de entrada é um objeto com os campos:
+    funcao      (obrigatório) texto da função de x, como em input.txt
+    metodo      bisseccao, falsaPosicao, secante, newton, brent, halley,
+                householder ou portfolio (padrão: brent)
+    a, b        intervalo (métodos de intervalo e portfolio)
+    x0, x1      estimativas iniciais (secante, newton, halley,
+                householder e portfolio)
+    precisao    tolerância (padrão: 1e-6)
+    iteracoes   máximo de iterações (padrão: 100)
+    id          qualquer valor, repetido na saída
+
+A leitura, a solução e a escrita formam um pipeline do asyncio: as linhas
+são lidas em blocos por uma thread, cada bloco é resolvido no pool e os
+blocos em andamento ficam em uma fila limitada. Quando a saída não
+acompanha, a fila enche e a leitura para (contrapressão), de modo que a
+memória fica constante qualquer que seja o tamanho da entrada. Os
+resultados saem na ordem da entrada.
+
+A função é lida só pelo compilador restrito (metodos.expressao): números, x,
+pi, E, operadores aritméticos e as funções elementares. Outros textos
+recebem o erro no campo erro; --simbolica os aceita pelo SymPy, cujo
+sympify executa o texto como código Python (só para entradas confiáveis).
+
+Saída:
+    Uma linha por problema com os campos: linha, id, metodo, status,
+    convergiu, raiz, iteracoes, avaliacoes, residuo, erro.
+
+Uso:
+    python fluxo.py [--processos N] [--bloco K] [--pendentes P]
+                    [--cache DIRETORIO] [--cache-tamanho N] [--simbolica] < problemas.jsonl > resultados.jsonl
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import math
+import os
+import sys
+from typing import Callable, Dict, IO, List, Optional
+
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.secante
+import metodos.newton
+import metodos.brent
+import metodos.halley
+import metodos.householder
+import metodos.portfolio
+from metodos import avaliador
+
+# Cada método recebe (problema, f, df) e retorna um Resultado
+METODOS: Dict[str, Callable] = {
+    "bisseccao": lambda p, f, df: metodos.bisseccao.bisseccao(p["a"], p["b"], p["iteracoes"], f, p["precisao"]),
+    "falsaPosicao": lambda p, f, df: metodos.falsaPosicao.falsaPosicao(p["a"], p["b"], f, p["precisao"],
+                                                                      p["iteracoes"]),
+    "secante": lambda p, f, df: metodos.secante.secante(p["x0"], p["x1"], f, p["precisao"], p["iteracoes"]),
+    "newton": lambda p, f, df: metodos.newton.newton(p["x0"], f, df, p["precisao"], p["iteracoes"]),
+    "brent": lambda p, f, df: metodos.brent.brent(p["a"], p["b"], f, p["precisao"], p["iteracoes"]),
+    "halley": lambda p, f, df: metodos.halley.halley(p["x0"], p["expressao"], p["precisao"], p["iteracoes"]),
+    "householder": lambda p, f, df: metodos.householder.householder(p["x0"], p["expressao"], p["precisao"],
+                                                                    p["iteracoes"]),
+    "portfolio": lambda p, f, df: metodos.portfolio.portfolio(p["a"], p["b"], p["x0"], p["x1"], f, p["precisao"],
+                                                             p["iteracoes"], derivada=df).resultado,
+}
+
+USAM_DERIVADA = {"newton", "portfolio"}
+
+PADROES = {"metodo": "brent", "precisao": 1e-6, "iteracoes": 100}
+
+CAMPOS = ["linha", "id", "metodo", "status", "convergiu", "raiz", "iteracoes", "avaliacoes", "residuo", "erro"]
+
+
+def valor_json(valor):
+    """Valor pronto para json.dumps: NaN e infinito (que não são JSON válido) viram None."""
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def resolver_linha(texto: str, numero: int, simbolica: bool = False) -> Dict[str, object]:
+    """Resolve um problema em JSON; erros de leitura ou de campos vão para o campo erro."""
+    try:
+        problema = json.loads(texto)
+    except ValueError as e:
+        return {**dict.fromkeys(CAMPOS), "linha": numero, "convergiu": False, "erro": str(e)}
+    return {"linha": numero, **resolver_problema(problema, simbolica)}
+
+
+def resolver_problema(problema: Dict[str, object], simbolica: bool = False) -> Dict[str, object]:
+    """
+    Resolve um problema já lido (campos como no JSON de entrada), sem o campo linha.
+
+    A função é lida só pelo compilador restrito (avaliador.interpretar com
+    simbolica=False): o texto vem de fora e o sympify o executaria. Com
+    simbolica=True os textos recusados passam pelo SymPy.
+    """
+    saida: Dict[str, object] = {**dict.fromkeys(CAMPOS[1:]), "convergiu": False}
+    try:
+        if not isinstance(problema, dict):
+            raise ValueError("O problema deve ser um objeto JSON")
+        problema = {**PADROES, **problema}
+        saida["id"] = problema.get("id")
+        saida["metodo"] = metodo = problema["metodo"]
+        if metodo not in METODOS:
+            raise ValueError(f"Metodo desconhecido: {metodo}")
+        problema["expressao"] = expressao = avaliador.interpretar(problema["funcao"], simbolica)
+        f = avaliador.compilar(expressao)
+        df = avaliador.compilar_derivada(expressao) if metodo in USAM_DERIVADA else None
+        resultado = METODOS[metodo](problema, f, df)
+    except KeyError as e:
+        saida["erro"] = f"Campo obrigatorio ausente: {e.args[0]}"
+        return saida
+    except Exception as e:
+        saida["erro"] = str(e)
+        return saida
+
+    convergiu = resultado.convergiu
+    saida.update(status=resultado.status.name, convergiu=convergiu,
+                 raiz=float(resultado.raiz) if convergiu else None,
+                 iteracoes=resultado.iteracoes, avaliacoes=resultado.avaliacoes,
+                 residuo=resultado.residuo if convergiu else None)
+    return saida
+
+
+def resolver_bloco(linhas: List[str], inicio: int, simbolica: bool = False) -> str:
+    """Resolve um bloco de linhas e retorna as linhas de saída já serializadas."""
+    partes = []
+    for numero, texto in enumerate(linhas, inicio):
+        if texto.strip():
+            resultado = resolver_linha(texto, numero, simbolica)
+            partes.append(json.dumps({k: valor_json(v) for k, v in resultado.items()}) + "\n")
+    return "".join(partes)
+
+
+def _ler_bloco(entrada: IO[str], tamanho: int) -> List[str]:
+    return list(itertools.islice(entrada, tamanho))
+
+
+async def processar(entrada: IO[str], saida: IO[str], executor: concurrent.futures.Executor,
+                    bloco: int = 256, pendentes: int = 8, simbolica: bool = False) -> int:
+    """
+    Pipeline de leitura, solução e escrita; retorna o número de linhas lidas.
+
+    No máximo pendentes blocos ficam em andamento entre a leitura e a escrita.
+    """
+    loop = asyncio.get_running_loop()
+    fila: asyncio.Queue = asyncio.Queue(maxsize=pendentes)
+    # Leitura bloqueante em uma thread própria, para não parar o laço de eventos
+    leitor = concurrent.futures.ThreadPoolExecutor(1)
+
+    async def ler() -> int:
+        lidas = 0
+        while True:
+            linhas = await loop.run_in_executor(leitor, _ler_bloco, entrada, bloco)
+            if not linhas:
+                await fila.put(None)
+                return lidas
+            # put espera enquanto a fila está cheia: é a contrapressão
+            await fila.put(loop.run_in_executor(executor, resolver_bloco, linhas, lidas + 1, simbolica))
+            lidas += len(linhas)
+
+    async def escrever():
+        while True:
+            futuro = await fila.get()
+            if futuro is None:
+                return
+            saida.write(await futuro)
+            saida.flush()
+
+    try:
+        lidas, _ = await asyncio.gather(ler(), escrever())
+    finally:
+        leitor.shutdown(wait=False)
+    return lidas
+
+
+def main_fluxo(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Resolve problemas de zeros de funções lidos em JSON Lines.")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--bloco", type=int, default=256,
+                        help="Linhas por bloco enviado a cada processo (padrão: 256)")
+    parser.add_argument("--pendentes", type=int, default=0,
+                        help="Blocos em andamento antes de a leitura esperar (padrão: 2 por processo)")
+    parser.add_argument("--cache", default=os.environ.get("METODOS_CACHE"),
+                        help="Diretório do cache de expressões em disco (padrão: $METODOS_CACHE)")
+    parser.add_argument("--cache-tamanho", type=int, default=256,
+                        help="Expressões mantidas em memória por processo (padrão: 256)")
+    parser.add_argument("--simbolica", action="store_true",
+                        help="Aceita pelo SymPy as funções fora do compilador restrito; o sympify "
+                             "executa o texto, use só com entradas confiáveis")
+    args = parser.parse_args(argv)
+
+    pendentes = args.pendentes or 2 * max(1, args.processos)
+    if args.processos <= 1:
+        # Sem pool de processos: resolve em uma thread, fora do laço de eventos
+        avaliador.configurar_cache(args.cache_tamanho, args.cache)
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(args.processos, initializer=avaliador.configurar_cache,
+                                                          initargs=(args.cache_tamanho, args.cache))
+    with executor:
+        asyncio.run(processar(sys.stdin, sys.stdout, executor, args.bloco, pendentes, args.simbolica))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_fluxo())
@@ -0,0 +1,174 @@
+"""
+Módulo: Inversão em Disco (Arrays Mapeados em Memória)
+Descrição: Resolve f(x) = y_i para dezenas de milhões de valores y_i
+gravados em disco, como os tempos em que a concentração de bactérias
+atinge cada nível medido, sem carregar os arrays na memória.
+
+Os alvos são lidos de um arquivo .npy (ou binário bruto, com --tipo) mapeado
+em memória e resolvidos em blocos de tamanho fixo pelos métodos de intervalo
+em lote (metodos/lote.py), com a equação f(x) - y = 0 e y como parâmetro. As
+raízes são gravadas em um array de saída também mapeado em memória, bloco a
+bloco, de modo que a memória usada depende só do tamanho do bloco, qualquer
+que seja o tamanho da entrada. A função é compilada uma única vez para todos
+os blocos. Blocos de dezenas de milhares de alvos cabem no cache do
+processador junto com os arrays de trabalho do lote e resolvem mais alvos
+por segundo que blocos de milhões.
+
+Todos os alvos usam o mesmo intervalo [a, b]: para uma função monótona em
+[a, b], os alvos entre f(a) e f(b) têm exatamente uma raiz; os demais ficam
+com NaN na saída e status SEM_MUDANCA_SINAL.
+
+Saída:
+    Raízes em float64 (.npy, ou binário bruto se a extensão não for .npy),
+    com a forma dos alvos, e opcionalmente o código de status de cada alvo
+    (int8, --status). Ao final, o número de soluções por segundo.
+
+Uso:
+    python inversa.py <funcao> <alvos.npy> <raizes.npy> --a 0 --b 60
+                      [--metodo bisseccao|falsaPosicao] [--precisao 1e-6] [--iteracoes 100]
+                      [--bloco 32768] [--tipo float64] [--status status.npy]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import sympy as sp
+
+import metodos.lote
+from metodos import avaliador
+from metodos.resultado import Status
+
+logger = logging.getLogger(__name__)
+
+VETORIZADOS = {
+    "bisseccao": metodos.lote.bisseccao_lote,
+    "falsaPosicao": metodos.lote.falsaPosicao_lote,
+}
+
+x, y = sp.symbols('x y')
+
+
+def abrir_alvos(caminho: str, tipo: Optional[str] = None) -> np.ndarray:
+    """
+    Mapeia em memória, somente para leitura, o arquivo de alvos.
+
+    Arquivos .npy trazem o tipo e a forma no cabeçalho; qualquer outro
+    arquivo é lido como binário bruto unidimensional do tipo tipo
+    (padrão: float64).
+    """
+    if caminho.endswith(".npy"):
+        return np.load(caminho, mmap_mode="r")
+    return np.memmap(caminho, dtype=np.dtype(tipo or "float64"), mode="r")
+
+
+def criar_saida(caminho: str, forma, tipo) -> np.ndarray:
+    """Cria o arquivo de saída mapeado em memória (.npy, ou binário bruto)."""
+    if caminho.endswith(".npy"):
+        return np.lib.format.open_memmap(caminho, mode="w+", dtype=tipo, shape=forma)
+    return np.memmap(caminho, dtype=tipo, mode="w+", shape=forma)
+
+
+def inverter(func, alvos: np.ndarray, raizes: np.ndarray, a: float, b: float, precisao: float = 1e-6,
+             maxIter: int = 100, metodo: str = "bisseccao", bloco: int = 32768,
+             status: Optional[np.ndarray] = None) -> Dict[str, object]:
+    """
+    Resolve func(x) = alvos[i] em [a, b] para cada i, bloco a bloco.
+
+    Args:
+        func: Função de x (texto ou sp.Expr)
+        alvos: Array de alvos, tipicamente um np.memmap somente leitura
+        raizes: Array de saída (float64, mesma forma de alvos), tipicamente
+                um np.memmap; recebe NaN onde não houve convergência
+        a, b: Intervalo comum a todos os alvos
+        precisao: Tolerância em |f(x) - y| e na largura do intervalo
+        maxIter: Máximo de iterações por bloco
+        metodo: bisseccao ou falsaPosicao
+        bloco: Alvos resolvidos de cada vez (limita a memória usada)
+        status: Array int8 opcional para o código de status de cada alvo
+
+    Retorno:
+        Dicionário com alvos, convergidos, segundos, solucoes_por_segundo e
+        a contagem de cada status (pelo nome).
+    """
+    expressao = avaliador.expressao(func)
+    livres = expressao.free_symbols - {x}
+    if livres:
+        raise ValueError(f"A funcao deve depender apenas de x (encontrado: {', '.join(map(str, livres))})")
+    resolver = VETORIZADOS[metodo]
+    equacao = expressao - y
+
+    entrada = alvos.reshape(-1)
+    saida = raizes.reshape(-1)
+    codigos = status.reshape(-1) if status is not None else None
+    contagem = np.zeros(len(Status), dtype=np.int64)
+
+    inicio = time.perf_counter()
+    for k in range(0, entrada.size, bloco):
+        parte = slice(k, k + bloco)
+        r, _, s = resolver(a, b, equacao, precisao, maxIter, {y: entrada[parte]})
+        saida[parte] = r
+        if codigos is not None:
+            codigos[parte] = s
+        contagem += np.bincount(s, minlength=len(Status))[:len(Status)]
+        logger.debug("Bloco %d: %d alvos", k // bloco, r.size)
+    if isinstance(raizes, np.memmap):
+        raizes.flush()
+    if isinstance(status, np.memmap):
+        status.flush()
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "alvos": int(entrada.size),
+        "convergidos": int(contagem[Status.CONVERGIU]),
+        "segundos": segundos,
+        "solucoes_por_segundo": entrada.size / segundos if segundos > 0 else float("inf"),
+        **{codigo.name: int(contagem[codigo]) for codigo in Status if contagem[codigo]},
+    }
+
+
+def inverter_arquivo(func, entrada: str, saida: str, a: float, b: float, precisao: float = 1e-6,
+                     maxIter: int = 100, metodo: str = "bisseccao", bloco: int = 32768,
+                     tipo: Optional[str] = None, arquivo_status: Optional[str] = None) -> Dict[str, object]:
+    """Mapeia os arquivos de alvos, raízes e status e chama inverter."""
+    alvos = abrir_alvos(entrada, tipo)
+    raizes = criar_saida(saida, alvos.shape, np.float64)
+    status = criar_saida(arquivo_status, alvos.shape, np.int8) if arquivo_status else None
+    return inverter(func, alvos, raizes, a, b, precisao, maxIter, metodo, bloco, status)
+
+
+def main_inversa(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Resolve f(x) = y para um arquivo de alvos y em disco.")
+    parser.add_argument("funcao", help="Função de x, como em input.txt")
+    parser.add_argument("entrada", help="Alvos: arquivo .npy ou binário bruto (veja --tipo)")
+    parser.add_argument("saida", help="Raízes: arquivo .npy ou binário bruto float64")
+    parser.add_argument("--a", type=float, required=True, help="Início do intervalo")
+    parser.add_argument("--b", type=float, required=True, help="Fim do intervalo")
+    parser.add_argument("--metodo", choices=sorted(VETORIZADOS), default="bisseccao")
+    parser.add_argument("--precisao", type=float, default=1e-6)
+    parser.add_argument("--iteracoes", type=int, default=100)
+    parser.add_argument("--bloco", type=int, default=32768, help="Alvos por bloco (padrão: 32768)")
+    parser.add_argument("--tipo", help="Tipo dos alvos em binário bruto (padrão: float64)")
+    parser.add_argument("--status", help="Grava o código de status de cada alvo (int8)")
+    args = parser.parse_args(argv)
+
+    try:
+        medidas = inverter_arquivo(args.funcao, args.entrada, args.saida, args.a, args.b, args.precisao,
+                                   args.iteracoes, args.metodo, args.bloco, args.tipo, args.status)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"[ERRO] {e}", file=sys.stderr)
+        return 1
+
+    print(f"{medidas['alvos']} alvos, {medidas['convergidos']} convergidos em {medidas['segundos']:.2f} s: "
+          f"{medidas['solucoes_por_segundo']:.0f} solucoes/s")
+    for codigo in Status:
+        if codigo != Status.CONVERGIU and medidas.get(codigo.name):
+            print(f"  {codigo.name}: {medidas[codigo.name]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_inversa())
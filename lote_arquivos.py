@@ -0,0 +1,153 @@
+"""
+Módulo: Execução em Lote de Arquivos de Problemas
+Descrição: Resolve, sem interação, todos os arquivos de problema (no formato
+de 7 linhas de input.txt) de um diretório, distribuindo-os entre vários
+processos e gravando os resultados à medida que ficam prontos.
+
+Cada processo trabalhador mantém os caches do módulo avaliador durante toda
+a execução, de modo que arquivos com a mesma função compilam a expressão e a
+derivada uma única vez por processo. Com --cache, esse trabalho simbólico
+fica também em disco, compartilhado entre os processos e reaproveitado nas
+execuções seguintes. Os arquivos são enviados aos trabalhadores em blocos
+(chunks) para amortizar o custo de comunicação.
+
+Como no modo em fluxo, a função de cada arquivo é lida só pelo compilador
+restrito (metodos.expressao); --simbolica aceita os demais textos pelo
+SymPy, que os executa como código Python (só para arquivos confiáveis).
+
+Saída:
+    Uma linha por arquivo e método, em JSON Lines (padrão) ou CSV, com os
+    campos: arquivo, funcao, metodo, status, convergiu, raiz, iteracoes,
+    avaliacoes, residuo, erro.
+
+Uso:
+    python lote_arquivos.py <diretorio> [--padrao "*.txt"] [--formato jsonl|csv]
+                            [--saida resultados.jsonl] [--processos N] [--bloco K]
+                            [--cache DIRETORIO] [--cache-tamanho N] [--simbolica]
+"""
+
+import argparse
+import csv
+import functools
+import glob
+import json
+import multiprocessing
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import fluxo
+import main
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.secante
+import metodos.newton
+import metodos.brent
+from metodos import avaliador
+
+CAMPOS = ["arquivo", "funcao", "metodo", "status", "convergiu", "raiz", "iteracoes", "avaliacoes", "residuo", "erro"]
+
+
+def resolver_arquivo(nome_arquivo: str, simbolica: bool = False) -> List[Dict[str, object]]:
+    """
+    Resolve um arquivo de problema por todos os métodos.
+
+    Retorna uma linha de resultado por método, ou uma única linha com o campo
+    erro preenchido quando o arquivo não pode ser lido. A função é lida só
+    pelo compilador restrito, como no modo em fluxo, a menos que simbolica
+    seja verdadeiro.
+    """
+    try:
+        func, a, b, x0, x1, precisao, iteracoes = main.ler_problema(nome_arquivo, simbolica)
+        f = avaliador.compilar(func)
+        df = avaliador.compilar_derivada(func)
+    except Exception as e:
+        return [{**dict.fromkeys(CAMPOS), "arquivo": nome_arquivo, "convergiu": False, "erro": str(e)}]
+
+    resultados = [
+        ("bisseccao", metodos.bisseccao.bisseccao(a, b, iteracoes, f, precisao)),
+        ("falsaPosicao", metodos.falsaPosicao.falsaPosicao(a, b, f, precisao, iteracoes)),
+        ("secante", metodos.secante.secante(x0, x1, f, precisao, iteracoes)),
+        ("newton", metodos.newton.newton(x0, f, df, precisao, iteracoes)),
+        ("brent", metodos.brent.brent(a, b, f, precisao, iteracoes)),
+    ]
+
+    linhas = []
+    for metodo, resultado in resultados:
+        convergiu = resultado.convergiu
+        linhas.append({
+            "arquivo": nome_arquivo,
+            "funcao": str(func),
+            "metodo": metodo,
+            "status": resultado.status.name,
+            "convergiu": convergiu,
+            "raiz": float(resultado.raiz) if convergiu else None,
+            "iteracoes": resultado.iteracoes,
+            "avaliacoes": resultado.avaliacoes,
+            "residuo": resultado.residuo if convergiu else None,
+            "erro": None,
+        })
+    return linhas
+
+
+def executar(arquivos: List[str], processos: int, bloco: int, cache: Optional[str] = None,
+             tamanho_cache: int = 256, simbolica: bool = False) -> Iterable[List[Dict[str, object]]]:
+    """Resolve os arquivos em um pool de processos, na ordem de entrada."""
+    resolver = functools.partial(resolver_arquivo, simbolica=simbolica)
+    if processos <= 1:
+        avaliador.configurar_cache(tamanho_cache, cache)
+        yield from map(resolver, arquivos)
+        return
+
+    with multiprocessing.Pool(processos, initializer=avaliador.configurar_cache,
+                              initargs=(tamanho_cache, cache)) as pool:
+        yield from pool.imap(resolver, arquivos, chunksize=bloco)
+
+
+def main_lote(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve em lote arquivos de problemas de zeros de funções.")
+    parser.add_argument("diretorio", help="Diretório com os arquivos de problema")
+    parser.add_argument("--padrao", default="*.txt", help="Padrão glob dos arquivos (padrão: *.txt)")
+    parser.add_argument("--formato", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--saida", help="Arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--bloco", type=int, default=0,
+                        help="Arquivos por bloco enviado a cada processo (padrão: automático)")
+    parser.add_argument("--cache", default=os.environ.get("METODOS_CACHE"),
+                        help="Diretório do cache de expressões em disco (padrão: $METODOS_CACHE)")
+    parser.add_argument("--cache-tamanho", type=int, default=256,
+                        help="Expressões mantidas em memória por processo (padrão: 256)")
+    parser.add_argument("--simbolica", action="store_true",
+                        help="Aceita pelo SymPy as funções fora do compilador restrito; o sympify "
+                             "executa o texto, use só com arquivos confiáveis")
+    args = parser.parse_args(argv)
+
+    arquivos = sorted(glob.glob(os.path.join(args.diretorio, args.padrao)))
+    if not arquivos:
+        print(f"[ERRO] Nenhum arquivo '{args.padrao}' em '{args.diretorio}'", file=sys.stderr)
+        return 1
+
+    # Blocos grandes o bastante para amortizar a comunicação, mas com
+    # vários blocos por processo para balancear a carga
+    bloco = args.bloco or max(1, len(arquivos) // (args.processos * 4))
+
+    saida = open(args.saida, "w", newline="") if args.saida else sys.stdout
+    try:
+        if args.formato == "csv":
+            escritor = csv.DictWriter(saida, fieldnames=CAMPOS)
+            escritor.writeheader()
+        for linhas in executar(arquivos, args.processos, bloco, args.cache, args.cache_tamanho, args.simbolica):
+            for linha in linhas:
+                if args.formato == "csv":
+                    escritor.writerow(linha)
+                else:
+                    saida.write(json.dumps({k: fluxo.valor_json(v) for k, v in linha.items()}) + "\n")
+            saida.flush()
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_lote())
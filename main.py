@@ -1,36 +1,68 @@
-import sympy as sp
 import metodos.bisseccao
 import metodos.falsaPosicao
 import metodos.secante
 import metodos.newton
+import metodos.polinomio
+import metodos.refinamento
 import testarMetodos
+from metodos import avaliador
 import os
 
-x = sp.Symbol('x')
+def ler_problema(nome_arquivo, simbolica=True):
+    """
+    Lê um arquivo de 7 linhas e retorna (func, a, b, x0, x1, precisao, iteracoes).
+
+    Diferente de ler_arquivo, não imprime nada: erros de leitura ou de formato
+    são propagados (OSError, ValueError, SympifyError) para quem chamou. Com
+    simbolica=False a função é lida só pelo compilador restrito (arquivos de
+    origem não confiável: o sympify executa o texto).
+    """
+    with open(nome_arquivo, 'r') as file:
+        linhas = [linha.strip() for linha in file if linha.strip()]
+
+    if len(linhas) < 7:
+        raise ValueError("O arquivo deve conter 7 linhas de parametros")
+
+    func = avaliador.interpretar(linhas[0], simbolica)
+    a = float(linhas[1])
+    b = float(linhas[2])
+    x0 = float(linhas[3])
+    x1 = float(linhas[4])
+    precisao = float(linhas[5])
+    iteracoes = int(linhas[6])
+
+    return func, a, b, x0, x1, precisao, iteracoes
+
+def ler_sistema(nome_arquivo):
+    """
+    Lê um arquivo de sistema e retorna (sistema, x0, precisao, iteracoes).
+
+    O formato estende o de ler_problema: a primeira linha é o número n de
+    equações, seguido das n equações (cada uma igual a zero), das incógnitas
+    separadas por vírgula, da estimativa inicial (um valor por incógnita, ou
+    um único valor para todas), da precisão e do máximo de iterações.
+    """
+    from metodos.sistemas import Sistema
+
+    with open(nome_arquivo, 'r') as file:
+        linhas = [linha.strip() for linha in file if linha.strip()]
+
+    n = int(linhas[0])
+    if len(linhas) < n + 5:
+        raise ValueError(f"O arquivo deve conter {n + 5} linhas de parametros")
+
+    variaveis = [v.strip() for v in linhas[n + 1].split(',')]
+    sistema = Sistema(linhas[1:n + 1], variaveis)
+    x0 = [float(v) for v in linhas[n + 2].split(',')]
+    precisao = float(linhas[n + 3])
+    iteracoes = int(linhas[n + 4])
+
+    return sistema, x0 if len(x0) > 1 else x0[0], precisao, iteracoes
 
 def ler_arquivo(nome_arquivo):
   
     try:
-        with open(nome_arquivo, 'r') as file:
-            linhas = file.readlines()
-            
-            linhas = [linha.strip() for linha in linhas if linha.strip()]
-            
-            if len(linhas) < 7:
-                print(f"[ERRO] O arquivo deve conter 7 linhas de parametros")
-                return None
-            
-            func_str = linhas[0]
-            func = sp.sympify(func_str)
-            
-            a = float(linhas[1])
-            b = float(linhas[2])
-            x0 = float(linhas[3])
-            x1 = float(linhas[4])
-            precisao = float(linhas[5])
-            iteracoes = int(linhas[6])
-            
-            return func, a, b, x0, x1, precisao, iteracoes
+        return ler_problema(nome_arquivo)
             
     except FileNotFoundError:
         print(f"[ERRO] Arquivo '{nome_arquivo}' nao encontrado")
@@ -47,10 +79,10 @@ def entrada_manual():
     func_str = input("Digite a função em x: ")
     
     try:
-        func = sp.sympify(func_str)
+        func = avaliador.interpretar(func_str)
         print(f"[OK] Funcao: {func}")
         
-        derivada = sp.diff(func, x)
+        derivada = avaliador.derivada(func)
         print(f"[OK] Derivada: {derivada}")
         
     except Exception as e:
@@ -71,7 +103,11 @@ def entrada_manual():
         print("[ERRO] Digite valores numericos validos")
         return None
 
+# Último problema simulado, usado pelas análises adicionais do menu
+_ultimo_problema = None
+
 def executar_simulacao(func, a, b, x0, x1, precisao, iteracoes):
+    global _ultimo_problema
 
     print("\n" + "=" * 100)
     print("                        SIMULACAO DE METODOS NUMERICOS - ZEROS DE FUNCOES")
@@ -83,7 +119,48 @@ def executar_simulacao(func, a, b, x0, x1, precisao, iteracoes):
     print(f"   - Precisao: {precisao}")
     print(f"   - Maximo de iteracoes: {iteracoes}")
     
-    testarMetodos.tests(a, b, x0, x1, func, precisao, iteracoes)
+    # Repetir o mesmo problema com precisão menor continua dos resultados
+    # guardados em vez de recomeçar
+    testarMetodos.tests(a, b, x0, x1, func, precisao, iteracoes, armazem=metodos.refinamento.armazem())
+
+    # Polinômios seguem também pelo caminho rápido (Horner, multiplicidade e
+    # deflação), que acha a raiz dupla de input2.txt e todas as raízes reais
+    coefs = metodos.polinomio.coeficientes(func)
+    if coefs is not None:
+        testarMetodos.tests_polinomio(func, x0, precisao, iteracoes, coefs=coefs)
+
+    _ultimo_problema = (func, a, b, x0, x1, precisao, iteracoes)
+
+def menu_analises():
+
+    if _ultimo_problema is None:
+        print("\n[ERRO] Execute uma simulacao antes das analises adicionais")
+        return
+    func, a, b, x0, x1, precisao, iteracoes = _ultimo_problema
+
+    print("\n" + "=" * 100)
+    print("                           ANALISES ADICIONAIS")
+    print("=" * 100)
+    print(f"\nProblema: f(x) = {func}, intervalo [{a}, {b}], x0 = {x0}, x1 = {x1}")
+    print("\n1. Portfolio (metodos intercalados, vence o primeiro que converge)")
+    print("2. Precisao adaptativa (float, mpmath se a precisao estiver fora do alcance do float)")
+    print("3. Halley e Householder (f, f' e f'' fundidas)")
+    print("4. Proxy de Chebyshev (todas as raizes em [a,b])")
+    print("5. Newton e Secante em lote (malha de estimativas em [a,b])")
+
+    print("\n" + "-" * 100)
+    opcao = input("\n=> Digite o numero da analise para executar ou 0 para voltar: ").strip()
+
+    if opcao == '1':
+        testarMetodos.tests_portfolio(a, b, x0, x1, func, precisao, iteracoes)
+    elif opcao == '2':
+        testarMetodos.tests_precisao(a, b, x0, x1, func, precisao, iteracoes)
+    elif opcao == '3':
+        testarMetodos.tests_ordem_alta(x0, func, precisao, iteracoes)
+    elif opcao == '4':
+        testarMetodos.tests_chebyshev(a, b, func)
+    elif opcao == '5':
+        testarMetodos.tests_lote(a, b, x0, x1, func, precisao, iteracoes)
 
 def menu_principal():
     
@@ -97,6 +174,8 @@ def menu_principal():
         print("   3. Ler dados de arquivo (input2.txt)")
         print("   4. Ler dados de arquivo personalizado")
         print("   5. Exemplos de problemas de engenharia")
+        print("   6. Sistema de equacoes nao lineares (sistema_exemplo.txt ou outro arquivo)")
+        print("   7. Analises adicionais do ultimo problema")
         print("   0. Sair")
         print("-" * 100)
         
@@ -133,6 +212,18 @@ def menu_principal():
                     
             elif opcao == '5':
                 menu_exemplos()
+
+            elif opcao == '6':
+                nome_arquivo = input("\nDigite o nome do arquivo (ENTER para sistema_exemplo.txt): ").strip()
+                nome_arquivo = nome_arquivo or 'sistema_exemplo.txt'
+                print(f"Lendo sistema de '{nome_arquivo}'...")
+                try:
+                    testarMetodos.tests_sistema(*ler_sistema(nome_arquivo))
+                except FileNotFoundError:
+                    print(f"[ERRO] Arquivo '{nome_arquivo}' nao encontrado")
+
+            elif opcao == '7':
+                menu_analises()
                 
             else:
                 print("\n[ERRO] Opcao invalida! Por favor, escolha uma opcao valida.")
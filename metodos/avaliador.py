@@ -0,0 +1,599 @@
+"""
+Módulo: Avaliação Numérica Compilada
+Descrição: Converte expressões simbólicas do SymPy em funções Python de ponto
+flutuante, compiladas uma única vez e reaproveitadas por todos os métodos.
+
+Substituir x por um valor com func.subs a cada iteração obriga o SymPy a
+percorrer a árvore da expressão simbolicamente, o que custa milissegundos por
+chamada. Aqui a expressão (e sua derivada) é transformada em uma função que
+opera diretamente sobre floats usando o módulo math, com cache por expressão.
+
+Vantagens:
+    - Cada avaliação custa microssegundos em vez de milissegundos
+    - A compilação acontece uma única vez por expressão
+    - Erros de domínio (log de negativo, overflow) viram NaN em vez de exceção
+
+Desvantagens:
+    - Funções sem equivalente no módulo math caem no caminho lento (subs)
+
+Cache de expressões:
+    Interpretar o texto (sympify), derivar (diff) e gerar o código (lambdify)
+    de uma expressão grande custa mais que a própria busca da raiz. O
+    CacheExpressoes guarda, para cada expressão, a forma simbólica, as
+    derivadas e as funções compiladas, em memória com descarte LRU (a menos
+    usada recentemente sai primeiro) e, opcionalmente, em um diretório no
+    disco. Com o disco, execuções em lote repetidas e novas execuções do
+    programa não refazem nenhum trabalho simbólico: a expressão e as
+    derivadas são lidas com pickle e o código gerado é apenas recompilado.
+
+    O diretório é escolhido com configurar_cache ou pela variável de
+    ambiente METODOS_CACHE.
+
+Partida rápida:
+    Textos aceitos pelo compilador restrito (metodos.expressao) são
+    compilados sem o SymPy, e a derivada vem da diferenciação automática.
+    Este módulo só importa o SymPy quando recebe uma expressão do SymPy ou
+    um texto fora do subconjunto do compilador restrito.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from metodos.expressao import Expressao, ExpressaoInvalida, interpretar as _interpretar
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+FuncaoNumerica = Callable[[float], float]
+
+_parametricas: Dict[Tuple[sp.Expr, Tuple[sp.Symbol, ...]], Callable] = {}
+_vetoriais: Dict[Tuple[sp.Expr, Tuple[sp.Symbol, ...]], Callable] = {}
+_precisas: Dict[sp.Expr, Tuple[Callable, Callable]] = {}
+
+
+def _sympy():
+    """Importa o SymPy na primeira vez que um recurso simbólico é usado."""
+    import sympy
+    return sympy
+
+
+def _simbolica(func) -> bool:
+    """func é um objeto do SymPy? Se o SymPy nem foi importado, não pode ser."""
+    # Enquanto outra thread importa o SymPy, o módulo já está em sys.modules
+    # mas ainda sem Basic
+    basica = getattr(sys.modules.get('sympy'), 'Basic', None)
+    return basica is not None and isinstance(func, basica)
+
+
+class Entrada:
+    """Trabalho simbólico e compilado de uma expressão em x."""
+
+    __slots__ = ("chave", "expressao", "_derivadas", "_serializadas", "fontes", "funcoes")
+
+    def __init__(self, chave: str, expressao: sp.Expr):
+        self.chave = chave
+        self.expressao = expressao
+        self._derivadas: List[sp.Expr] = []
+        # Derivadas lidas do disco ficam serializadas até serem usadas: quem
+        # só precisa das funções compiladas não paga a reconstrução
+        self._serializadas: Optional[bytes] = None
+        # Código gerado pelo lambdify, por ordem de derivada (0 = a própria
+        # função; -n = a função e as derivadas até n, juntas)
+        self.fontes: Dict[int, str] = {}
+        self.funcoes: Dict[int, Callable] = {}
+
+    @property
+    def derivadas(self) -> List[sp.Expr]:
+        """derivadas[k] é a derivada de ordem k + 1."""
+        if self._serializadas is not None:
+            import pickle
+
+            self._derivadas = pickle.loads(self._serializadas)
+            self._serializadas = None
+        return self._derivadas
+
+
+class CacheExpressoes:
+    """
+    Cache LRU de expressões, derivadas e funções compiladas, com cópia
+    opcional em disco.
+
+    A chave é o texto da expressão sem espaços (para entradas em texto) ou
+    sp.srepr da expressão (para expressões já interpretadas), de modo que
+    "x**2 - 4" e "x**2-4" compartilham a mesma entrada. Uma trava permite
+    compartilhar o cache entre as threads de um servidor.
+
+    Args:
+        capacidade: Número máximo de expressões mantidas em memória
+        diretorio: Diretório do armazenamento em disco (None desativa)
+    """
+
+    VERSAO = 1
+
+    def __init__(self, capacidade: int = 256, diretorio: Optional[str] = None):
+        self.capacidade = capacidade
+        self.diretorio = diretorio
+        self._entradas: "OrderedDict[str, Entrada]" = OrderedDict()
+        # Atalho das expressões já vistas para sua chave, sem calcular srepr
+        self._chaves: Dict[sp.Expr, str] = {}
+        self._trava = threading.RLock()
+        self.acertos = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def obter(self, func: Union[sp.Expr, str, Expressao]) -> Entrada:
+        """Entrada de func, lida da memória, do disco ou criada agora."""
+        with self._trava:
+            return self._obter(func)
+
+    def _obter(self, func: Union[sp.Expr, str, Expressao]) -> Entrada:
+        if isinstance(func, Expressao):
+            func = func.texto
+        simbolica = _simbolica(func)
+        if simbolica:
+            chave = self._chaves.get(func)
+            if chave is None:
+                chave = _sympy().srepr(func)
+        else:
+            chave = "".join(str(func).split())
+
+        entrada = self._entradas.get(chave)
+        if entrada is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return entrada
+
+        entrada = self._ler(chave)
+        if entrada is not None:
+            self.acertos_disco += 1
+        else:
+            self.faltas += 1
+            entrada = Entrada(chave, func if simbolica else _sympy().sympify(func))
+            self._gravar(entrada)
+
+        self._entradas[chave] = entrada
+        self._chaves[entrada.expressao] = chave
+        if len(self._entradas) > self.capacidade:
+            _, antiga = self._entradas.popitem(last=False)
+            if self._chaves.get(antiga.expressao) == antiga.chave:
+                del self._chaves[antiga.expressao]
+        return entrada
+
+    def expressao(self, func: Union[sp.Expr, str]) -> sp.Expr:
+        return self.obter(func).expressao
+
+    def derivada(self, func: Union[sp.Expr, str], ordem: int = 1) -> sp.Expr:
+        """Derivada de ordem ordem (1 ou mais) de func em relação a x."""
+        with self._trava:
+            entrada = self.obter(func)
+            if len(entrada.derivadas) < ordem:
+                atual = entrada.derivadas[-1] if entrada.derivadas else entrada.expressao
+                sp = _sympy()
+                while len(entrada.derivadas) < ordem:
+                    atual = sp.diff(atual, sp.Symbol('x'))
+                    entrada.derivadas.append(atual)
+                self._gravar(entrada)
+            return entrada.derivadas[ordem - 1]
+
+    def compilar(self, func: Union[sp.Expr, str], ordem: int = 0) -> FuncaoNumerica:
+        """Função compilada de func (ordem 0) ou de sua derivada de ordem ordem."""
+        with self._trava:
+            entrada = self.obter(func)
+            f = entrada.funcoes.get(ordem)
+            if f is None:
+                def expr():
+                    return entrada.expressao if ordem == 0 else self.derivada(func, ordem)
+
+                fonte = entrada.fontes.get(ordem)
+                bruta = _carregar_fonte(fonte) if fonte is not None else None
+                if bruta is None:
+                    bruta, fonte = _lambdify(expr())
+                    if fonte is not None:
+                        entrada.fontes[ordem] = fonte
+                        self._gravar(entrada)
+                f = _envolver(expr, (), bruta)
+                entrada.funcoes[ordem] = f
+            return f
+
+    def compilar_derivadas(self, func: Union[sp.Expr, str], ordem: int = 2) -> Callable[[float], Tuple[float, ...]]:
+        """
+        Função que retorna (f, f', ..., f^(ordem)) em x, compiladas juntas.
+
+        As subexpressões comuns às derivadas são extraídas (lambdify com
+        cse=True) e calculadas uma única vez por chamada. O código fica em
+        fontes[-ordem], ao lado das funções de cada ordem.
+        """
+        with self._trava:
+            entrada = self.obter(func)
+            f = entrada.funcoes.get(-ordem)
+            if f is None:
+                def exprs():
+                    return (entrada.expressao, *(self.derivada(func, k) for k in range(1, ordem + 1)))
+
+                fonte = entrada.fontes.get(-ordem)
+                bruta = _carregar_fonte(fonte) if fonte is not None else None
+                if bruta is None:
+                    bruta, fonte = _lambdify(exprs(), cse=True)
+                    if fonte is not None:
+                        entrada.fontes[-ordem] = fonte
+                        self._gravar(entrada)
+                f = _envolver_derivadas(exprs, ordem, bruta)
+                entrada.funcoes[-ordem] = f
+            return f
+
+    def limpar(self, disco: bool = False):
+        """Esvazia a memória e, se disco=True, também o diretório."""
+        with self._trava:
+            self._entradas.clear()
+            self._chaves.clear()
+        if disco and self.diretorio:
+            for nome in os.listdir(self.diretorio):
+                if nome.endswith(".pkl"):
+                    os.remove(os.path.join(self.diretorio, nome))
+
+    def estatisticas(self) -> Dict[str, int]:
+        return {"entradas": len(self._entradas), "acertos": self.acertos,
+                "acertos_disco": self.acertos_disco, "faltas": self.faltas}
+
+    def _arquivo(self, chave: str) -> str:
+        import hashlib
+
+        return os.path.join(self.diretorio, hashlib.sha256(chave.encode()).hexdigest() + ".pkl")
+
+    def _ler(self, chave: str) -> Optional[Entrada]:
+        if not self.diretorio:
+            return None
+        import pickle
+
+        try:
+            with open(self._arquivo(chave), "rb") as arquivo:
+                dados = pickle.load(arquivo)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        # Arquivos de outra versão do formato ou do SymPy são ignorados
+        if dados.get("versao") != (self.VERSAO, _sympy().__version__) or dados.get("chave") != chave:
+            return None
+        entrada = Entrada(chave, dados["expressao"])
+        entrada._serializadas = dados["derivadas"]
+        entrada.fontes = dados["fontes"]
+        return entrada
+
+    def _gravar(self, entrada: Entrada):
+        if not self.diretorio:
+            return
+        import pickle
+        import tempfile
+
+        dados = {"versao": (self.VERSAO, _sympy().__version__), "chave": entrada.chave,
+                 "expressao": entrada.expressao,
+                 "derivadas": entrada._serializadas or pickle.dumps(entrada._derivadas, pickle.HIGHEST_PROTOCOL),
+                 "fontes": entrada.fontes}
+        # Grava em arquivo temporário e renomeia: vários processos podem
+        # escrever a mesma entrada ao mesmo tempo sem corromper o arquivo
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(descritor, "wb") as arquivo:
+                pickle.dump(dados, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, self._arquivo(entrada.chave))
+        except Exception:
+            os.remove(temporario)
+            raise
+
+
+_cache = CacheExpressoes(diretorio=os.environ.get("METODOS_CACHE") or None)
+
+
+def configurar_cache(capacidade: int = 256, diretorio: Optional[str] = None) -> CacheExpressoes:
+    """Substitui o cache de expressões usado pelo módulo e o retorna."""
+    global _cache
+    _cache = CacheExpressoes(capacidade, diretorio)
+    return _cache
+
+
+def cache() -> CacheExpressoes:
+    """Cache de expressões em uso."""
+    return _cache
+
+
+def expressao(func: Union[sp.Expr, str, Expressao]) -> sp.Expr:
+    """Interpreta o texto da função (sympify), com cache."""
+    return _cache.expressao(func)
+
+
+def interpretar(texto: str, simbolica: bool = True) -> Union[Expressao, sp.Expr]:
+    """
+    Interpreta o texto da função pelo compilador restrito, sem importar o
+    SymPy; textos fora do subconjunto aceito passam pelo sympify.
+
+    O sympify executa o texto como código Python: para textos que vêm de
+    fora (arquivos, JSON, HTTP), simbolica=False recusa o que o compilador
+    restrito não aceita, com ExpressaoInvalida.
+    """
+    if not isinstance(texto, str):
+        raise ExpressaoInvalida(f"A funcao deve ser um texto, nao {type(texto).__name__}")
+    try:
+        return _interpretar(texto)
+    except ExpressaoInvalida:
+        if not simbolica:
+            raise
+        return _cache.expressao(texto)
+
+
+def _restrita(func) -> Optional[Expressao]:
+    if isinstance(func, Expressao):
+        return func
+    if isinstance(func, str):
+        try:
+            return _interpretar(func)
+        except ExpressaoInvalida:
+            return None
+    return None
+
+
+def compilar(func: Union[sp.Expr, str, Expressao, FuncaoNumerica]) -> FuncaoNumerica:
+    """
+    Retorna uma função float -> float equivalente à expressão em x.
+
+    Se func já for uma função Python (por exemplo, uma função compilada
+    anteriormente), ela é devolvida sem alterações.
+    """
+    restrita = _restrita(func)
+    if restrita is not None:
+        return restrita.f
+    if not isinstance(func, str) and not _simbolica(func) and callable(func):
+        return func
+    return _cache.compilar(func)
+
+
+def derivada(func: Union[sp.Expr, str, Expressao], ordem: int = 1) -> sp.Expr:
+    """Retorna a derivada simbólica de func em relação a x, com cache."""
+    return _cache.derivada(func, ordem)
+
+
+def compilar_derivada(func: Union[sp.Expr, str, Expressao], ordem: int = 1) -> FuncaoNumerica:
+    """
+    Compila a derivada de func em relação a x.
+
+    Para textos aceitos pelo compilador restrito, a primeira derivada vem da
+    diferenciação automática, sem o SymPy.
+    """
+    restrita = _restrita(func) if ordem == 1 else None
+    if restrita is not None:
+        return restrita.df
+    return _cache.compilar(func, ordem)
+
+
+def compilar_derivadas(func: Union[sp.Expr, str, Expressao], ordem: int = 2) -> Callable[[float], Tuple[float, ...]]:
+    """
+    Compila f e suas derivadas até ordem em uma única função x -> (f, f', ...).
+
+    Usada pelos métodos de ordem alta (Halley, Householder), que precisam
+    de todos os valores no mesmo ponto: termos comuns, como exp(-0.5*x) no
+    problema do deslocamento, são calculados uma vez em vez de uma vez por
+    derivada. Textos do compilador restrito usam a diferenciação automática
+    de ordem alta, sem o SymPy. Se func já for uma função Python (uma
+    função compilada antes), ela é devolvida sem alterações.
+    """
+    restrita = _restrita(func)
+    if restrita is not None:
+        return restrita.derivadas(ordem)
+    if not isinstance(func, str) and not _simbolica(func) and callable(func):
+        return func
+    return _cache.compilar_derivadas(func, ordem)
+
+
+def limpar_cache():
+    """Descarta todas as expressões compiladas e derivadas em memória."""
+    _cache.limpar()
+    _interpretar.cache_clear()
+    _parametricas.clear()
+    _vetoriais.clear()
+    _precisas.clear()
+
+
+def compilar_parametrico(func: sp.Expr, simbolos: Sequence[sp.Symbol]) -> Callable[..., float]:
+    """
+    Compila func como função de x e dos símbolos extras, nessa ordem.
+
+    Usado quando a expressão tem parâmetros livres (por exemplo k e w no
+    problema do deslocamento): f(x, k, w).
+    """
+    if not _simbolica(func):
+        func = _sympy().sympify(func)
+
+    chave = (func, tuple(simbolos))
+    f = _parametricas.get(chave)
+    if f is None:
+        f = _gerar(func, tuple(simbolos))
+        _parametricas[chave] = f
+    return f
+
+
+# Nomes disponíveis para o código gerado pelo lambdify com modules='math'
+_NOMES_MATH = {**vars(math), 'ceiling': math.ceil, 'E': math.e, 'ln': math.log}
+
+
+def _lambdify(func: sp.Expr, simbolos: Tuple[sp.Symbol, ...] = (),
+              cse: bool = False) -> Tuple[Optional[Callable], Optional[str]]:
+    """Gera a função de floats e seu código-fonte (None quando não há como gerar)."""
+    sp = _sympy()
+    try:
+        bruta = sp.lambdify((sp.Symbol('x'), *simbolos), func, modules='math', cse=cse)
+    except Exception:
+        return None, None
+    import inspect
+
+    try:
+        return bruta, inspect.getsource(bruta)
+    except (OSError, TypeError):
+        return bruta, None
+
+
+def _carregar_fonte(fonte: str) -> Optional[Callable]:
+    """Recompila o código gerado pelo lambdify, sem passar pelo SymPy."""
+    nomes = dict(_NOMES_MATH)
+    try:
+        exec(compile(fonte, "<cache>", "exec"), nomes)
+    except SyntaxError:
+        return None
+    return nomes.get("_lambdifygenerated")
+
+
+def _gerar(func: sp.Expr, simbolos: Tuple[sp.Symbol, ...] = ()) -> Callable[..., float]:
+    return _envolver(lambda: func, simbolos, _lambdify(func, simbolos)[0])
+
+
+def _envolver(expressao: Callable[[], sp.Expr], simbolos: Tuple[sp.Symbol, ...],
+              bruta: Optional[Callable]) -> Callable[..., float]:
+    """Envolve a função gerada; expressao() só é chamada no caminho lento."""
+    def lenta(v, *parametros):
+        return expressao().subs(dict(zip((_sympy().Symbol('x'), *simbolos), (v, *parametros))))
+
+    if bruta is None:
+        bruta = lenta
+
+    def avaliar(v: float, *parametros: float) -> float:
+        try:
+            return float(bruta(v, *parametros))
+        except (ArithmeticError, ValueError, TypeError):
+            return math.nan
+        except NameError:
+            # Função sem equivalente em math: avalia pelo SymPy
+            try:
+                return float(lenta(v, *parametros))
+            except (ArithmeticError, ValueError, TypeError):
+                return math.nan
+
+    return avaliar
+
+
+def _envolver_derivadas(expressoes: Callable[[], Tuple[sp.Expr, ...]], ordem: int,
+                        bruta: Optional[Callable]) -> Callable[[float], Tuple[float, ...]]:
+    """Como _envolver, para a função que retorna f e as derivadas juntas."""
+    invalido = (math.nan,) * (ordem + 1)
+
+    def lenta(v):
+        x = _sympy().Symbol('x')
+        return [expr.subs(x, v) for expr in expressoes()]
+
+    if bruta is None:
+        bruta = lenta
+
+    def avaliar(v: float) -> Tuple[float, ...]:
+        try:
+            return tuple(map(float, bruta(v)))
+        except (ArithmeticError, ValueError, TypeError):
+            return invalido
+        except NameError:
+            try:
+                return tuple(map(float, lenta(v)))
+            except (ArithmeticError, ValueError, TypeError):
+                return invalido
+
+    return avaliar
+
+
+def compilar_vetorial(func: Union[sp.Expr, str, Expressao, Callable], simbolos: Sequence[sp.Symbol] = ()) -> Callable:
+    """
+    Compila func para avaliação vetorizada com NumPy.
+
+    A função retornada recebe um array de valores de x seguido de um array
+    para cada símbolo em simbolos (todos com a mesma forma) e sempre devolve
+    um array de floats, mesmo para expressões constantes. Sem simbolos, os
+    textos do compilador restrito são avaliados sem o SymPy.
+    """
+    restrita = None if simbolos else _restrita(func)
+    if restrita is not None:
+        chave = (restrita, ())
+    else:
+        if not _simbolica(func):
+            if callable(func):
+                return func
+            func = _sympy().sympify(func)
+        chave = (func, tuple(simbolos))
+
+    f = _vetoriais.get(chave)
+    if f is None:
+        if restrita is not None:
+            bruta = restrita.vetorial()[0]
+        else:
+            sp = _sympy()
+            bruta = sp.lambdify((sp.Symbol('x'), *simbolos), func, modules='numpy')
+        f = _vetoriais[chave] = _vetorizada(bruta)
+    return f
+
+
+def compilar_derivada_vetorial(func: Union[sp.Expr, str, Expressao], simbolos: Sequence[sp.Symbol] = ()) -> Callable:
+    """
+    Compila a derivada de func em relação a x para avaliação vetorizada.
+
+    Como em compilar_derivada, textos do compilador restrito usam a
+    diferenciação automática, sem o SymPy.
+    """
+    restrita = None if simbolos else _restrita(func)
+    if restrita is None:
+        return compilar_vetorial(derivada(func), simbolos)
+    chave = (restrita, 'derivada')
+    f = _vetoriais.get(chave)
+    if f is None:
+        f = _vetoriais[chave] = _vetorizada(restrita.vetorial()[1])
+    return f
+
+
+def _vetorizada(bruta: Callable) -> Callable:
+    import numpy as np
+
+    def f(v, *parametros):
+        with np.errstate(all='ignore'):
+            resultado = bruta(v, *parametros)
+        if np.ndim(resultado) == 0:
+            return np.full(np.shape(v), float(resultado))
+        return np.asarray(resultado, dtype=float)
+
+    return f
+
+
+def compilar_mp(func: Union[sp.Expr, str, Expressao]) -> Tuple[Callable, Callable]:
+    """
+    Compila func para avaliação em precisão arbitrária com o mpmath.
+
+    Retorna (f, f_df): f(x) e a função que retorna (f(x), f'(x)), ambas
+    calculadas na precisão corrente de mpmath.mp. Resultados complexos e
+    erros de domínio viram NaN do mpmath.
+    """
+    restrita = _restrita(func)
+    if restrita is not None:
+        return restrita.mpmath()
+
+    expr = _cache.expressao(func)
+    funcoes = _precisas.get(expr)
+    if funcoes is None:
+        import mpmath
+
+        sp = _sympy()
+        x = sp.Symbol('x')
+        bruta_f = sp.lambdify(x, expr, modules='mpmath')
+        bruta_df = sp.lambdify(x, _cache.derivada(func), modules='mpmath')
+
+        def real(bruta, v):
+            try:
+                valor = bruta(v)
+            except (ArithmeticError, ValueError, TypeError):
+                return mpmath.nan
+            return mpmath.mpf(valor) if isinstance(valor, (mpmath.mpf, int, float)) else mpmath.nan
+
+        def f(v):
+            return real(bruta_f, v)
+
+        def f_df(v):
+            return real(bruta_f, v), real(bruta_df, v)
+
+        funcoes = _precisas[expr] = (f, f_df)
+    return funcoes
@@ -16,34 +16,72 @@ Desvantagens:
     - Requer intervalo inicial com mudança de sinal
 """
 
-import sympy as sp
-from typing import List, Union
+from __future__ import annotations
 
-x = sp.Symbol('x')
+import logging
+import math
+from typing import TYPE_CHECKING, Optional
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Estado, Resultado, Status
 
-def bisseccao(a: float, b: float, intervalo: int, func: sp.Expr, precisao: float) -> List[Union[int, float]]:
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+def bisseccao(a: float, b: float, intervalo: int, func: sp.Expr, precisao: float,
+              registro: Optional[Registro] = None, estado: Optional[Estado] = None) -> Resultado:
     
-    if func.subs(x,b)*func.subs(x,a) > 0:
-        return [-1,0] 
+    f = avaliador.compilar(func)
+
+    # extra: avaliações fora do laço, descontadas as iterações já feitas
+    if estado is not None and estado.iteracao is not None:
+        a, b, fa, fb = estado.a, estado.b, estado.fa, estado.fb
+        inicio = estado.iteracao
+        extra = -inicio
+    else:
+        fa, fb = f(a), f(b)
+        inicio, extra = 0, 2
+
+        if math.isnan(fa) or math.isnan(fb):
+            logger.debug("f invalida nos extremos de [%g, %g]", a, b)
+            return Resultado(Status.VALOR_INVALIDO, avaliacoes_f=2)
+
+        if fb*fa > 0:
+            logger.debug("Sem mudanca de sinal em [%g, %g]", a, b)
+            return Resultado(Status.SEM_MUDANCA_SINAL, avaliacoes_f=2)
     
     i = 0
-    for i in range(intervalo):
+    m, fm = math.nan, math.nan
+    for i in range(inicio, intervalo):
         m = ((a+b)/2)
+        fm = f(m)
 
+        if registro is not None:
+            registro.iteracao(i, m, fm, largura=abs(b - a))
        
-        if abs(func.subs(x,m))< precisao or abs(a - b) < precisao:
-            return [i,m] 
+        if abs(fm)< precisao or abs(a - b) < precisao:
+            if estado is not None:
+                # Guarda o intervalo que a iteração seguinte usaria
+                largura = abs(a - b)
+                if fm*fa < 0:
+                    b, fb = m, fm
+                elif fm*fb < 0:
+                    a, fa = m, fm
+                estado.intervalo(i + 1, a, b, fa, fb, largura)
+            return Resultado(Status.CONVERGIU, m, abs(fm), i + 1, i + 1 + extra)
         
        
-        elif func.subs(x,m)*func.subs(x,a)< 0:
+        elif fm*fa< 0:
             
-            b = m
+            b, fb = m, fm
 
-        elif func.subs(x,m)*func.subs(x,b)< 0:
+        elif fm*fb< 0:
            
-            a = m
+            a, fa = m, fm
             
-    return [-1,0] 
-
-
-        
+    n = max(intervalo, inicio)
+    if estado is not None:
+        estado.intervalo(n, a, b, fa, fb)
+    return Resultado(Status.MAX_ITER, m, abs(fm), n, n + extra)
@@ -0,0 +1,112 @@
+"""
+Módulo: Método de Brent
+Descrição: Implementa o método de Brent (Dekker com interpolação quadrática
+inversa) para encontrar zeros de funções contínuas.
+
+O método de Brent mantém sempre um intervalo [b, c] com mudança de sinal,
+como a Bissecção, mas a cada iteração tenta um passo rápido: interpolação
+quadrática inversa pelos três últimos pontos, ou secante quando só há dois.
+O passo rápido só é aceito se cair dentro do intervalo e reduzir o passo de
+forma suficiente; caso contrário, o método faz uma bissecção. Assim ele herda
+a garantia de convergência da Bissecção e, perto da raiz, converge de forma
+superlinear como a Secante.
+
+Vantagens:
+    - Sempre converge se houver mudança de sinal
+    - Convergência superlinear na maioria das funções
+    - Não requer derivada
+
+Desvantagens:
+    - Requer intervalo inicial com mudança de sinal
+    - Mais complexo de implementar que os demais métodos
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import sys
+from typing import TYPE_CHECKING, Optional
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+EPS = sys.float_info.epsilon
+
+def brent(a: float, b: float, func: sp.Expr, precisao: float, maxIter: int,
+          registro: Optional[Registro] = None) -> Resultado:
+
+    f = avaliador.compilar(func)
+    fa, fb = f(a), f(b)
+
+    if math.isnan(fa) or math.isnan(fb):
+        logger.debug("f invalida nos extremos de [%g, %g]", a, b)
+        return Resultado(Status.VALOR_INVALIDO, avaliacoes_f=2)
+
+    if fa * fb > 0:
+        logger.debug("Sem mudanca de sinal em [%g, %g]", a, b)
+        return Resultado(Status.SEM_MUDANCA_SINAL, avaliacoes_f=2)
+
+    # b é a melhor estimativa, c o extremo oposto do intervalo e a a estimativa anterior
+    c, fc = b, fb
+    d = e = b - a
+
+    for i in range(maxIter + 1):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * EPS * abs(b) + 0.5 * precisao
+        meio = 0.5 * (c - b)
+
+        if abs(fb) < precisao or abs(meio) <= tol:
+            return Resultado(Status.CONVERGIU, b, abs(fb), i, i + 2)
+
+        if i == maxIter:
+            break
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * meio * s
+                q = 1 - s
+            else:
+                # Interpolação quadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * meio * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            if 2 * p < min(3 * meio * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = meio
+        else:
+            d = e = meio
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, meio)
+        fb = f(b)
+
+        if math.isnan(fb):
+            logger.debug("f(b) invalido na iteracao %d", i)
+            return Resultado(Status.VALOR_INVALIDO, b, fb, i + 1, i + 3)
+
+        if registro is not None:
+            registro.iteracao(i, b, fb, largura=abs(c - b))
+
+    return Resultado(Status.MAX_ITER, b, abs(fb), maxIter, maxIter + 2)
@@ -0,0 +1,255 @@
+"""
+Módulo: Proxy de Chebyshev
+Descrição: Aproxima f em [a,b] uma única vez por um polinômio de Chebyshev
+e encontra todas as raízes de f(x) = y pelos autovalores da matriz colega
+(colleague matrix), polidas depois com passos de Newton na própria f.
+
+Os métodos iterativos pagam novas avaliações de f a cada iteração e a cada
+consulta. Para uma função suave e cara em um intervalo fixo (como os modelos
+de deslocamento e de bactérias), vale mais amostrar f uma vez nos pontos de
+Chebyshev cos(pi*k/n), dobrando n (e reaproveitando as amostras anteriores,
+que são metade dos novos pontos) até os coeficientes da série decaírem
+abaixo da tolerância. Os coeficientes guardados representam f com precisão
+próxima à do float.
+
+As raízes do polinômio p(t) = sum c_k T_k(t) são os autovalores da matriz
+colega, o análogo da matriz companheira na base de Chebyshev, que é bem
+condicionado. Graus altos são divididos recursivamente em subintervalos
+(com o polinômio reamostrado e truncado em cada metade) até o grau cair
+abaixo de GRAU_FOLHA, de modo que cada autovalor custa pouco. Essa
+subdivisão não depende de y: trocar y só muda o coeficiente c_0 de cada
+folha. Uma consulta f(x) = y descarta as folhas em que |c_0 - y| excede a
+soma dos demais |c_k| (ali p - y não se anula) e calcula os autovalores só
+das restantes, sem avaliar f; apenas o polimento final avalia f, uma vez
+por passo para todas as raízes juntas.
+
+Vantagens:
+    - Todas as raízes do intervalo de uma vez, inclusive as tangentes (que
+      não trocam de sinal e escapam aos métodos de intervalo)
+    - Consultas repetidas com outros y quase não custam avaliações de f
+
+Desvantagens:
+    - Exige f suave em [a,b]: descontinuidades e singularidades impedem os
+      coeficientes de decaírem (ValueError ao atingir grau_maximo)
+    - f precisa aceitar arrays NumPy (texto e sp.Expr são compilados assim)
+    - Raízes distintas mais próximas que SEPARACAO*(b-a) são fundidas
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.polynomial import chebyshev as cheb
+
+from metodos import avaliador
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+# Grau máximo das folhas da subdivisão (autovalores de matrizes até esse tamanho)
+GRAU_FOLHA = 24
+# Ponto de divisão deslocado do centro, para não cortar raízes simétricas
+DESVIO = -0.004849834917525
+# Parte imaginária tolerada (em unidades do intervalo normalizado [-1,1]); uma
+# raiz dupla aparece como par conjugado com parte imaginária ~ sqrt(EPS)
+IMAGINARIA = 1e-7
+# Raízes mais próximas que SEPARACAO*(b-a) são consideradas a mesma
+SEPARACAO = 1e-7
+
+
+def _coeficientes(valores: np.ndarray) -> np.ndarray:
+    """Coeficientes de Chebyshev do interpolante nos pontos cos(pi*k/n), k = 0..n."""
+    n = valores.size - 1
+    if n == 0:
+        return valores.astype(float)
+    # DCT do tipo I pela FFT da extensão par
+    c = np.fft.rfft(np.concatenate([valores, valores[-2:0:-1]])).real / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+
+def _cortar(c: np.ndarray, limite: float) -> np.ndarray:
+    """Remove os coeficientes finais abaixo de limite."""
+    grandes = np.flatnonzero(np.abs(c) > limite)
+    return c[:grandes[-1] + 1] if grandes.size else np.zeros(1)
+
+
+def _pontos(n: int) -> np.ndarray:
+    return np.cos(np.pi * np.arange(n + 1) / n)
+
+
+class Proxy:
+    """
+    Polinômio de Chebyshev que aproxima func em [a,b].
+
+    Args:
+        func: Função de x (texto, sp.Expr ou função vetorizada do NumPy)
+        a, b: Intervalo
+        tolerancia: Decaimento relativo dos coeficientes exigido, em relação
+                    ao maior |f| amostrado
+        grau_maximo: Grau a partir do qual a construção desiste
+
+    Atributos:
+        coeficientes: c_k da série em t = (2x - a - b) / (b - a)
+        avaliacoes: Avaliações de f feitas (construção e polimentos)
+
+    Exemplo:
+        >>> p = Proxy("80*exp(-2*x) + 20*exp(-0.1*x)", 0, 10)
+        >>> p.raizes(10)               # f(x) = 10
+        >>> [p.raizes(C) for C in (12, 15, 20)]   # sem reconstruir
+    """
+
+    __slots__ = ("a", "b", "coeficientes", "avaliacoes", "escala", "_f", "_derivada", "_folhas")
+
+    def __init__(self, func: Union[sp.Expr, str, Callable], a: float, b: float,
+                 tolerancia: float = 1e-14, grau_maximo: int = 65536):
+        if not a < b:
+            raise ValueError(f"Intervalo invalido: [{a}, {b}]")
+        self.a, self.b = float(a), float(b)
+        self._f = avaliador.compilar_vetorial(func)
+
+        n = 16
+        valores = self._f(self._x(_pontos(n)))
+        self.avaliacoes = n + 1
+        while True:
+            if not np.all(np.isfinite(valores)):
+                raise ValueError(f"A funcao nao e finita em [{a}, {b}]")
+            self.escala = float(np.max(np.abs(valores))) or 1.0
+            c = _coeficientes(valores)
+            cauda = c[-max(3, n // 8):]
+            if np.max(np.abs(cauda)) <= tolerancia * self.escala:
+                break
+            if 2 * n > grau_maximo:
+                raise ValueError(f"Os coeficientes nao decairam ate o grau {grau_maximo} "
+                                 f"(funcao nao suave em [{a}, {b}]?)")
+            # Os pontos de grau n são os pontos pares de grau 2n
+            novos = self._f(self._x(np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n))))
+            self.avaliacoes += n
+            dobrados = np.empty(2 * n + 1)
+            dobrados[0::2] = valores
+            dobrados[1::2] = novos
+            valores, n = dobrados, 2 * n
+
+        limite = tolerancia * self.escala
+        self.coeficientes = _cortar(c, limite)
+        self._derivada = cheb.chebder(self.coeficientes) * (2 / (self.b - self.a))
+        self._folhas: List[Tuple[float, float, np.ndarray, float, Optional[np.ndarray]]] = []
+        self._dividir(self.coeficientes, -1.0, 1.0, limite)
+        logger.debug("Proxy de grau %d com %d folhas (%d avaliacoes)",
+                     self.grau, len(self._folhas), self.avaliacoes)
+
+    @property
+    def grau(self) -> int:
+        return self.coeficientes.size - 1
+
+    def _x(self, t):
+        return (self.a + self.b) / 2 + (self.b - self.a) / 2 * t
+
+    def _t(self, x):
+        return (2 * np.asarray(x, dtype=float) - self.a - self.b) / (self.b - self.a)
+
+    def __call__(self, x):
+        """Valor do polinômio em x (escalar ou array)."""
+        return cheb.chebval(self._t(x), self.coeficientes)
+
+    def derivada(self, x):
+        """Derivada do polinômio em x."""
+        return cheb.chebval(self._t(x), self._derivada)
+
+    def _dividir(self, c: np.ndarray, inicio: float, fim: float, limite: float):
+        """Divide [inicio, fim] (em t) até o grau de cada parte não passar de GRAU_FOLHA."""
+        n = c.size - 1
+        if n <= GRAU_FOLHA:
+            # Matriz colega de p; para p - y só o elemento [0, -1] muda
+            colega = cheb.chebcompanion(c) if n > 1 else None
+            self._folhas.append((inicio, fim, c, float(np.sum(np.abs(c[1:]))), colega))
+            return
+        meio = (inicio + fim) / 2 + (fim - inicio) / 2 * DESVIO
+        for lo, hi in ((inicio, meio), (meio, fim)):
+            # Reamostra o polinômio da parte nos pontos de Chebyshev da metade
+            t = (lo + hi) / 2 + (hi - lo) / 2 * _pontos(n)
+            u = (2 * t - inicio - fim) / (fim - inicio)
+            self._dividir(_cortar(_coeficientes(cheb.chebval(u, c)), limite), lo, hi, limite)
+
+    def raizes(self, y: float = 0.0, polir: bool = True, passos: int = 3) -> np.ndarray:
+        """
+        Todas as raízes de f(x) = y em [a,b], em ordem crescente.
+
+        Args:
+            y: Lado direito da equação
+            polir: Refina as raízes do polinômio com Newton em f
+            passos: Máximo de passos de Newton do polimento
+        """
+        encontradas = []
+        for inicio, fim, c, raio, colega in self._folhas:
+            c0 = c[0] - y
+            # |p(t) - y| >= |c0| - sum |c_k| > 0 em toda a folha
+            if c.size == 1 or abs(c0) > raio:
+                continue
+            if colega is None:
+                r = np.array([-c0 / c[1]])
+            else:
+                # c_0 entra na matriz colega só como -c_0 * sqrt(1/2) / c_n em [0, -1]
+                matriz = colega.copy()
+                matriz[0, -1] += y * np.sqrt(0.5) / c[-1]
+                r = np.linalg.eigvals(matriz)
+                r = r[np.abs(r.imag) < IMAGINARIA].real
+            r = r[np.abs(r) <= 1 + IMAGINARIA]
+            encontradas.append((inicio + fim) / 2 + (fim - inicio) / 2 * np.clip(r, -1, 1))
+        if not encontradas:
+            return np.empty(0)
+
+        x = np.sort(self._x(np.concatenate(encontradas)))
+        if polir and passos > 0:
+            x, fx = self._polir(x, y, passos)
+        else:
+            fx = np.abs(self(x) - y)
+
+        # Raízes repetidas (bordas de folhas, pares conjugados de uma raiz
+        # dupla): fica a de menor resíduo
+        grupo = np.concatenate([[0], np.cumsum(np.diff(x) > SEPARACAO * (self.b - self.a))])
+        ordem = np.lexsort((fx, grupo))
+        primeira = np.concatenate([[True], np.diff(grupo[ordem]) > 0])
+        return np.sort(x[ordem[primeira]])
+
+    def _polir(self, x: np.ndarray, y: float, passos: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Newton em f (com a derivada do polinômio), aceitando só passos que reduzem |f - y|."""
+        fx = self._f(x) - y
+        self.avaliacoes += x.size
+        for _ in range(passos):
+            with np.errstate(all='ignore'):
+                novo = x - fx / self.derivada(x)
+            dentro = np.isfinite(novo) & (novo >= self.a) & (novo <= self.b)
+            novo = np.where(dentro, novo, x)
+            fnovo = self._f(novo) - y
+            self.avaliacoes += x.size
+            melhor = dentro & (np.abs(fnovo) < np.abs(fx))
+            if not melhor.any():
+                break
+            x = np.where(melhor, novo, x)
+            fx = np.where(melhor, fnovo, fx)
+        return x, np.abs(fx)
+
+
+@lru_cache(maxsize=64)
+def proxy(func: Union[sp.Expr, str, Callable], a: float, b: float, tolerancia: float = 1e-14) -> Proxy:
+    """Proxy de func em [a,b], construído uma vez e reaproveitado nas chamadas seguintes."""
+    return Proxy(func, a, b, tolerancia)
+
+
+def todas_raizes(func: Union[sp.Expr, str, Callable], a: float, b: float, y: float = 0.0,
+                 polir: bool = True) -> np.ndarray:
+    """
+    Todas as raízes de func(x) = y em [a,b], pelo proxy de Chebyshev em cache.
+
+    Exemplo:
+        >>> todas_raizes("10*exp(-0.5*x)*cos(2*x) - 5", 0, 5)
+        >>> todas_raizes("80*exp(-2*x) + 20*exp(-0.1*x)", 0, 10, y=10)
+    """
+    return proxy(func, a, b).raizes(y, polir)
@@ -0,0 +1,620 @@
+"""
+Módulo: Compilador Restrito de Expressões
+Descrição: Interpreta o texto das funções usadas nos arquivos de problema
+(aritmética, potências, exp, log, raiz e funções trigonométricas) sem usar o
+SymPy, gerando funções Python sobre floats com o módulo math.
+
+Importar o SymPy custa centenas de milissegundos por processo, mais que
+resolver um arquivo inteiro. Para os processos curtos (lote de arquivos,
+linha de comando) o texto é lido com o módulo ast do Python e só são aceitos
+números, a variável x, as constantes pi e E, os operadores aritméticos e uma
+lista fechada de funções: nada do texto é executado diretamente, o código é
+gerado a partir da árvore já validada.
+
+A derivada é obtida por diferenciação automática no modo direto: cada nó da
+árvore gera o seu valor e a sua derivada em relação a x, aplicando a regra
+da cadeia passo a passo. O resultado é exato (a menos do arredondamento),
+como a derivada simbólica, mas sem expandir a expressão. Para os métodos de
+ordem alta (Halley, Householder), derivadas() gera de uma vez os
+coeficientes de Taylor até a ordem pedida, com as recorrências do produto,
+da divisão e das funções elementares; subexpressões repetidas são
+calculadas uma única vez.
+
+A mesma fonte, compilada com as funções do NumPy (vetorial()), avalia f e
+f' sobre arrays para os métodos em lote, também sem o SymPy.
+
+O SymPy só é importado quando um recurso simbólico é pedido (simbolica(), ou
+funções do SymPy como sp.diff e sp.Poly, que aceitam a Expressao).
+
+Vantagens:
+    - Sem importação do SymPy: partida muito mais rápida
+    - Derivada sem diferenciação simbólica
+
+Desvantagens:
+    - Aceita apenas um subconjunto das expressões do SymPy; as demais
+      (outros símbolos, funções especiais) continuam pelo caminho simbólico
+"""
+
+import ast
+import functools
+import math
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Nomes do texto aceitos, com o nome equivalente no módulo math
+CONSTANTES = {'pi': 'pi', 'E': 'e'}
+FUNCOES = {
+    'exp': 'exp', 'log': 'log', 'ln': 'log', 'sqrt': 'sqrt',
+    'sin': 'sin', 'cos': 'cos', 'tan': 'tan',
+    'asin': 'asin', 'acos': 'acos', 'atan': 'atan',
+    'sinh': 'sinh', 'cosh': 'cosh', 'tanh': 'tanh',
+    'Abs': 'abs', 'abs': 'abs',
+}
+
+_OPERADORES = {ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/', ast.Pow: '**'}
+
+
+class ExpressaoInvalida(ValueError):
+    """O texto não pertence ao subconjunto aceito pelo compilador restrito."""
+
+
+class _Gerador:
+    """
+    Gera o código em forma de atribuições simples (valor e derivada de cada nó).
+
+    literal formata as constantes numéricas do texto (repr para floats; o
+    mpmath recebe o texto decimal, sem o arredondamento para binário).
+    variavel é o nome que x recebe no código gerado.
+    """
+
+    def __init__(self, literal: Callable[[object], str] = repr, variavel: str = 'x'):
+        self.linhas: List[str] = []
+        self.contador = 0
+        self.literal = literal
+        self.variavel = variavel
+        # Código já emitido -> temporária: subexpressões repetidas no texto
+        # (como exp(-0.5*x) em f e na derivada) são calculadas uma única vez
+        self.vistas: Dict[str, str] = {}
+
+    def _temporaria(self, codigo: str) -> str:
+        # Nomes e literais positivos não precisam de temporária (um literal
+        # negativo precisaria de parênteses em -2 ** x)
+        if codigo.isidentifier() or (_literal(codigo) is not None and not codigo.startswith('-')):
+            return codigo
+        nome = self.vistas.get(codigo)
+        if nome is None:
+            nome = self.vistas[codigo] = f"t{self.contador}"
+            self.contador += 1
+            self.linhas.append(f"    {nome} = {codigo}")
+        return nome
+
+    def valor(self, no: ast.AST) -> str:
+        """Código da expressão de valor, sem temporárias."""
+        if isinstance(no, ast.Constant):
+            return self.literal(no.value)
+        if isinstance(no, ast.Name):
+            return self.variavel if no.id == 'x' else CONSTANTES[no.id]
+        if isinstance(no, ast.UnaryOp):
+            return f"({'-' if isinstance(no.op, ast.USub) else '+'}{self.valor(no.operand)})"
+        if isinstance(no, ast.BinOp):
+            return f"({self.valor(no.left)} {_OPERADORES[type(no.op)]} {self.valor(no.right)})"
+        return f"{FUNCOES[no.func.id]}({self.valor(no.args[0])})"
+
+    def derivada(self, no: ast.AST) -> Tuple[str, Optional[str]]:
+        """Emite o código do nó e retorna (valor, derivada); derivada None quando é constante em x."""
+        if isinstance(no, ast.Constant):
+            return self.literal(no.value), None
+        if isinstance(no, ast.Name):
+            return (self.variavel, '1.0') if no.id == 'x' else (CONSTANTES[no.id], None)
+
+        if isinstance(no, ast.UnaryOp):
+            v, d = self.derivada(no.operand)
+            if isinstance(no.op, ast.UAdd):
+                return v, d
+            return self._temporaria(f"-{v}"), (self._temporaria(f"-{d}") if d else None)
+
+        if isinstance(no, ast.BinOp):
+            a, da = self.derivada(no.left)
+            b, db = self.derivada(no.right)
+            op = _OPERADORES[type(no.op)]
+            v = self._temporaria(f"{a} {op} {b}")
+            if da is None and db is None:
+                return v, None
+            if op in '+-':
+                if da is None:
+                    d = f"{op}{db}" if op == '-' else db
+                elif db is None:
+                    d = da
+                else:
+                    d = f"{da} {op} {db}"
+            elif op == '*':
+                d = " + ".join(termo for termo in (da and _vezes(da, b), db and _vezes(a, db)) if termo)
+            elif op == '/':
+                d = f"{da} / {b}" if db is None else f"({da or 0.0} - {v} * {db}) / {b}"
+            elif db is None:
+                # Expoente constante: d(a**c) = c * a**(c - 1) * da
+                c = _literal(b)
+                potencia = f"{a} ** ({b} - 1)" if c is None else (a if c == 2 else f"{a} ** {c - 1!r}")
+                d = _vezes(f"{b} * {potencia}", da)
+            elif da is None:
+                d = f"{v} * log({a}) * {db}"
+            else:
+                d = f"{v} * ({db} * log({a}) + {b} * {da} / {a})"
+            return v, self._temporaria(d)
+
+        nome = FUNCOES[no.func.id]
+        a, da = self.derivada(no.args[0])
+        v = self._temporaria(f"{nome}({a})")
+        if da is None:
+            return v, None
+        regras = {
+            'exp': _vezes(v, da),
+            'log': f"{da} / {a}",
+            'sqrt': f"{da} / (2 * {v})",
+            'sin': _vezes(f"cos({a})", da),
+            'cos': _vezes(f"-sin({a})", da),
+            'tan': f"{da} / cos({a}) ** 2",
+            'asin': f"{da} / sqrt(1 - {a} * {a})",
+            'acos': f"-{da} / sqrt(1 - {a} * {a})",
+            'atan': f"{da} / (1 + {a} * {a})",
+            'sinh': _vezes(f"cosh({a})", da),
+            'cosh': _vezes(f"sinh({a})", da),
+            'tanh': _vezes(f"(1 - {v} * {v})", da),
+            'abs': _vezes(_sinal(a), da),
+        }
+        return v, self._temporaria(regras[nome])
+
+
+Serie = List[Optional[str]]
+
+
+class _Taylor(_Gerador):
+    """
+    Gera o código dos coeficientes de Taylor de cada nó até a ordem pedida.
+
+    Cada nó vira a lista [c0, c1, ..., cn], com ck = f^(k)(x) / k! (None
+    quando o coeficiente é zero), pelas recorrências da diferenciação
+    automática de ordem alta: produto de Cauchy, divisão, exp, log,
+    potência, seno e cosseno juntos. f e as n derivadas saem de uma única
+    passada, e as subexpressões comuns são calculadas uma vez.
+    """
+
+    def __init__(self, ordem: int):
+        super().__init__()
+        self.ordem = ordem
+
+    def _soma(self, termos) -> Optional[str]:
+        termos = [t for t in termos if t is not None]
+        return self._temporaria(" + ".join(termos)) if termos else None
+
+    def _negativo(self, c: Optional[str]) -> Optional[str]:
+        return None if c is None else self._temporaria(f"-{c}")
+
+    def _produto(self, a: Serie, b: Serie) -> Serie:
+        return [self._soma(_vezes(a[j], b[k - j]) for j in range(k + 1)
+                           if a[j] is not None and b[k - j] is not None)
+                for k in range(len(a))]
+
+    def _divisao(self, a: Serie, b: Serie) -> Serie:
+        # c = a / b  <=>  c * b = a:  ck = (ak - sum(bj * c(k-j), j = 1..k)) / b0
+        c: Serie = []
+        for k in range(len(a)):
+            numerador = self._soma([a[k]] + [f"-{_vezes(b[j], c[k - j])}" for j in range(1, k + 1)
+                                             if b[j] is not None and c[k - j] is not None])
+            c.append(None if numerador is None else self._temporaria(f"{numerador} / {b[0]}"))
+        return c
+
+    def _convolucao(self, a: Serie, b: Serie, k: int, fator: Callable[[int, int], float] = lambda j, k: j / k,
+                    inicio: int = 1, fim: Optional[int] = None) -> Optional[str]:
+        """Soma de fator(j, k) * aj * b(k-j), para j de inicio a fim (padrão: k)."""
+        termos = []
+        for j in range(inicio, k + 1 if fim is None else fim + 1):
+            peso = fator(j, k)
+            if peso != 0 and a[j] is not None and b[k - j] is not None:
+                termos.append(_vezes(_vezes(repr(float(peso)), a[j]), b[k - j]))
+        return self._soma(termos)
+
+    def _exp(self, a: Serie) -> Serie:
+        # e' = a' * e
+        e = [self._temporaria(f"exp({a[0]})")]
+        for k in range(1, len(a)):
+            e.append(self._convolucao(a, e, k))
+        return e
+
+    def _log(self, a: Serie) -> Serie:
+        # a * l' = a'
+        l = [self._temporaria(f"log({a[0]})")]
+        for k in range(1, len(a)):
+            soma = self._convolucao(l, a, k, fim=k - 1)
+            numerador = self._soma([a[k], soma and f"-{soma}"])
+            l.append(None if numerador is None else self._temporaria(f"{numerador} / {a[0]}"))
+        return l
+
+    def _potencia(self, a: Serie, expoente: str) -> Serie:
+        """a ** expoente, com o expoente constante em x."""
+        valor = self._temporaria(f"{a[0]} ** {expoente}")
+        c = _literal(expoente)
+        if c is not None and float(c).is_integer() and abs(c) <= 64:
+            # Expoente inteiro: produtos de séries, exatos também em a0 = 0
+            # (onde a recorrência abaixo dividiria por zero)
+            n, resultado, base = abs(int(c)), None, a
+            while n:
+                if n & 1:
+                    resultado = base if resultado is None else self._produto(resultado, base)
+                n >>= 1
+                if n:
+                    base = self._produto(base, base)
+            if resultado is None:
+                return ['1.0'] + [None] * (len(a) - 1)
+            if c < 0:
+                resultado = self._divisao(['1.0'] + [None] * (len(a) - 1), resultado)
+            return [valor] + resultado[1:]
+        # a * p' = c * a' * p:  pk = sum(((c + 1) * j / k - 1) * aj * p(k-j)) / a0
+        p = [valor]
+        for k in range(1, len(a)):
+            if c is not None:
+                soma = self._convolucao(a, p, k, lambda j, k: (c + 1) * j / k - 1)
+            else:
+                soma = self._soma(_vezes(_vezes(f"(({expoente} + 1) * {j / k!r} - 1)", a[j]), p[k - j])
+                                  for j in range(1, k + 1) if a[j] is not None and p[k - j] is not None)
+            p.append(None if soma is None else self._temporaria(f"{soma} / {a[0]}"))
+        return p
+
+    def _seno_cosseno(self, a: Serie, hiperbolico: bool) -> Tuple[Serie, Serie]:
+        # s' = a' * c e c' = -a' * s (sem o sinal nas hiperbólicas)
+        s = [self._temporaria(f"{'sinh' if hiperbolico else 'sin'}({a[0]})")]
+        c = [self._temporaria(f"{'cosh' if hiperbolico else 'cos'}({a[0]})")]
+        for k in range(1, len(a)):
+            s.append(self._convolucao(a, c, k))
+            termo = self._convolucao(a, s, k)
+            c.append(termo if hiperbolico else self._negativo(termo))
+        return s, c
+
+    def _tangente(self, a: Serie, hiperbolica: bool) -> Serie:
+        # t' = a' * q, com q = 1 + t² (1 - t² na hiperbólica)
+        t = [self._temporaria(f"{'tanh' if hiperbolica else 'tan'}({a[0]})")]
+        q = [self._temporaria(f"1 {'-' if hiperbolica else '+'} {t[0]} * {t[0]}")]
+        for k in range(1, len(a)):
+            t.append(self._convolucao(a, q, k))
+            quadrado = self._soma(_vezes(t[i], t[k - i]) for i in range(k + 1)
+                                  if t[i] is not None and t[k - i] is not None)
+            q.append(self._negativo(quadrado) if hiperbolica else quadrado)
+        return t
+
+    def _inversa(self, nome: str, a: Serie) -> Serie:
+        """asin, acos e atan: integra a série de a' / q termo a termo."""
+        n = len(a) - 1
+        resultado = [self._temporaria(f"{nome}({a[0]})")]
+        if n == 0:
+            return resultado
+        da = [None if a[m + 1] is None else self._temporaria(_vezes(repr(float(m + 1)), a[m + 1]))
+              for m in range(n)]
+        quadrado = self._produto(a[:n], a[:n])
+        if nome == 'atan':
+            q = [self._temporaria(f"1 + {quadrado[0]}")] + quadrado[1:]
+        else:
+            q = self._potencia([self._temporaria(f"1 - {quadrado[0]}")]
+                               + [self._negativo(c) for c in quadrado[1:]], '0.5')
+        h = self._divisao(da, q)
+        for k in range(1, n + 1):
+            termo = None if h[k - 1] is None else self._temporaria(_vezes(repr(1 / k), h[k - 1]))
+            resultado.append(self._negativo(termo) if nome == 'acos' else termo)
+        return resultado
+
+    def serie(self, no: ast.AST) -> Serie:
+        """Coeficientes de Taylor do nó, c0 (o valor) até c[ordem]."""
+        zeros: Serie = [None] * self.ordem
+        if isinstance(no, ast.Constant):
+            return [self.literal(no.value)] + zeros
+        if isinstance(no, ast.Name):
+            if no.id != 'x':
+                return [CONSTANTES[no.id]] + zeros
+            return (['x', '1.0'] + zeros)[:self.ordem + 1]
+
+        if isinstance(no, ast.UnaryOp):
+            a = self.serie(no.operand)
+            return a if isinstance(no.op, ast.UAdd) else [self._negativo(c) for c in a]
+
+        if isinstance(no, ast.BinOp):
+            a = self.serie(no.left)
+            b = self.serie(no.right)
+            op = _OPERADORES[type(no.op)]
+            if op == '+':
+                return [self._soma(par) for par in zip(a, b)]
+            if op == '-':
+                return [self._soma((ak, bk and f"-{bk}")) for ak, bk in zip(a, b)]
+            if op == '*':
+                return self._produto(a, b)
+            if op == '/':
+                return self._divisao(a, b)
+            if all(c is None for c in b[1:]):
+                return self._potencia(a, b[0])
+            # Expoente variável: a ** b = exp(b * log(a))
+            p = self._exp(self._produto(b, self._log(a)))
+            return [self._temporaria(f"{a[0]} ** {b[0]}")] + p[1:]
+
+        nome = FUNCOES[no.func.id]
+        a = self.serie(no.args[0])
+        if nome == 'exp':
+            return self._exp(a)
+        if nome == 'log':
+            return self._log(a)
+        if nome == 'sqrt':
+            return [self._temporaria(f"sqrt({a[0]})")] + self._potencia(a, '0.5')[1:]
+        if nome in ('sin', 'cos', 'sinh', 'cosh'):
+            s, c = self._seno_cosseno(a, nome.endswith('h'))
+            return s if nome.startswith('sin') else c
+        if nome in ('tan', 'tanh'):
+            return self._tangente(a, nome == 'tanh')
+        if nome in ('asin', 'acos', 'atan'):
+            return self._inversa(nome, a)
+        # abs: a série de a com o sinal de a0
+        sinal = self._temporaria(_sinal(a[0]))
+        return [self._temporaria(f"abs({a[0]})")] + [c and self._temporaria(_vezes(sinal, c)) for c in a[1:]]
+
+
+def _usadas(linhas: List[str], resultado: str) -> List[str]:
+    """Remove as atribuições que não contribuem para resultado."""
+    vivas = set(re.findall(r"\bt\d+\b", resultado))
+    mantidas = []
+    for linha in reversed(linhas):
+        alvo, codigo = linha.strip().split(" = ", 1)
+        if alvo in vivas:
+            vivas.update(re.findall(r"\bt\d+\b", codigo))
+            mantidas.append(linha)
+    return mantidas[::-1]
+
+
+def _literal(codigo: str):
+    """Valor numérico de um literal gerado (como 2 ou 0.5), ou None."""
+    # int() e float() bastam para os literais gerados por repr, sem analisar o texto
+    for tipo in (int, float):
+        try:
+            return tipo(codigo)
+        except ValueError:
+            pass
+    return None
+
+
+def _sinal(a: str) -> str:
+    # 1.0 * para que arrays NumPy também funcionem: bool - bool não é aceito
+    return f"(1.0 * ({a} > 0) - ({a} < 0))"
+
+
+def _vezes(a: str, b: str) -> str:
+    # Multiplicar pela derivada de x (1.0) não muda nada
+    if b == '1.0':
+        return a
+    if a == '1.0':
+        return b
+    return f"{a} * {b}"
+
+
+def _validar(no: ast.AST):
+    """Recusa qualquer construção fora do subconjunto aceito."""
+    if isinstance(no, ast.Constant):
+        if isinstance(no.value, bool) or not isinstance(no.value, (int, float)):
+            raise ExpressaoInvalida(f"Constante nao suportada: {no.value!r}")
+    elif isinstance(no, ast.Name):
+        if no.id != 'x' and no.id not in CONSTANTES:
+            raise ExpressaoInvalida(f"Nome nao suportado: {no.id}")
+    elif isinstance(no, ast.UnaryOp):
+        if not isinstance(no.op, (ast.USub, ast.UAdd)):
+            raise ExpressaoInvalida("Operador unario nao suportado")
+        _validar(no.operand)
+    elif isinstance(no, ast.BinOp):
+        if type(no.op) not in _OPERADORES:
+            raise ExpressaoInvalida("Operador nao suportado")
+        _validar(no.left)
+        _validar(no.right)
+    elif isinstance(no, ast.Call):
+        if not isinstance(no.func, ast.Name) or no.func.id not in FUNCOES or len(no.args) != 1 or no.keywords:
+            raise ExpressaoInvalida("Funcao nao suportada")
+        _validar(no.args[0])
+    else:
+        raise ExpressaoInvalida(f"Construcao nao suportada: {type(no).__name__}")
+
+
+# Nomes do módulo math visíveis ao código gerado
+_NOMES_MATH = {nome_math: getattr(math, nome_math) for nome_math in
+               set(FUNCOES.values()) | set(CONSTANTES.values()) if hasattr(math, nome_math)}
+
+
+# Nomes do NumPy que diferem dos do módulo math
+_NUMPY = {'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan'}
+
+
+def _compilar(fonte: str, base: Optional[dict] = None) -> dict:
+    """Compila a fonte uma única vez; retorna o espaço de nomes com as funções definidas."""
+    nomes = dict(_NOMES_MATH if base is None else base)
+    exec(compile(fonte, "<expressao>", "exec"), nomes)
+    return nomes
+
+
+def _arvore(texto: str) -> ast.Expression:
+    """Árvore do texto, já validada."""
+    # ^ é potência, como no sympify; trocado no texto porque, como operador do
+    # Python, ^ tem precedência menor que + e *, e x^2-1 viraria x^(2-1)
+    try:
+        arvore = ast.parse(texto.strip().replace('\n', ' ').replace('^', '**'), mode='eval')
+    except SyntaxError as e:
+        raise ExpressaoInvalida(f"Expressao invalida: {texto}") from e
+    _validar(arvore.body)
+    return arvore
+
+
+def _gerar_fonte(texto: str, literal: Callable[[object], str] = repr) -> str:
+    """Valida o texto e gera a fonte das funções f, df e f_df."""
+    arvore = _arvore(texto)
+    gerador = _Gerador(literal)
+    valor = gerador.valor(arvore.body)
+    v, d = gerador.derivada(arvore.body)
+    d = d or '0.0'
+    corpo_df = "".join(linha + "\n" for linha in _usadas(gerador.linhas, d))
+    corpo = "".join(linha + "\n" for linha in gerador.linhas)
+    return (f"def f(x):\n    return {valor}\n\n"
+            f"def df(x):\n{corpo_df}    return {d}\n\n"
+            f"def f_df(x):\n{corpo}    return {v}, {d}\n")
+
+
+def _gerar_fonte_derivadas(texto: str, ordem: int) -> str:
+    """Fonte da função derivadas(x) -> (f, f', ..., f^(ordem)), em uma passada."""
+    gerador = _Taylor(ordem)
+    serie = gerador.serie(_arvore(texto).body)
+    # f^(k) = k! * ck
+    valores = ", ".join('0.0' if c is None else (c if k < 2 else f"{math.factorial(k)} * {c}")
+                        for k, c in enumerate(serie))
+    corpo = "".join(linha + "\n" for linha in _usadas(gerador.linhas, valores))
+    return f"def derivadas(x):\n{corpo}    return ({valores},)\n"
+
+
+def _literal_mp(valor) -> str:
+    # Inteiros são exatos; floats passam pelo texto decimal (0.1 exato na precisão em uso)
+    return repr(valor) if isinstance(valor, int) else f"mpf({repr(valor)!r})"
+
+
+def _protegida(bruta: Callable) -> Callable[[float], float]:
+    # Erros de domínio viram NaN, como em metodos.avaliador
+    def avaliar(v: float) -> float:
+        try:
+            return float(bruta(v))
+        except (ArithmeticError, ValueError, TypeError):
+            return math.nan
+    return avaliar
+
+
+class Expressao:
+    """
+    Função de x interpretada pelo compilador restrito.
+
+    Atributos:
+        texto: Texto original da função
+        f: Função float -> float
+        df: Derivada em relação a x, por diferenciação automática
+        f_df: Função que retorna (f(x), f'(x)) na mesma passada
+    """
+
+    __slots__ = ("texto", "f", "df", "f_df", "fonte", "_mp", "_np", "_derivadas")
+
+    def __init__(self, texto: str):
+        self.fonte = _gerar_fonte(texto)
+        self.texto = texto.strip()
+        self._mp = None
+        self._np = None
+        self._derivadas: Dict[int, Callable[[float], Tuple[float, ...]]] = {}
+        nomes = _compilar(self.fonte)
+        self.f = _protegida(nomes['f'])
+        self.df = _protegida(nomes['df'])
+
+        bruta = nomes['f_df']
+
+        def f_df(v: float) -> Tuple[float, float]:
+            try:
+                fv, dv = bruta(v)
+                return float(fv), float(dv)
+            except (ArithmeticError, ValueError, TypeError):
+                return math.nan, math.nan
+
+        self.f_df = f_df
+
+    def derivadas(self, ordem: int = 2) -> Callable[[float], Tuple[float, ...]]:
+        """
+        Função que retorna (f(x), f'(x), ..., f^(ordem)(x)) em uma única
+        passada (compilada na primeira chamada para cada ordem).
+        """
+        fundida = self._derivadas.get(ordem)
+        if fundida is None:
+            if ordem == 1:
+                fundida = self.f_df
+            else:
+                bruta = _compilar(_gerar_fonte_derivadas(self.texto, ordem))['derivadas']
+                invalido = (math.nan,) * (ordem + 1)
+
+                def fundida(v: float) -> Tuple[float, ...]:
+                    try:
+                        return tuple(map(float, bruta(v)))
+                    except (ArithmeticError, ValueError, TypeError):
+                        return invalido
+
+            self._derivadas[ordem] = fundida
+        return fundida
+
+    def mpmath(self) -> Tuple[Callable, Callable]:
+        """
+        (f, f_df) em precisão arbitrária com o mpmath, na precisão corrente
+        de mpmath.mp; resultados complexos e erros de domínio viram NaN.
+        """
+        if self._mp is None:
+            import mpmath
+
+            base = {nome: getattr(mpmath, nome) for nome in
+                    set(FUNCOES.values()) | set(CONSTANTES.values()) if hasattr(mpmath, nome)}
+            base['mpf'] = mpmath.mpf
+            nomes = _compilar(_gerar_fonte(self.texto, _literal_mp), base)
+            bruta_f, bruta_f_df = nomes['f'], nomes['f_df']
+
+            def f(v):
+                try:
+                    fv = bruta_f(v)
+                except (ArithmeticError, ValueError, TypeError):
+                    return mpmath.nan
+                return fv if isinstance(fv, (mpmath.mpf, int)) else mpmath.nan
+
+            def f_df(v):
+                try:
+                    fv, dv = bruta_f_df(v)
+                except (ArithmeticError, ValueError, TypeError):
+                    return mpmath.nan, mpmath.nan
+                if not (isinstance(fv, (mpmath.mpf, int)) and isinstance(dv, (mpmath.mpf, int, float))):
+                    return mpmath.nan, mpmath.nan
+                return fv, dv
+
+            self._mp = (f, f_df)
+        return self._mp
+
+    def vetorial(self) -> Tuple[Callable, Callable]:
+        """
+        (f, df) sobre arrays NumPy, da mesma fonte gerada para floats.
+
+        Erros de domínio viram NaN (ou avisos do NumPy, que quem chama pode
+        silenciar com np.errstate); expressões constantes em x devolvem um
+        escalar.
+        """
+        if self._np is None:
+            import numpy as np
+
+            base = {nome: getattr(np, _NUMPY.get(nome, nome))
+                    for nome in set(FUNCOES.values()) | set(CONSTANTES.values())}
+            nomes = _compilar(self.fonte, base)
+            self._np = (nomes['f'], nomes['df'])
+        return self._np
+
+    def simbolica(self):
+        """Expressão do SymPy equivalente (importa o SymPy)."""
+        from metodos import avaliador
+        return avaliador.expressao(self.texto)
+
+    def _sympy_(self):
+        # Permite passar a Expressao para sp.sympify, sp.diff, sp.Poly, ...
+        return self.simbolica()
+
+    def __str__(self) -> str:
+        return self.texto
+
+    def __repr__(self) -> str:
+        return f"Expressao({self.texto!r})"
+
+    def __eq__(self, outra) -> bool:
+        return isinstance(outra, Expressao) and outra.texto == self.texto
+
+    def __hash__(self) -> int:
+        return hash(self.texto)
+
+    def __reduce__(self):
+        return (interpretar, (self.texto,))
+
+
+@functools.lru_cache(maxsize=256)
+def interpretar(texto: str) -> Expressao:
+    """Expressao do texto, com cache; ExpressaoInvalida se o texto não for aceito."""
+    return Expressao(texto)
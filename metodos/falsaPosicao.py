@@ -15,34 +15,104 @@ Vantagens:
 Desvantagens:
     - Pode ser mais lento que métodos de ordem superior
     - Pode convergir lentamente se a função for muito convexa/côncava
+
+Variantes modificadas:
+    Em funções convexas (como a curva de decaimento das bactérias) um dos
+    extremos nunca se move e a convergência fica mais lenta que a da
+    Bissecção. As variantes reduzem o valor de f guardado no extremo que foi
+    mantido duas vezes seguidas, puxando a reta para o lado dele:
+        - 'illinois':        f_mantido *= 1/2
+        - 'pegasus':         f_mantido *= f_anterior / (f_anterior + f_novo)
+        - 'anderson_bjorck': f_mantido *= 1 - f_novo / f_anterior (ou 1/2 se <= 0)
+    onde f_anterior é o valor no extremo substituído e f_novo o valor no
+    novo ponto. Todas recuperam convergência superlinear.
 """
 
-import sympy as sp
-from typing import List, Union
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Optional
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Estado, Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
 
-x = sp.Symbol('x')
+VARIANTES = ('classica', 'illinois', 'pegasus', 'anderson_bjorck')
 
-def falsaPosicao(a, b: float, func: sp.Expr, precisao: float, maxIter: int) -> List[Union[int,float]]:
+def _fator(variante: str, f_anterior: float, f_novo: float) -> float:
+    """Fator aplicado ao valor de f do extremo mantido pela segunda vez."""
+    if variante == 'illinois':
+        return 0.5
+    if variante == 'pegasus':
+        return f_anterior / (f_anterior + f_novo)
+    m = 1 - f_novo / f_anterior
+    return m if m > 0 else 0.5
+
+def falsaPosicao(a, b: float, func: sp.Expr, precisao: float, maxIter: int,
+                 registro: Optional[Registro] = None, variante: str = 'classica',
+                 estado: Optional[Estado] = None) -> Resultado:
+
+    if variante not in VARIANTES:
+        raise ValueError(f"Variante desconhecida: {variante}")
+    modificada = variante != 'classica'
   
-    if func.subs(x, a) * func.subs(x, b) >= 0:
-        return [-1, 0]  
+    f = avaliador.compilar(func)
+
+    mantido = 0  # -1: a foi mantido na última iteração, 1: b foi mantido
+    # extra: avaliações fora do laço, descontadas as iterações já feitas
+    if estado is not None and estado.iteracao is not None:
+        a, b, fa, fb, mantido = estado.a, estado.b, estado.fa, estado.fb, estado.mantido
+        inicio = estado.iteracao
+        extra = -inicio
+    else:
+        fa, fb = f(a), f(b)
+        inicio, extra = 0, 2
 
-    for i in range(maxIter):
-        fa, fb = func.subs(x, a), func.subs(x, b)
+        if math.isnan(fa) or math.isnan(fb):
+            logger.debug("f invalida nos extremos de [%g, %g]", a, b)
+            return Resultado(Status.VALOR_INVALIDO, avaliacoes_f=2)
+
+        if fa * fb >= 0:
+            logger.debug("Sem mudanca de sinal em [%g, %g]", a, b)
+            return Resultado(Status.SEM_MUDANCA_SINAL, avaliacoes_f=2)
+
+    c, fc = math.nan, math.nan
+    for i in range(inicio, maxIter):
         
         if abs(fb - fa) < 1e-15:
-            print("Erro: Divisao por zero")
-            return [-1,0]
+            logger.debug("Divisao por zero na iteracao %d", i)
+            return Resultado(Status.DIVISAO_ZERO, c, abs(fc), i, i + extra)
 
         c = a - fa*(b-a)/(fb-fa)
-        fc = func.subs(x, c)
+        fc = f(c)
 
-        if abs(fc) < precisao:
-            return [i, c] 
-        
+        if registro is not None:
+            registro.iteracao(i, c, fc, largura=abs(b - a))
+
+        # O intervalo é atualizado antes do teste de parada para que o estado
+        # guardado seja o da iteração seguinte
         if fa*fc < 0:
-            b = c
+            if modificada and mantido == -1:
+                fa *= _fator(variante, fb, fc)
+            b, fb = c, fc
+            mantido = -1
         else:
-            a = c
+            if modificada and mantido == 1:
+                fb *= _fator(variante, fa, fc)
+            a, fa = c, fc
+            mantido = 1
+
+        if abs(fc) < precisao:
+            if estado is not None:
+                estado.intervalo(i + 1, a, b, fa, fb, mantido=mantido)
+            return Resultado(Status.CONVERGIU, c, abs(fc), i + 1, i + 1 + extra)
 
-    return [-1,0]  
\ No newline at end of file
+    n = max(maxIter, inicio)
+    if estado is not None:
+        estado.intervalo(n, a, b, fa, fb, mantido=mantido)
+    return Resultado(Status.MAX_ITER, c, abs(fc), n, n + extra)
@@ -0,0 +1,280 @@
+"""
+Módulo: Métodos Fundidos (Geração de Código do Laço)
+Descrição: Gera, para cada expressão e cada método, uma função Python com o
+laço inteiro do método e a aritmética de f (e de f' no Newton) escrita
+dentro dele, sem nenhuma chamada de função por avaliação.
+
+Mesmo com f compilada, cada iteração dos métodos genéricos paga a chamada de
+f, a proteção contra erros de domínio e a conversão para float. Para funções
+baratas como x**2 - 4 (input.txt) esse custo é a maior parte do tempo do
+método. Aqui o laço não é reescrito à mão: a fonte do próprio método
+genérico (metodos.bisseccao, metodos.newton, ...) é lida com o módulo ast,
+a linha f = avaliador.compilar(func) é removida e cada chamada f(ponto) (ou
+df(ponto), a derivada) vira o código da expressão, gerado pelo compilador
+restrito (metodos.expressao) com o ponto no lugar de x e dentro de um try
+que transforma erros de domínio em NaN. O código é compilado com compile()
+uma única vez por expressão e método e fica em cache.
+
+Como a fonte é a mesma, as funções geradas têm os mesmos critérios de
+parada, status e contagens de iterações e avaliações dos métodos genéricos,
+inclusive o Registro e o Estado; a assinatura é a do método genérico sem
+func (e sem a derivada, no Newton).
+
+Vantagens:
+    - Sem custo de chamada por avaliação: mais rápido em funções baratas
+    - Nenhuma cópia dos métodos para manter em dia
+
+Desvantagens:
+    - Só para expressões do compilador restrito; as demais (e as funções
+      numéricas) seguem pelos métodos genéricos
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import functools
+import inspect
+import logging
+import math
+import re
+import sys
+import textwrap
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.newton
+import metodos.secante
+from metodos import avaliador
+from metodos.expressao import Expressao, ExpressaoInvalida, _arvore, _compilar, _Gerador, _NOMES_MATH, _usadas
+from metodos.instrumentacao import Registro
+from metodos.resultado import Estado, Resultado
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+# Métodos genéricos fundidos: a fonte de cada um é a base do código gerado.
+# Brent fica de fora: poucas avaliações por execução e muito trabalho entre
+# elas, e a versão fundida não foi mais rápida em benchmark.py fundido
+GENERICOS = {
+    'bisseccao': metodos.bisseccao.bisseccao,
+    'falsaPosicao': metodos.falsaPosicao.falsaPosicao,
+    'secante': metodos.secante.secante,
+    'newton': metodos.newton.newton,
+}
+
+# Nomes do código da expressão que poderiam colidir com as variáveis do
+# método (a constante e, as temporárias t0, t1, ...) ganham um _ na frente
+_RENOMEAR = re.compile(r"^(t\d+|" + "|".join(map(re.escape, _NOMES_MATH)) + r")$")
+_BASE = {'_' + nome: valor for nome, valor in _NOMES_MATH.items()}
+_BASE.update({'_nan': math.nan, '_ERROS': (ArithmeticError, ValueError, TypeError)})
+
+
+def _complexa(arvore: ast.Expression) -> bool:
+    """Uma potência de expoente não inteiro pode dar complexo (base negativa), que vira NaN."""
+    return any(isinstance(no, ast.BinOp) and isinstance(no.op, ast.Pow)
+               and not (isinstance(no.right, ast.Constant) and isinstance(no.right.value, int))
+               for no in ast.walk(arvore))
+
+
+def _avaliacao(arvore: ast.Expression, derivada: bool, destino: str, ponto: str) -> List[ast.stmt]:
+    """Comandos que calculam f (ou f') em ponto e guardam em destino, com NaN nos erros de domínio."""
+    gerador = _Gerador(variavel=ponto)
+    if derivada:
+        _, codigo = gerador.derivada(arvore.body)
+        codigo = codigo or '0.0'
+        linhas = [linha.strip() for linha in _usadas(gerador.linhas, codigo)]
+    else:
+        codigo, linhas = gerador.valor(arvore.body), []
+    if _complexa(arvore):
+        # Como float() em metodos.avaliador: um resultado complexo gera TypeError
+        codigo = f"float({codigo})"
+    corpo = "".join(f"    {linha}\n" for linha in linhas + [f"{destino} = {codigo}"])
+    comandos = ast.parse(f"try:\n{corpo}except _ERROS:\n    {destino} = _nan\n").body
+    for no in ast.walk(comandos[0]):
+        if isinstance(no, ast.Name) and no.id != ponto and _RENOMEAR.match(no.id):
+            no.id = '_' + no.id
+    return comandos
+
+
+class _Fusao(ast.NodeTransformer):
+    """
+    Troca, nos comandos simples do método, cada chamada f(ponto) pelo código
+    da expressão, emitido antes do comando.
+
+    funcoes: nome local da função compilada -> True para a derivada.
+    """
+
+    def __init__(self, arvore: ast.Expression, funcoes: Dict[str, bool]):
+        self.arvore = arvore
+        self.funcoes = funcoes
+        self.contador = 0
+        self.antes: List[ast.stmt] = []
+
+    def _chamada(self, no: ast.AST) -> bool:
+        return isinstance(no, ast.Call) and isinstance(no.func, ast.Name) and no.func.id in self.funcoes
+
+    def visit_Call(self, no: ast.Call) -> ast.AST:
+        self.generic_visit(no)
+        if not self._chamada(no):
+            return no
+        if len(no.args) != 1 or no.keywords:
+            raise ValueError(f"Chamada de {no.func.id} com mais de um argumento")
+        destino = f"_f{self.contador}"
+        self.contador += 1
+        ponto = no.args[0]
+        if not isinstance(ponto, ast.Name):
+            self.antes.append(ast.parse(f"_x{self.contador} = {ast.unparse(ponto)}").body[0])
+            ponto = ast.Name(f"_x{self.contador}")
+        self.antes.extend(_avaliacao(self.arvore, self.funcoes[no.func.id], destino, ponto.id))
+        return ast.Name(destino, ast.Load())
+
+    def comandos(self, corpo: List[ast.stmt]) -> List[ast.stmt]:
+        """Fundidos os comandos de um bloco, recursivamente nos blocos internos."""
+        novos = []
+        for comando in corpo:
+            for campo in ('body', 'orelse', 'finalbody'):
+                if isinstance(getattr(comando, campo, None), list):
+                    setattr(comando, campo, self.comandos(getattr(comando, campo)))
+            for tratador in getattr(comando, 'handlers', []):
+                tratador.body = self.comandos(tratador.body)
+
+            if not hasattr(comando, 'body'):
+                # fx = f(x): o código da expressão já guarda direto em fx
+                if (isinstance(comando, ast.Assign) and len(comando.targets) == 1
+                        and isinstance(comando.targets[0], ast.Name) and self._chamada(comando.value)
+                        and isinstance(comando.value.args[0], ast.Name)):
+                    novos.extend(_avaliacao(self.arvore, self.funcoes[comando.value.func.id],
+                                            comando.targets[0].id, comando.value.args[0].id))
+                    continue
+                self.antes = []
+                comando = self.visit(comando)
+                novos.extend(self.antes)
+            elif any(self._chamada(no) for campo in ('test', 'iter', 'items')
+                     for no in ast.walk(ast.Module(_cabecalho(comando, campo), []))):
+                raise ValueError(f"Chamada de f no cabecalho de {type(comando).__name__}")
+            novos.append(comando)
+        return novos
+
+
+def _cabecalho(comando: ast.stmt, campo: str) -> List[ast.AST]:
+    valor = getattr(comando, campo, None)
+    return [] if valor is None else [valor] if isinstance(valor, ast.AST) else list(valor)
+
+
+@functools.lru_cache(maxsize=None)
+def _arvore_generica(metodo: str) -> ast.FunctionDef:
+    return ast.parse(textwrap.dedent(inspect.getsource(GENERICOS[metodo]))).body[0]
+
+
+def gerar_fonte(texto: str, metodo: str) -> str:
+    """Fonte do método genérico com f (e f') do texto escrita no laço."""
+    arvore = _arvore(texto)
+    funcao = copy.deepcopy(_arvore_generica(metodo))
+
+    # f = avaliador.compilar(func) sai do corpo, e func (e a derivada) da assinatura
+    funcoes: Dict[str, bool] = {}
+    removidos = set()
+    corpo = []
+    for comando in funcao.body:
+        valor = getattr(comando, 'value', None)
+        if (isinstance(comando, ast.Assign) and isinstance(valor, ast.Call)
+                and ast.unparse(valor.func) == 'avaliador.compilar'):
+            argumento = valor.args[0].id
+            funcoes[comando.targets[0].id] = argumento != 'func'
+            removidos.add(argumento)
+        else:
+            corpo.append(comando)
+    if 'func' not in removidos:
+        raise ValueError(f"{metodo} nao compila func com avaliador.compilar")
+
+    funcao.body = _Fusao(arvore, funcoes).comandos(corpo)
+    funcao.args.args = [arg for arg in funcao.args.args if arg.arg not in removidos]
+    funcao.returns = None
+    for arg in funcao.args.args:
+        arg.annotation = None
+    return ast.unparse(ast.fix_missing_locations(funcao)) + "\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _fundido(texto: str, metodo: str) -> Callable[..., Resultado]:
+    # Os nomes globais são os do módulo do método (Status, logger, math, ...)
+    nomes = {**vars(sys.modules[GENERICOS[metodo].__module__]), **_BASE}
+    return _compilar(gerar_fonte(texto, metodo), nomes)[GENERICOS[metodo].__name__]
+
+
+def _texto(func) -> Optional[str]:
+    """Texto da expressão para o compilador restrito, ou None se func não pode ser fundida."""
+    if isinstance(func, Expressao):
+        return func.texto
+    if isinstance(func, str):
+        return func
+    if avaliador._simbolica(func):
+        # O texto do SymPy (x**2, exp, sqrt, Abs, pi, E) é aceito pelo compilador restrito
+        return str(func)
+    return None
+
+
+def compilar(func: Union[sp.Expr, str, Expressao, Callable], metodo: str) -> Optional[Callable[..., Resultado]]:
+    """
+    Função fundida de metodo para func, ou None se func está fora do
+    subconjunto do compilador restrito (ou já é uma função numérica).
+
+    Assinaturas (as dos métodos genéricos, sem func e sem a derivada):
+        bisseccao(a, b, intervalo, precisao, registro=None, estado=None)
+        falsaPosicao(a, b, precisao, maxIter, registro=None, variante='classica', estado=None)
+        secante(x0, x1, precisao, iteracao, registro=None, estado=None)
+        newton(x0, precisao, iteracoes, registro=None, estado=None)
+    """
+    if metodo not in GENERICOS:
+        raise ValueError(f"Metodo desconhecido: {metodo}")
+    texto = _texto(func)
+    if texto is None:
+        return None
+    try:
+        return _fundido(texto, metodo)
+    except ExpressaoInvalida:
+        logger.debug("Expressao fora do compilador restrito, sem versao fundida: %s", texto)
+        return None
+
+
+def bisseccao(a: float, b: float, intervalo: int, func, precisao: float,
+              registro: Optional[Registro] = None, estado: Optional[Estado] = None) -> Resultado:
+    """Bissecção fundida (metodos.bisseccao.bisseccao se func não pode ser fundida)."""
+    fundido = compilar(func, 'bisseccao')
+    if fundido is None:
+        return metodos.bisseccao.bisseccao(a, b, intervalo, func, precisao, registro, estado)
+    return fundido(a, b, intervalo, precisao, registro, estado)
+
+
+def falsaPosicao(a: float, b: float, func, precisao: float, maxIter: int,
+                 registro: Optional[Registro] = None, variante: str = 'classica',
+                 estado: Optional[Estado] = None) -> Resultado:
+    """Falsa Posição fundida (metodos.falsaPosicao.falsaPosicao se func não pode ser fundida)."""
+    fundido = compilar(func, 'falsaPosicao')
+    if fundido is None:
+        return metodos.falsaPosicao.falsaPosicao(a, b, func, precisao, maxIter, registro, variante, estado)
+    return fundido(a, b, precisao, maxIter, registro, variante, estado)
+
+
+def secante(x0: float, x1: float, func, precisao: float, iteracao: int,
+            registro: Optional[Registro] = None, estado: Optional[Estado] = None) -> Resultado:
+    """Secante fundida (metodos.secante.secante se func não pode ser fundida)."""
+    fundido = compilar(func, 'secante')
+    if fundido is None:
+        return metodos.secante.secante(x0, x1, func, precisao, iteracao, registro, estado)
+    return fundido(x0, x1, precisao, iteracao, registro, estado)
+
+
+def newton(x0: float, func, precisao: float, iteracoes: int,
+           registro: Optional[Registro] = None, estado: Optional[Estado] = None) -> Resultado:
+    """Newton fundido, com a derivada da diferenciação automática (metodos.newton.newton se não pode ser fundido)."""
+    fundido = compilar(func, 'newton')
+    if fundido is None:
+        return metodos.newton.newton(x0, func, avaliador.compilar_derivada(func), precisao, iteracoes,
+                                     registro, estado)
+    return fundido(x0, precisao, iteracoes, registro, estado)
+
@@ -0,0 +1,85 @@
+"""
+Módulo: Método de Halley
+Descrição: Implementa o método de Halley, que usa f, f' e f'' para encontrar
+zeros de funções duas vezes diferenciáveis.
+
+Em vez da reta tangente do Newton-Raphson, o passo de Halley ajusta uma
+hipérbole que acompanha também a curvatura de f:
+
+    x_novo = x - 2 f f' / (2 f'² - f f'')
+
+A convergência é cúbica: perto da raiz o número de dígitos corretos triplica
+a cada iteração. f, f' e f'' são avaliadas juntas, em uma única chamada
+compilada com as subexpressões comuns calculadas uma vez
+(avaliador.compilar_derivadas), de modo que uma iteração custa pouco mais
+que uma do Newton em funções transcendentes caras.
+
+Vantagens:
+    - Convergência cúbica: menos iterações que o Newton-Raphson
+    - Uma única avaliação fundida de f, f' e f'' por iteração
+
+Desvantagens:
+    - Requer a segunda derivada
+    - Como o Newton, pode divergir se a estimativa inicial for ruim
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Union
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+def halley(x0: float, func: Union[sp.Expr, str, Callable[[float], Tuple[float, ...]]], precisao: float,
+           iteracoes: int, registro: Optional[Registro] = None) -> Resultado:
+    """
+    Método de Halley a partir de x0.
+
+    func pode ser a expressão ou uma função que já retorna (f, f', f'').
+    Cada avaliação fundida conta como uma avaliação de f e uma de f'.
+    """
+    derivadas = avaliador.compilar_derivadas(func, 2)
+
+    xAtual = x0
+    fx, dfx, d2fx = derivadas(xAtual)
+
+    for i in range(iteracoes):
+        if abs(dfx) < 1e-15:
+            logger.debug("Derivada proxima de zero em x = %.6f", xAtual)
+            return Resultado(Status.DERIVADA_NULA, xAtual, abs(fx), i, i + 1, i + 1)
+
+        denominador = 2 * dfx * dfx - fx * d2fx
+        if denominador != 0:
+            novoX = xAtual - 2 * fx * dfx / denominador
+        else:
+            # Curvatura anula o denominador: passo de Newton
+            novoX = xAtual - fx / dfx
+
+        if math.isnan(novoX) or math.isinf(novoX):
+            logger.debug("novo x invalido na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, xAtual, abs(fx), i, i + 1, i + 1)
+
+        erro_x = abs(novoX - xAtual)
+
+        fx, dfx, d2fx = derivadas(novoX)
+        if math.isnan(fx):
+            logger.debug("Erro ao calcular f(x_novo) na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, novoX, fx, i + 1, i + 2, i + 2)
+        erro_f = abs(fx)
+
+        if registro is not None:
+            registro.iteracao(i, novoX, fx, passo=erro_x)
+
+        if (erro_f < precisao) or (erro_x < precisao):
+            return Resultado(Status.CONVERGIU, novoX, erro_f, i + 1, i + 2, i + 2)
+
+        xAtual = novoX
+
+    return Resultado(Status.MAX_ITER, xAtual, abs(fx), iteracoes, iteracoes + 1, iteracoes + 1)
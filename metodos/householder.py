@@ -0,0 +1,123 @@
+"""
+Módulo: Métodos de Householder
+Descrição: Implementa a família de métodos de Householder, que usa f e suas
+derivadas até a ordem d para encontrar zeros com convergência de ordem d + 1.
+
+O passo de ordem d é
+
+    x_novo = x + d (1/f)^(d-1)(x) / (1/f)^(d)(x)
+
+Com d = 1 é o Newton-Raphson e com d = 2 o método de Halley. Em termos dos
+coeficientes de Taylor ck = f^(k)(x) / k!, o passo é c0 s(d-1) / s(d), com
+s0 = 1 e sk = -(c1 s(k-1) + c0 c2 s(k-2) + ... + c0^(k-1) ck s0): só somas e
+produtos, sem dividir por f, que tende a zero perto da raiz.
+
+As derivadas vêm de uma única chamada compilada (avaliador.compilar_derivadas),
+com as subexpressões comuns calculadas uma vez. Com f cara de avaliar, subir
+a ordem reduz o custo por dígito correto: cada iteração custa pouco mais que
+uma do Newton e multiplica por d + 1 os dígitos corretos.
+
+Vantagens:
+    - Convergência de ordem d + 1 (quártica com o padrão d = 3)
+    - Uma única avaliação fundida de f e das d derivadas por iteração
+
+Desvantagens:
+    - Requer as derivadas até a ordem d
+    - Longe da raiz os passos de ordem alta podem ser piores que os do Newton
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple, Union
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+def passo(derivadas: Sequence[float], inversos: Optional[Sequence[float]] = None) -> float:
+    """
+    Passo de Householder de ordem d = len(derivadas) - 1 a partir de (f, f', ..., f^(d)).
+
+    inversos são os 1/k! (calculados aqui se omitidos). Retorna NaN quando
+    o denominador se anula.
+    """
+    d = len(derivadas) - 1
+    if d == 3:
+        # Forma fechada da ordem padrão: s2 = c1² - c0 c2, s3 = -c1 s2 - c0 c2 s1 - c0² c3
+        c0, c1, c2, c3 = derivadas[0], derivadas[1], derivadas[2] / 2, derivadas[3] / 6
+        s2 = c1 * c1 - c0 * c2
+        s3 = -c1 * s2 + c0 * (c2 * c1 - c0 * c3)
+        return c0 * s2 / s3 if s3 != 0 else math.nan
+    if inversos is None:
+        inversos = [1 / math.factorial(k) for k in range(d + 1)]
+    c = [v * q for v, q in zip(derivadas, inversos)]
+    c0 = c[0]
+    # s[k] = c0^k * (coeficiente k da série de 1/f), sem potências negativas de c0
+    s = [1.0]
+    for k in range(1, d + 1):
+        soma = 0.0
+        potencia = 1.0
+        for j in range(1, k + 1):
+            soma += c[j] * potencia * s[k - j]
+            potencia *= c0
+        s.append(-soma)
+    if s[d] == 0:
+        return math.nan
+    return c0 * s[d - 1] / s[d]
+
+
+def householder(x0: float, func: Union[sp.Expr, str, Callable[[float], Tuple[float, ...]]], precisao: float,
+                iteracoes: int, ordem: int = 3, registro: Optional[Registro] = None) -> Resultado:
+    """
+    Método de Householder de ordem ordem (1 = Newton, 2 = Halley) a partir de x0.
+
+    func pode ser a expressão ou uma função que já retorna (f, f', ..., f^(ordem)).
+    Cada avaliação fundida conta como uma avaliação de f e uma de f'.
+    """
+    if ordem < 1:
+        raise ValueError("A ordem deve ser pelo menos 1")
+    derivadas = avaliador.compilar_derivadas(func, ordem)
+    inversos = [1 / math.factorial(k) for k in range(ordem + 1)]
+
+    xAtual = x0
+    valores = derivadas(xAtual)
+    fx = valores[0]
+
+    for i in range(iteracoes):
+        if abs(valores[1]) < 1e-15:
+            logger.debug("Derivada proxima de zero em x = %.6f", xAtual)
+            return Resultado(Status.DERIVADA_NULA, xAtual, abs(fx), i, i + 1, i + 1)
+
+        novoX = xAtual + passo(valores, inversos)
+        if math.isnan(novoX):
+            # Denominador nulo na ordem pedida: passo de Newton
+            novoX = xAtual - fx / valores[1]
+
+        if math.isnan(novoX) or math.isinf(novoX):
+            logger.debug("novo x invalido na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, xAtual, abs(fx), i, i + 1, i + 1)
+
+        erro_x = abs(novoX - xAtual)
+
+        valores = derivadas(novoX)
+        fx = valores[0]
+        if math.isnan(fx):
+            logger.debug("Erro ao calcular f(x_novo) na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, novoX, fx, i + 1, i + 2, i + 2)
+        erro_f = abs(fx)
+
+        if registro is not None:
+            registro.iteracao(i, novoX, fx, passo=erro_x)
+
+        if (erro_f < precisao) or (erro_x < precisao):
+            return Resultado(Status.CONVERGIU, novoX, erro_f, i + 1, i + 2, i + 2)
+
+        xAtual = novoX
+
+    return Resultado(Status.MAX_ITER, xAtual, abs(fx), iteracoes, iteracoes + 1, iteracoes + 1)
@@ -0,0 +1,91 @@
+"""
+Módulo: Instrumentação dos Métodos
+Descrição: Registro opcional do custo real de cada método: quantas vezes f e
+f' foram avaliadas, quanto tempo foi gasto dentro das avaliações e quanto no
+próprio método, e a evolução de cada iteração.
+
+O número de iterações sozinho engana: uma iteração de Newton custa f e f', e
+os métodos de intervalo começam avaliando f(a) e f(b). Para medir, as funções
+são envolvidas por um Instrumento e ele é passado aos métodos pelo argumento
+opcional registro, que recebe os dados de cada iteração.
+
+Sem instrumento (registro=None, o padrão) os métodos pagam apenas uma
+comparação por iteração. Para guardar só o histórico, sem contagens nem
+tempos, basta passar um metodos.resultado.Traco como registro.
+
+Exemplo:
+    >>> inst = Instrumento()
+    >>> f = inst.envolver(avaliador.compilar(func))
+    >>> resultado = inst.medir(lambda: bisseccao(1, 3, 100, f, 1e-6, registro=inst))
+    >>> inst.avaliacoes_f, inst.tempo_avaliacao, inst.iteracoes[-1]
+"""
+
+import math
+import time
+from typing import Callable, List, Tuple, Union
+from metodos.resultado import Traco
+
+
+class Instrumento:
+    """Acumula contagens, tempos e o histórico de iterações de uma execução."""
+
+    __slots__ = ("avaliacoes_f", "avaliacoes_df", "tempo_avaliacao", "tempo_total", "traco")
+
+    def __init__(self, capacidade: int = 1024):
+        self.avaliacoes_f = 0
+        self.avaliacoes_df = 0
+        self.tempo_avaliacao = 0.0
+        self.tempo_total = 0.0
+        self.traco = Traco(capacidade)
+
+    def envolver(self, f: Callable[[float], float], derivada: bool = False) -> Callable[[float], float]:
+        """Retorna f contando suas chamadas e o tempo gasto nelas."""
+        relogio = time.perf_counter
+
+        if derivada:
+            def medida(v):
+                inicio = relogio()
+                resultado = f(v)
+                self.tempo_avaliacao += relogio() - inicio
+                self.avaliacoes_df += 1
+                return resultado
+        else:
+            def medida(v):
+                inicio = relogio()
+                resultado = f(v)
+                self.tempo_avaliacao += relogio() - inicio
+                self.avaliacoes_f += 1
+                return resultado
+        return medida
+
+    def iteracao(self, i: int, xi: float, fxi: float, largura: float = math.nan, passo: float = math.nan):
+        """Chamado pelos métodos ao fim de cada iteração."""
+        self.traco.iteracao(i, xi, fxi, largura, passo)
+
+    def medir(self, chamada: Callable[[], object]):
+        """Executa chamada() acumulando o tempo total e devolve seu resultado."""
+        inicio = time.perf_counter()
+        try:
+            return chamada()
+        finally:
+            self.tempo_total += time.perf_counter() - inicio
+
+    @property
+    def iteracoes(self) -> List[Tuple[float, ...]]:
+        """(iteração, x, |f(x)|, largura, passo) das iterações registradas; NaN
+        quando a medida não se aplica ao método."""
+        return self.traco.linhas()
+
+    @property
+    def avaliacoes(self) -> int:
+        """Total de avaliações, f e f' somadas."""
+        return self.avaliacoes_f + self.avaliacoes_df
+
+    @property
+    def tempo_metodo(self) -> float:
+        """Tempo gasto fora das avaliações (a lógica do próprio método), em segundos."""
+        return self.tempo_total - self.tempo_avaliacao
+
+
+# Qualquer objeto aceito pelo argumento registro dos métodos
+Registro = Union[Instrumento, Traco]
@@ -0,0 +1,319 @@
+"""
+Módulo: Métodos de Intervalo em Lote (NumPy)
+Descrição: Resolve milhares de problemas de busca de zeros de uma só vez,
+avançando todos os intervalos (ou estimativas iniciais) em paralelo com
+avaliação vetorizada.
+
+Quando a mesma família de equações precisa ser resolvida para muitos
+intervalos ou muitos valores de parâmetro (por exemplo, o tempo para a
+concentração de bactérias atingir cada um de milhares de níveis C), chamar
+bisseccao ou falsaPosicao em um laço Python custa uma chamada por problema.
+Aqui cada iteração avalia a função sobre todos os intervalos ainda ativos com
+uma única chamada NumPy; os intervalos que convergem são retirados do lote.
+
+Newton e Secante dependem muito das estimativas iniciais. newton_lote e
+secante_lote avançam um array inteiro de estimativas juntas; cada posição
+que falha (derivada nula, divisão por zero, valor inválido) recebe o seu
+status e sai do lote sem interromper as demais. Com uma malha de estimativas
+isso dá várias partidas de uma vez e o mapa das bacias de convergência (qual
+raiz cada x0 alcança e em quantas iterações).
+
+Retorno:
+    Três arrays com a forma do lote: raízes (NaN quando não encontrada),
+    índice da iteração de convergência (como o primeiro elemento do retorno
+    [i, raiz] dos métodos escalares, -1 quando não convergiu e 0 quando um
+    extremo do intervalo já é raiz) e código de status de cada problema.
+
+Códigos de status:
+    CONVERGIU, SEM_MUDANCA_SINAL, MAX_ITER, VALOR_INVALIDO, DIVISAO_ZERO,
+    DERIVADA_NULA
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Union
+from metodos import avaliador
+from metodos.resultado import Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+# Mesmos códigos de metodos.resultado.Status, usados nos arrays de status
+CONVERGIU = Status.CONVERGIU
+SEM_MUDANCA_SINAL = Status.SEM_MUDANCA_SINAL
+MAX_ITER = Status.MAX_ITER
+VALOR_INVALIDO = Status.VALOR_INVALIDO
+DIVISAO_ZERO = Status.DIVISAO_ZERO
+DERIVADA_NULA = Status.DERIVADA_NULA
+
+ResultadoLote = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _simbolos(parametros: Dict[str, object]) -> Tuple[sp.Symbol, ...]:
+    # Sem parâmetros o SymPy nem é importado
+    if not parametros:
+        return ()
+    sp = avaliador._sympy()
+    return tuple(sp.Symbol(nome) if isinstance(nome, str) else nome for nome in parametros)
+
+
+def _preparar(a, b, func, parametros: Optional[Dict[str, object]]):
+    """Compila func e faz o broadcast de a, b e parâmetros para a mesma forma."""
+    parametros = parametros or {}
+    f = avaliador.compilar_vetorial(func, _simbolos(parametros))
+
+    arrays = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                 *(np.asarray(v, dtype=float) for v in parametros.values()))
+    forma = arrays[0].shape
+    a, b = arrays[0].ravel().copy(), arrays[1].ravel().copy()
+    p = [v.ravel().copy() for v in arrays[2:]]
+    return f, a, b, p, forma
+
+
+def _iniciar(f, a, b, p):
+    n = a.size
+    raizes = np.full(n, np.nan)
+    iteracoes = np.full(n, -1, dtype=np.int64)
+    status = np.full(n, MAX_ITER, dtype=np.int8)
+
+    fa = f(a, *p)
+    fb = f(b, *p) if b is not a else fa
+    invalido = ~(np.isfinite(fa) & np.isfinite(fb))
+    status[invalido] = VALOR_INVALIDO
+    return raizes, iteracoes, status, fa, fb, invalido
+
+
+def _raiz_no_extremo(a, b, fa, fb, raizes, iteracoes, status, invalido) -> np.ndarray:
+    """Marca como convergidos os intervalos com f(a) ou f(b) igual a zero e os retorna."""
+    # Sem isso, fa * fb == 0 passa pelo teste de sinal e o intervalo nunca
+    # encolhe: o ponto médio não troca de sinal com o extremo nulo
+    em_a = (fa == 0) & ~invalido
+    em_b = (fb == 0) & ~invalido & ~em_a
+    raizes[em_a] = a[em_a]
+    raizes[em_b] = b[em_b]
+    exatas = em_a | em_b
+    iteracoes[exatas] = 0
+    status[exatas] = CONVERGIU
+    return exatas
+
+
+def bisseccao_lote(a, b, func: Union[sp.Expr, Callable], precisao: float, maxIter: int,
+                   parametros: Optional[Dict[str, object]] = None) -> ResultadoLote:
+    """
+    Método da Bissecção aplicado a um lote de intervalos [a_i, b_i].
+
+    Args:
+        a, b: Arrays (ou escalares) com os extremos de cada intervalo
+        func: Expressão em x, podendo conter os símbolos de parametros
+        precisao: Tolerância em |f(m)| e na largura do intervalo
+        maxIter: Número máximo de iterações
+        parametros: Dicionário nome -> array com o valor de cada parâmetro
+                    livre da expressão em cada problema do lote
+
+    Exemplo:
+        >>> C = np.linspace(5, 50, 10000)
+        >>> raizes, its, status = bisseccao_lote(0, 60, "80*exp(-2*x) + 20*exp(-0.1*x) - C",
+        ...                                      1e-6, 100, {"C": C})
+    """
+    f, a, b, p, forma = _preparar(a, b, func, parametros)
+    raizes, iteracoes, status, fa, fb, invalido = _iniciar(f, a, b, p)
+
+    sem_sinal = fa * fb > 0
+    status[sem_sinal] = SEM_MUDANCA_SINAL
+    exatas = _raiz_no_extremo(a, b, fa, fb, raizes, iteracoes, status, invalido)
+
+    idx = np.flatnonzero(~(sem_sinal | invalido | exatas))
+    a, b, fa, fb = a[idx], b[idx], fa[idx], fb[idx]
+    p = [v[idx] for v in p]
+
+    for i in range(maxIter):
+        if idx.size == 0:
+            break
+
+        m = (a + b) / 2
+        fm = f(m, *p)
+
+        conv = (np.abs(fm) < precisao) | (np.abs(a - b) < precisao)
+
+        esquerda = fm * fa < 0
+        direita = ~esquerda & (fm * fb < 0)
+        b = np.where(esquerda, m, b)
+        fb = np.where(esquerda, fm, fb)
+        a = np.where(direita, m, a)
+        fa = np.where(direita, fm, fa)
+
+        if conv.any():
+            feitos = idx[conv]
+            raizes[feitos] = m[conv]
+            iteracoes[feitos] = i
+            status[feitos] = CONVERGIU
+
+            resto = ~conv
+            idx, a, b, fa, fb = idx[resto], a[resto], b[resto], fa[resto], fb[resto]
+            p = [v[resto] for v in p]
+
+    return raizes.reshape(forma), iteracoes.reshape(forma), status.reshape(forma)
+
+
+def falsaPosicao_lote(a, b, func: Union[sp.Expr, Callable], precisao: float, maxIter: int,
+                      parametros: Optional[Dict[str, object]] = None) -> ResultadoLote:
+    """
+    Método da Falsa Posição aplicado a um lote de intervalos [a_i, b_i].
+
+    Os argumentos e o retorno são os mesmos de bisseccao_lote.
+    """
+    f, a, b, p, forma = _preparar(a, b, func, parametros)
+    raizes, iteracoes, status, fa, fb, invalido = _iniciar(f, a, b, p)
+
+    sem_sinal = fa * fb >= 0
+    status[sem_sinal & ~invalido] = SEM_MUDANCA_SINAL
+    _raiz_no_extremo(a, b, fa, fb, raizes, iteracoes, status, invalido)
+
+    idx = np.flatnonzero(~(sem_sinal | invalido))
+    a, b, fa, fb = a[idx], b[idx], fa[idx], fb[idx]
+    p = [v[idx] for v in p]
+
+    for i in range(maxIter):
+        if idx.size == 0:
+            break
+
+        divisao = np.abs(fb - fa) < 1e-15
+        with np.errstate(all='ignore'):
+            c = a - fa * (b - a) / (fb - fa)
+        fc = f(c, *p)
+
+        conv = ~divisao & (np.abs(fc) < precisao)
+
+        esquerda = fa * fc < 0
+        b = np.where(esquerda, c, b)
+        fb = np.where(esquerda, fc, fb)
+        a = np.where(esquerda, a, c)
+        fa = np.where(esquerda, fa, fc)
+
+        if divisao.any() or conv.any():
+            feitos = idx[divisao]
+            status[feitos] = DIVISAO_ZERO
+
+            feitos = idx[conv]
+            raizes[feitos] = c[conv]
+            iteracoes[feitos] = i
+            status[feitos] = CONVERGIU
+
+            resto = ~(conv | divisao)
+            idx, a, b, fa, fb = idx[resto], a[resto], b[resto], fa[resto], fb[resto]
+            p = [v[resto] for v in p]
+
+    return raizes.reshape(forma), iteracoes.reshape(forma), status.reshape(forma)
+
+
+def newton_lote(x0, func: Union[sp.Expr, Callable], precisao: float, maxIter: int,
+                parametros: Optional[Dict[str, object]] = None,
+                derivada: Optional[Union[sp.Expr, Callable]] = None) -> ResultadoLote:
+    """
+    Método de Newton-Raphson aplicado a um lote de estimativas iniciais x0_i.
+
+    Os critérios de parada e de falha são os do newton escalar, avaliados em
+    cada posição: |f'(x)| < 1e-15 dá DERIVADA_NULA e um novo x ou f(x) não
+    finito dá VALOR_INVALIDO, só para aquela posição.
+
+    Args:
+        x0: Array (ou escalar) de estimativas iniciais
+        func: Expressão em x, podendo conter os símbolos de parametros
+        precisao: Tolerância em |f(x)| e no tamanho do passo
+        maxIter: Número máximo de iterações
+        parametros: Como em bisseccao_lote
+        derivada: Derivada de func em x; obrigatória se func já é uma função
+                  numérica (para expressões é calculada pelo SymPy)
+
+    Exemplo (bacias de convergência de x³ - 5x² + 8x - 4):
+        >>> x0 = np.linspace(-2, 5, 10000)
+        >>> raizes, its, status = newton_lote(x0, "x**3 - 5*x**2 + 8*x - 4", 1e-10, 100)
+        >>> np.unique(np.round(raizes[status == CONVERGIU], 6))   # raízes alcançadas
+    """
+    f, x, _, p, forma = _preparar(x0, 0.0, func, parametros)
+    if derivada is None:
+        if callable(func) and not avaliador._simbolica(func):
+            raise ValueError("derivada e obrigatoria quando func ja e uma funcao numerica")
+        df = avaliador.compilar_derivada_vetorial(func, _simbolos(parametros or {}))
+    else:
+        df = avaliador.compilar_vetorial(derivada, _simbolos(parametros or {}))
+    raizes, iteracoes, status, fx, _, invalido = _iniciar(f, x, x, p)
+
+    idx = np.flatnonzero(~invalido)
+    x, fx = x[idx], fx[idx]
+    p = [v[idx] for v in p]
+
+    for i in range(maxIter):
+        if idx.size == 0:
+            break
+
+        dfx = df(x, *p)
+        nula = np.abs(dfx) < 1e-15
+        with np.errstate(all='ignore'):
+            novo = x - fx / dfx
+        fnovo = f(novo, *p)
+        invalido = ~nula & ~(np.isfinite(novo) & np.isfinite(fnovo))
+
+        conv = ~(nula | invalido) & ((np.abs(fnovo) < precisao) | (np.abs(novo - x) < precisao))
+        fim = nula | invalido | conv
+        if fim.any():
+            status[idx[nula]] = DERIVADA_NULA
+            status[idx[invalido]] = VALOR_INVALIDO
+
+            feitos = idx[conv]
+            raizes[feitos] = novo[conv]
+            iteracoes[feitos] = i
+            status[feitos] = CONVERGIU
+
+            resto = ~fim
+            idx, novo, fnovo = idx[resto], novo[resto], fnovo[resto]
+            p = [v[resto] for v in p]
+        x, fx = novo, fnovo
+
+    return raizes.reshape(forma), iteracoes.reshape(forma), status.reshape(forma)
+
+
+def secante_lote(x0, x1, func: Union[sp.Expr, Callable], precisao: float, maxIter: int,
+                 parametros: Optional[Dict[str, object]] = None) -> ResultadoLote:
+    """
+    Método da Secante aplicado a um lote de pares de estimativas (x0_i, x1_i).
+
+    Os critérios são os da secante escalar, avaliados em cada posição:
+    |f(x1) - f(x0)| < 1e-15 dá DIVISAO_ZERO e valores não finitos dão
+    VALOR_INVALIDO. Os argumentos e o retorno seguem newton_lote.
+    """
+    f, x0, x1, p, forma = _preparar(x0, x1, func, parametros)
+    raizes, iteracoes, status, fx0, fx1, invalido = _iniciar(f, x0, x1, p)
+
+    idx = np.flatnonzero(~invalido)
+    x0, x1, fx0, fx1 = x0[idx], x1[idx], fx0[idx], fx1[idx]
+    p = [v[idx] for v in p]
+
+    for i in range(maxIter):
+        if idx.size == 0:
+            break
+
+        divisao = np.abs(fx1 - fx0) < 1e-15
+        with np.errstate(all='ignore'):
+            x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        fx2 = f(x2, *p)
+        invalido = ~divisao & ~(np.isfinite(x2) & np.isfinite(fx2))
+
+        conv = ~(divisao | invalido) & ((np.abs(x2 - x1) < precisao) | (np.abs(fx2) < precisao))
+        fim = divisao | invalido | conv
+        if fim.any():
+            status[idx[divisao]] = DIVISAO_ZERO
+            status[idx[invalido]] = VALOR_INVALIDO
+
+            feitos = idx[conv]
+            raizes[feitos] = x2[conv]
+            iteracoes[feitos] = i
+            status[feitos] = CONVERGIU
+
+            resto = ~fim
+            idx, x1, x2, fx1, fx2 = idx[resto], x1[resto], x2[resto], fx1[resto], fx2[resto]
+            p = [v[resto] for v in p]
+        x0, x1, fx0, fx1 = x1, x2, fx1, fx2
+
+    return raizes.reshape(forma), iteracoes.reshape(forma), status.reshape(forma)
@@ -18,39 +18,69 @@ Desvantagens:
     - Não garante convergência
 """
 
-import sympy as sp
-from typing import List, Union
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional
 import math
-x = sp.Symbol('x')
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Estado, Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
 
-def newton(x0: float, func: sp.Expr, derivative: sp.Expr, precisao: float, iteracoes: int) -> List[Union[int, float]]:
+def newton(x0: float, func: sp.Expr, derivative: sp.Expr, precisao: float, iteracoes: int,
+           registro: Optional[Registro] = None, estado: Optional[Estado] = None) -> Resultado:
     
-    xAtual = x0
+    f = avaliador.compilar(func)
+    df = avaliador.compilar(derivative)
 
-    for i in range(iteracoes):
-        fx, dfx = func.subs(x, xAtual), derivative.subs(x, xAtual)
+    # extra: avaliações de f fora do laço, descontadas as iterações já feitas
+    if estado is not None and estado.iteracao is not None:
+        xAtual, fx = estado.x1, estado.fx1
+        inicio = estado.iteracao
+        extra = -inicio
+    else:
+        xAtual = x0
+        fx = f(xAtual)
+        inicio, extra = 0, 1
+    erro_x = math.nan
+
+    for i in range(inicio, iteracoes):
+        dfx = df(xAtual)
         
         if abs(dfx) < 1e-15:
-            print(f"Derivada proxima de zero em x = {xAtual:.6f}")
-            return [-1,0] 
+            logger.debug("Derivada proxima de zero em x = %.6f", xAtual)
+            return Resultado(Status.DERIVADA_NULA, xAtual, abs(fx), i, i + extra, i + 1 - inicio)
         
         novoX = xAtual - fx / dfx
 
         if math.isnan(novoX) or math.isinf(novoX):
-            print(f"novo x inválido na iteração {i+1}")
-            return [-1, 0]
+            logger.debug("novo x invalido na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, xAtual, abs(fx), i, i + extra, i + 1 - inicio)
 
         erro_x = abs(novoX-xAtual)
 
-        try:
-            erro_f = abs(float(func.subs(x, novoX)))
-        except Exception as e:
-            print(f"Erro ao calcular f(x_novo) na iteração {i+1}: {e}")
-            return [-1, 0]
+        fx = f(novoX)
+        if math.isnan(fx):
+            logger.debug("Erro ao calcular f(x_novo) na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, novoX, fx, i + 1, i + 1 + extra, i + 1 - inicio)
+        erro_f = abs(fx)
+
+        if registro is not None:
+            registro.iteracao(i, novoX, fx, passo=erro_x)
         
         if (erro_f < precisao) or (erro_x < precisao):
-            return [i, novoX]
+            if estado is not None:
+                estado.iterados(i + 1, math.nan, novoX, math.nan, fx, erro_x)
+            return Resultado(Status.CONVERGIU, novoX, erro_f, i + 1, i + 1 + extra, i + 1 - inicio)
 
         xAtual = novoX
         
-    return [-1,0] 
\ No newline at end of file
+    n = max(iteracoes, inicio)
+    if estado is not None:
+        estado.iterados(n, math.nan, xAtual, math.nan, fx, erro_x if n > inicio else estado.passo)
+    return Resultado(Status.MAX_ITER, xAtual, abs(fx), n, n + extra, n - inicio)
@@ -0,0 +1,317 @@
+"""
+Módulo: Caminho Rápido para Polinômios
+Descrição: Quando a função é um polinômio em x, trabalha diretamente com o
+array de coeficientes: avaliação de Horner, Newton com estimativa de
+multiplicidade e deflação por divisão sintética para obter todas as raízes
+reais.
+
+Para um polinômio, uma única passada de Horner sobre os coeficientes calcula
+p(x), p'(x) e p''(x) ao mesmo tempo, sem passar pela expressão simbólica.
+
+Em uma raiz de multiplicidade m (como x = 2 em x³ - 5x² + 8x - 4, que é
+dupla) o método de Newton converge apenas linearmente e os métodos de
+intervalo nem conseguem isolá-la, pois não há mudança de sinal. A
+multiplicidade é estimada a cada passo por
+
+    m ≈ p'² / (p'² - p·p'')
+
+(que tende a m exatamente na raiz), e o passo de Newton é multiplicado por
+ela, recuperando a convergência quadrática.
+
+Depois de cada raiz encontrada o polinômio é dividido m vezes por (x - r)
+(divisão sintética), e a busca continua no quociente, de grau menor, até não
+restarem raízes reais.
+
+Limitação: com grau alto e raízes muito próximas entre si, o próprio
+arredondamento dos coeficientes já desloca as raízes, e aglomerados podem ser
+reportados como uma raiz múltipla.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import sys
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
+from metodos.instrumentacao import Registro
+from metodos.resultado import Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+EPS = sys.float_info.epsilon
+
+
+def coeficientes(func: Union[sp.Expr, str]) -> Optional[List[float]]:
+    """
+    Coeficientes de func em potências decrescentes de x, ou None se func
+    não for um polinômio em x com coeficientes numéricos.
+    """
+    import sympy as sp
+
+    x = sp.Symbol('x')
+    if not isinstance(func, sp.Basic):
+        func = sp.sympify(func)
+    if func.free_symbols - {x} or not func.is_polynomial(x):
+        return None
+    try:
+        return [float(c) for c in sp.Poly(func, x).all_coeffs()]
+    except (TypeError, sp.PolynomialError):
+        return None
+
+
+def horner(coefs: Sequence[float], v: float) -> Tuple[float, float, float]:
+    """Avalia p(v), p'(v) e p''(v) em uma única passada de Horner."""
+    p = coefs[0]
+    dp = 0.0
+    d2p = 0.0
+    for c in coefs[1:]:
+        d2p = d2p * v + dp
+        dp = dp * v + p
+        p = p * v + c
+    return p, dp, 2 * d2p
+
+
+def deflacionar(coefs: Sequence[float], r: float) -> List[float]:
+    """Divide o polinômio por (x - r) por divisão sintética, descartando o resto."""
+    quociente = [coefs[0]]
+    for c in coefs[1:-1]:
+        quociente.append(c + r * quociente[-1])
+    return quociente
+
+
+def _newton_multiplicidade(coefs: Sequence[float], x0: float, precisao: float, maxIter: int,
+                           registro: Optional[Registro] = None,
+                           residuo: Optional[float] = None) -> Tuple[Resultado, int]:
+    """
+    Newton com passo multiplicado pela multiplicidade estimada; retorna (resultado, m).
+
+    Para quando |p| < residuo (por padrão, precisao) ou quando o passo fica
+    menor que precisao relativa a |x|.
+    """
+    if residuo is None:
+        residuo = precisao
+    grau = len(coefs) - 1
+    xAtual = x0
+    p, dp, d2p = horner(coefs, xAtual)
+    passadas = 1
+    m = 1
+
+    for i in range(maxIter):
+        # No ruído do arredondamento p não tem mais sinal nem tamanho
+        # confiáveis: o passo seguinte (e a estimativa de m) seriam ruído
+        if p == 0 or (i > 0 and _no_ruido(coefs, xAtual)):
+            return Resultado(Status.CONVERGIU, xAtual, abs(p), i, passadas, passadas), m
+
+        if abs(dp) < 1e-300:
+            logger.debug("Derivada nula em x = %.6f", xAtual)
+            return Resultado(Status.DERIVADA_NULA, xAtual, abs(p), i, passadas, passadas), m
+
+        denominador = dp * dp - p * d2p
+        m = min(grau, max(1, round(dp * dp / denominador))) if denominador > 0 else 1
+
+        passo = m * p / dp
+        novoX = xAtual - passo
+        pn, dpn, d2pn = horner(coefs, novoX)
+        passadas += 1
+
+        # Longe da raiz a estimativa de m pode exagerar o passo
+        if m > 1 and abs(pn) > abs(p):
+            m = 1
+            passo = p / dp
+            novoX = xAtual - passo
+            pn, dpn, d2pn = horner(coefs, novoX)
+            passadas += 1
+
+        if math.isnan(pn) or math.isinf(novoX):
+            logger.debug("Valor invalido na iteracao %d", i + 1)
+            return Resultado(Status.VALOR_INVALIDO, xAtual, abs(p), i, passadas, passadas), m
+
+        if registro is not None:
+            registro.iteracao(i, novoX, pn, passo=abs(passo))
+
+        if abs(pn) < residuo or abs(passo) < precisao * max(1.0, abs(novoX)):
+            return Resultado(Status.CONVERGIU, novoX, abs(pn), i + 1, passadas, passadas), m
+
+        xAtual = novoX
+        p, dp, d2p = pn, dpn, d2pn
+
+    return Resultado(Status.MAX_ITER, xAtual, abs(p), maxIter, passadas, passadas), m
+
+
+def newton_polinomio(coefs: Sequence[float], x0: float, precisao: float, maxIter: int,
+                     registro: Optional[Registro] = None) -> Resultado:
+    """
+    Newton sobre o polinômio de coeficientes coefs, com correção de multiplicidade.
+
+    Cada passada de Horner conta como uma avaliação de f e uma de f'.
+    """
+    return _newton_multiplicidade(coefs, x0, precisao, maxIter, registro)[0]
+
+
+def _multiplicidade(coefs: Sequence[float], r: float, precisao: float, estimada: int = 1) -> int:
+    """
+    Quantas vezes (x - r) divide o polinômio, a menos do erro de arredondamento.
+
+    Complementa a estimativa do Newton (estimada), que não é calculada quando
+    uma iteração cai exatamente na raiz. A tolerância sqrt(precisao) aceita o
+    erro de uma raiz múltipla, mas também aceitaria raízes simples vizinhas:
+    a segunda divisão exige que a estimativa do Newton indique raiz múltipla
+    ou que o quociente em r, que é p'(r), esteja no ruído do arredondamento.
+    """
+    m = 0
+    tolerancia = math.sqrt(precisao)
+    while len(coefs) > 1:
+        resto = horner(coefs, r)[0]
+        escala = horner([abs(c) for c in coefs], abs(r))[0]
+        if abs(resto) > tolerancia * escala:
+            break
+        if m == 1 and estimada == 1 and not _no_ruido(coefs, r):
+            break
+        coefs = deflacionar(coefs, r)
+        m += 1
+    return m
+
+
+def _quadratica(coefs: Sequence[float], precisao: float) -> List[Tuple[float, int]]:
+    a, b, c = coefs
+    disc = b * b - 4 * a * c
+    # Raízes mais próximas que sqrt(precisao) são tratadas como uma raiz dupla:
+    # o erro da deflação não permite separá-las
+    if math.sqrt(abs(disc)) <= 2 * abs(a) * math.sqrt(precisao) * max(1.0, abs(b / (2 * a))):
+        return [(-b / (2 * a), 2)]
+    if disc < 0:
+        return []
+    # Forma estável: evita cancelamento entre -b e sqrt(disc)
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    return [(q / a, 1), (c / q, 1)] if q != 0 else [(0.0, 2)]
+
+
+def _confirmar(original: Sequence[float], x: float, precisao: float,
+               raio: float) -> Optional[Tuple[Resultado, int]]:
+    """
+    Refina x no polinômio original e devolve o resultado (com a estimativa de
+    multiplicidade) se ele convergir a até raio de x, no ruído do arredondamento.
+
+    Serve às raízes múltiplas que a deflação desfez: no quociente elas viram um
+    par complexo próximo ou um ponto onde o Newton não converge, mas no
+    polinômio original continuam sendo raízes.
+    """
+    resultado, estimada = _newton_multiplicidade(original, x, precisao, 20, residuo=0.0)
+    if resultado.convergiu and abs(resultado.raiz - x) <= raio and _no_ruido(original, resultado.raiz):
+        return resultado, estimada
+    return None
+
+
+def _dupla(original: Sequence[float], coefs: Sequence[float], precisao: float) -> List[Tuple[float, int]]:
+    """Quociente quadrático sem raízes reais: raiz dupla se o centro for raiz do original."""
+    a, b, c = coefs
+    centro = -b / (2 * a)
+    afastamento = math.sqrt(abs(b * b - 4 * a * c)) / (2 * abs(a))
+    return [(centro, 2)] if _confirmar(original, centro, precisao, 4 * afastamento) else []
+
+
+def raizes_reais(func: Union[sp.Expr, str, Sequence[float]], precisao: float = 1e-12,
+                 maxIter: int = 100) -> List[Tuple[float, int]]:
+    """
+    Todas as raízes reais do polinômio, com suas multiplicidades, em ordem crescente.
+
+    Args:
+        func: Expressão polinomial em x ou lista de coeficientes (potências decrescentes)
+        precisao: Critério de parada do Newton em cada raiz (passo relativo a |x|)
+        maxIter: Número máximo de iterações por raiz
+
+    Exemplo:
+        >>> raizes_reais("x**3 - 5*x**2 + 8*x - 4")
+        [(1.0, 1), (2.0, 2)]
+    """
+    # Expressão (texto, SymPy ou Expressao) ou sequência de coeficientes
+    if isinstance(func, str) or not hasattr(func, '__len__'):
+        original = coefs = coeficientes(func)
+        if coefs is None:
+            raise ValueError(f"A funcao nao e um polinomio em x: {func}")
+    else:
+        original = coefs = [float(c) for c in func]
+
+    while len(coefs) > 1 and coefs[0] == 0:
+        coefs = coefs[1:]
+
+    raizes: List[Tuple[float, int]] = []
+
+    # Raiz em zero: coeficientes constantes nulos
+    zeros = 0
+    while len(coefs) > 1 and coefs[-1] == 0:
+        coefs = coefs[:-1]
+        zeros += 1
+    if zeros:
+        raizes.append((0.0, zeros))
+
+    while len(coefs) > 3:
+        # Começando de zero as raízes menores saem primeiro, o que reduz o
+        # erro acumulado pela deflação
+        limite = 1 + max(abs(c / coefs[0]) for c in coefs[1:])
+        for x0 in (0.0, limite, -limite, limite / 2, -limite / 2):
+            # Só o passo decide: |p| pode ser minúsculo longe das raízes
+            resultado, estimada = _newton_multiplicidade(coefs, x0, precisao, maxIter, residuo=0.0)
+            if resultado.convergiu or _no_ruido(coefs, resultado.raiz):
+                break
+        else:
+            confirmado = _confirmar(original, resultado.raiz, precisao, 1e-2 * max(1.0, abs(resultado.raiz)))
+            if confirmado is None:
+                # Nenhuma raiz real encontrada: o restante só tem raízes complexas
+                break
+            resultado, estimada = confirmado
+
+        # A deflação usa a raiz do próprio quociente; o refinamento no
+        # polinômio original fica para o final
+        r = resultado.raiz
+        m = max(1, _multiplicidade(coefs, r, precisao, estimada))
+        raizes.append((r, m))
+        for _ in range(m):
+            coefs = deflacionar(coefs, r)
+
+    if len(coefs) == 3:
+        raizes.extend(_quadratica(coefs, precisao) or _dupla(original, coefs, precisao))
+    elif len(coefs) == 2:
+        raizes.append((-coefs[1] / coefs[0], 1))
+
+    return _refinar(original, _agrupar(sorted(raizes), precisao), precisao)
+
+
+def _no_ruido(coefs: Sequence[float], v: float) -> bool:
+    """|p(v)| está abaixo do erro de arredondamento da avaliação de Horner."""
+    escala = horner([abs(c) for c in coefs], abs(v))[0]
+    return abs(horner(coefs, v)[0]) <= 2 * len(coefs) * EPS * escala
+
+
+def _agrupar(raizes: List[Tuple[float, int]], precisao: float) -> List[Tuple[float, int]]:
+    """
+    Junta raízes vizinhas que são a mesma raiz múltipla separada pelo
+    arredondamento: uma raiz de multiplicidade m só é determinada até
+    precisao ** (1/m), e a deflação a separa ainda um pouco mais.
+    """
+    agrupadas: List[Tuple[float, int]] = []
+    for r, m in raizes:
+        if agrupadas:
+            anterior, k = agrupadas[-1]
+            if r - anterior <= precisao ** (1 / (k + m + 1)) * max(1.0, abs(r)):
+                agrupadas[-1] = ((anterior * k + r * m) / (k + m), k + m)
+                continue
+        agrupadas.append((r, m))
+    return agrupadas
+
+
+def _refinar(original: Sequence[float], raizes: List[Tuple[float, int]],
+             precisao: float) -> List[Tuple[float, int]]:
+    """Refina cada raiz simples no polinômio original, sem deixá-la saltar para uma vizinha."""
+    refinadas = []
+    for k, (r, m) in enumerate(raizes):
+        if m == 1:
+            vizinhas = [abs(r - s) for j, (s, _) in enumerate(raizes) if j != k]
+            refinado, _ = _newton_multiplicidade(original, r, precisao, 5, residuo=0.0)
+            if not vizinhas or abs(refinado.raiz - r) < 0.5 * min(vizinhas):
+                r = refinado.raiz
+        refinadas.append((r, m))
+    return refinadas
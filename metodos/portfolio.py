@@ -0,0 +1,212 @@
+"""
+Módulo: Portfólio de Métodos
+Descrição: Executa vários métodos ao mesmo tempo sobre a mesma função e
+retorna o primeiro resultado que passa pela verificação do resíduo,
+cancelando os demais.
+
+Nenhum método é o melhor em todos os problemas: o Newton é o mais rápido
+perto da raiz mas pode divergir, a Bissecção sempre converge mas é lenta.
+Sem saber de antemão qual usar, rodar todos em sequência custa a soma dos
+tempos. O portfólio intercala os métodos (sem threads: cada trecho leva
+microssegundos e o GIL impediria ganho com paralelismo real), sempre
+avançando o que gastou menos avaliações até agora. Assim o custo fica perto
+de k vezes o do melhor método, com k o número de métodos, e nunca depende
+do pior.
+
+Os métodos são os próprios metodos.bisseccao, falsaPosicao, secante e
+newton, executados em trechos de iterações: cada chamada continua do
+metodos.resultado.Estado da anterior, como no refinamento incremental, e
+chega à mesma raiz, com as mesmas iterações, que uma execução isolada. O
+primeiro trecho é curto e os seguintes dobram, e um vencedor só encerra a
+corrida depois que todos os métodos fizeram o primeiro trecho: quem
+converge mais cedo na ordem de metodos não impede os demais de começar.
+
+Cada método tem um orçamento de avaliações de f e f': um Newton que diverge
+é abandonado ao esgotar o seu, sem impedir a resposta dos outros. Um método
+que declara convergência só vence se |f(raiz)| <= residuo; a Secante e o
+Newton param também pelo tamanho do passo, o que pode aceitar um ponto
+ruim (perto de um polo, por exemplo).
+
+Quando usar:
+    Quando não se sabe qual método funciona no problema e uma falha custa
+    caro. Em x**3 - 2*x + 2 com x0 = 0 o Newton cicla até o limite de
+    iterações (cerca de 65 microssegundos, sem raiz) e o portfólio acha a
+    raiz em cerca de 105. Nos problemas bem comportados dos arquivos de
+    exemplo ele gasta cerca de 4 vezes as avaliações do melhor método
+    isolado e de 7 a 13 vezes o seu tempo, pois o custo fixo de cada trecho
+    pesa quando o melhor método resolve em poucos microssegundos (python
+    benchmark.py executar); se o método certo é conhecido, ou se há um
+    intervalo com mudança de sinal, o Brent sozinho é mais rápido.
+
+Vantagens:
+    - Robustez do melhor método em cada problema, sem escolha prévia
+    - Um método divergente ou lento não atrasa a resposta
+
+Desvantagens:
+    - Custa mais que o melhor método isolado (os perdedores também avançam)
+    - Cada trecho tem o custo fixo de uma chamada do método
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, Union
+
+from metodos import avaliador
+from metodos.bisseccao import bisseccao
+from metodos.falsaPosicao import falsaPosicao
+from metodos.newton import newton
+from metodos.resultado import Estado, Resultado, Status
+from metodos.secante import secante
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+# Cada entrada recebe (a, b, x0, x1, f, df, precisao, ate, estado) e executa o
+# método até a iteração ate, continuando do estado da chamada anterior
+METODOS: Dict[str, Callable[..., Resultado]] = {
+    'bisseccao': lambda a, b, x0, x1, f, df, p, n, e: bisseccao(a, b, n, f, p, estado=e),
+    'falsaPosicao': lambda a, b, x0, x1, f, df, p, n, e: falsaPosicao(a, b, f, p, n, variante='illinois',
+                                                                      estado=e),
+    'secante': lambda a, b, x0, x1, f, df, p, n, e: secante(x0, x1, f, p, n, estado=e),
+    'newton': lambda a, b, x0, x1, f, df, p, n, e: newton(x0, f, df, p, n, estado=e),
+}
+
+# Avaliações de f e f' por iteração, para não passar do orçamento em um trecho
+CUSTO = {'bisseccao': 1, 'falsaPosicao': 1, 'secante': 1, 'newton': 2}
+# Primeiro trecho de iterações; os seguintes dobram (tantas iterações quantas
+# o método já fez), para diluir o custo fixo de cada chamada, cerca de 3
+# microssegundos, sem deixar um método muito à frente dos outros
+TRECHO = 2
+
+
+class ResultadoPortfolio:
+    """
+    Resultado de uma corrida do portfólio.
+
+    Atributos:
+        vencedor: Nome do método vencedor (None se nenhum passou na verificação)
+        resultado: Resultado do vencedor ou, sem vencedor, o de menor resíduo
+        avaliacoes: Avaliações gastas por método até o fim da corrida
+        estados: Situação final de cada método: o nome do Status com que
+            terminou, 'ORCAMENTO' se esgotou o orçamento, 'RESIDUO' se
+            declarou convergência mas falhou na verificação, ou 'CANCELADO'
+    """
+
+    __slots__ = ("vencedor", "resultado", "avaliacoes", "estados")
+
+    def __init__(self, vencedor: Optional[str], resultado: Resultado,
+                 avaliacoes: Dict[str, int], estados: Dict[str, str]):
+        self.vencedor = vencedor
+        self.resultado = resultado
+        self.avaliacoes = avaliacoes
+        self.estados = estados
+
+    @property
+    def convergiu(self) -> bool:
+        return self.vencedor is not None
+
+    @property
+    def avaliacoes_total(self) -> int:
+        """Avaliações somadas de todos os métodos, inclusive dos cancelados."""
+        return sum(self.avaliacoes.values())
+
+    def __repr__(self) -> str:
+        return f"ResultadoPortfolio(vencedor={self.vencedor!r}, {self.resultado!r}, estados={self.estados})"
+
+
+def portfolio(a: float, b: float, x0: float, x1: float, func: sp.Expr, precisao: float, maxIter: int,
+              derivada: Optional[Union[sp.Expr, Callable]] = None,
+              metodos: Sequence[str] = tuple(METODOS),
+              residuo: Optional[float] = None,
+              orcamento: Optional[Union[int, Dict[str, int]]] = None) -> ResultadoPortfolio:
+    """
+    Corre os métodos intercalados e retorna o primeiro que converge de fato.
+
+    Args:
+        a, b: Intervalo para Bissecção e Falsa Posição (Illinois)
+        x0, x1: Estimativas iniciais da Secante (x0 também do Newton)
+        func: Função (sp.Expr, Expressao, texto ou função já compilada)
+        precisao: Critério de parada de todos os métodos
+        maxIter: Máximo de iterações de cada método
+        derivada: f' para o Newton; calculada a partir de func se omitida
+        metodos: Nomes dos métodos da corrida (chaves de METODOS)
+        residuo: Maior |f(raiz)| aceito do vencedor; padrão sqrt(precisao)
+        orcamento: Máximo de avaliações de f e f' por método (um inteiro
+            para todos ou um dicionário por nome); padrão 2*maxIter + 2
+
+    Retorno:
+        ResultadoPortfolio com o vencedor e o gasto de cada método.
+    """
+    f = avaliador.compilar(func)
+    df = None
+    if 'newton' in metodos:
+        df = avaliador.compilar(derivada) if derivada is not None else avaliador.compilar_derivada(func)
+    if residuo is None:
+        residuo = math.sqrt(precisao)
+    if orcamento is None:
+        orcamento = 2*maxIter + 2
+    limites = orcamento if isinstance(orcamento, dict) else dict.fromkeys(metodos, orcamento)
+
+    gastos = dict.fromkeys(metodos, 0)
+    gastos_df = dict.fromkeys(metodos, 0)
+    estados: Dict[str, str] = {}
+    finais: Dict[str, Resultado] = {}
+
+    # Fila pelo gasto até agora: avança sempre o método que menos avaliou. A
+    # primeira rodada dá um trecho a cada método, na ordem de metodos, e só
+    # depois dela um vencedor encerra a corrida: nenhum método vence antes
+    # de todos terem avançado (todo trecho avalia f ao menos uma vez, então
+    # os que ainda não rodaram, com gasto 0, saem da fila primeiro). Cada
+    # entrada leva o que o método usa a cada trecho, para o laço não
+    # consultar dicionários
+    fila = [(0, ordem, nome, METODOS[nome], Estado(), limites.get(nome, math.inf), CUSTO.get(nome, 1))
+            for ordem, nome in enumerate(metodos)]
+    vencedor = None
+    while fila:
+        entrada = heapq.heappop(fila)
+        gasto, _, nome, metodo, estado, limite, custo = entrada
+        if vencedor is not None and gasto > 0:
+            break
+        feitas = estado.iteracao or 0
+        trecho = max(TRECHO, feitas)
+        if limite != math.inf:
+            trecho = max(1, min(trecho, int(limite - gasto) // custo))
+        r = metodo(a, b, x0, x1, f, df, precisao, min(feitas + trecho, maxIter), estado)
+        gasto += r.avaliacoes_f + r.avaliacoes_df
+        gastos[nome] = gasto
+        gastos_df[nome] += r.avaliacoes_df
+
+        if r.status == Status.MAX_ITER and r.iteracoes < maxIter:
+            if gasto >= limite:
+                logger.debug("%s esgotou o orcamento de %d avaliacoes", nome, limite)
+                estados[nome] = 'ORCAMENTO'
+                continue
+            heapq.heappush(fila, (gasto,) + entrada[1:])
+            continue
+
+        # Terminou: as avaliações do resultado passam a ser as de todos os trechos
+        resultado = Resultado(r.status, r.raiz, r.residuo, r.iteracoes,
+                              gasto - gastos_df[nome], gastos_df[nome])
+        finais[nome] = resultado
+        if not resultado.convergiu:
+            estados[nome] = resultado.status.name
+        elif abs(f(resultado.raiz)) <= residuo:
+            estados[nome] = resultado.status.name
+            if vencedor is None:
+                vencedor = nome
+        else:
+            logger.debug("%s convergiu para %g mas |f| excede %g", nome, resultado.raiz, residuo)
+            estados[nome] = 'RESIDUO'
+
+    estados = {nome: estados.get(nome, 'CANCELADO') for nome in metodos}
+
+    if vencedor is not None:
+        return ResultadoPortfolio(vencedor, finais[vencedor], gastos, estados)
+    candidatos = [r for r in finais.values() if not math.isnan(r.residuo)]
+    melhor = min(candidatos, key=lambda r: r.residuo) if candidatos else Resultado(Status.MAX_ITER)
+    return ResultadoPortfolio(None, melhor, gastos, estados)
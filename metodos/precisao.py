@@ -0,0 +1,166 @@
+"""
+Módulo: Precisão Adaptativa
+Descrição: Resolve em ponto flutuante de 64 bits e só passa para precisão
+arbitrária (mpmath) quando a tolerância pedida não pode ser atingida em
+float.
+
+Um float tem cerca de 16 dígitos significativos: perto de uma raiz r os
+valores de x estão espaçados de EPS*|r| e f(x) carrega um ruído de
+arredondamento que não diminui com mais iterações. Pedir precisao = 1e-30
+aos métodos em float faz a Bissecção esgotar as iterações sem nunca chegar
+lá, e o Newton parar em uma raiz com 16 dígitos corretos como se tivesse
+convergido.
+
+A política é:
+    1. Resolver em float com o método escolhido (o caso comum termina aqui,
+       sem custo extra e sem importar o mpmath).
+    2. Passar para o mpmath se a tolerância está abaixo do espaçamento dos
+       floats em torno da raiz, ou se o método falhou com o resíduo já no
+       nível do ruído de arredondamento de f (cancelamento numérico).
+    3. Polir a raiz do float com o Newton em precisão arbitrária, com
+       dígitos suficientes para a tolerância; partindo de 16 dígitos
+       corretos, poucas iterações bastam (convergência quadrática).
+
+Vantagens:
+    - Tolerâncias como 1e-30 funcionam, com a raiz retornada como mpmath.mpf
+    - O caso comum continua em float, tão rápido quanto antes
+
+Desvantagens:
+    - Em raízes múltiplas o Newton do polimento converge só linearmente
+    - Constantes de expressões do SymPy (fora do compilador restrito) têm
+      a precisão com que foram lidas (15 dígitos)
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Union
+
+from metodos import avaliador
+import metodos.bisseccao
+import metodos.brent
+import metodos.falsaPosicao
+import metodos.newton
+import metodos.secante
+from metodos.expressao import Expressao
+from metodos.resultado import Resultado, Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+EPS = sys.float_info.epsilon
+
+# Cada método recebe (a, b, x0, x1, f, df, precisao, maxIter)
+METODOS: Dict[str, Callable[..., Resultado]] = {
+    'bisseccao': lambda a, b, x0, x1, f, df, p, n: metodos.bisseccao.bisseccao(a, b, n, f, p),
+    'falsaPosicao': lambda a, b, x0, x1, f, df, p, n: metodos.falsaPosicao.falsaPosicao(a, b, f, p, n),
+    'secante': lambda a, b, x0, x1, f, df, p, n: metodos.secante.secante(x0, x1, f, p, n),
+    'newton': lambda a, b, x0, x1, f, df, p, n: metodos.newton.newton(x0, f, df, p, n),
+    'brent': lambda a, b, x0, x1, f, df, p, n: metodos.brent.brent(a, b, f, p, n),
+}
+
+
+def piso(raiz: float) -> float:
+    """Menor tolerância em x que o float consegue garantir em torno de raiz."""
+    return 4 * EPS * max(1.0, abs(raiz))
+
+
+def ruido(f: Callable[[float], float], raiz: float) -> float:
+    """
+    Nível do ruído de arredondamento de f perto de raiz.
+
+    Estimado pelo maior |f| nos floats vizinhos de raiz: tão perto da raiz
+    a variação real de f é desprezível e o que sobra é arredondamento.
+    """
+    vizinhos = [raiz]
+    for sentido in (-math.inf, math.inf):
+        v = raiz
+        for _ in range(2):
+            v = math.nextafter(v, sentido)
+            vizinhos.append(v)
+    return max(abs(f(v)) for v in vizinhos)
+
+
+def precisa_escalar(resultado: Resultado, f: Callable[[float], float], precisao: float) -> bool:
+    """True se o resultado em float não atende precisao e o mpmath pode atender."""
+    raiz = resultado.raiz
+    if math.isnan(raiz) or math.isinf(raiz):
+        return False
+    if resultado.convergiu:
+        return precisao < piso(raiz)
+    # Falha com o resíduo preso no ruído: o float não distingue mais f de zero
+    return resultado.residuo <= 2 * ruido(f, raiz)
+
+
+def digitos(precisao: float, raiz: float) -> int:
+    """Dígitos decimais de trabalho para representar raiz com erro abaixo de precisao."""
+    return max(20, math.ceil(math.log10(max(1.0, abs(raiz)) / precisao)) + 10)
+
+
+def polir(func: Union[sp.Expr, str, Expressao], x0: float, precisao: float, maxIter: int = 50,
+          dps: Optional[int] = None) -> Tuple[Resultado, int]:
+    """
+    Newton em precisão arbitrária a partir de x0.
+
+    Usa os mesmos critérios de parada do Newton em float (|f| ou |passo|
+    abaixo de precisao), com dps dígitos decimais (padrão: digitos()).
+
+    Retorno:
+        (Resultado com raiz do tipo mpmath.mpf, dígitos usados)
+    """
+    import mpmath
+
+    dps = dps or digitos(precisao, x0)
+    _, f_df = avaliador.compilar_mp(func)
+    with mpmath.workdps(dps):
+        x = mpmath.mpf(x0)
+        fx = mpmath.nan
+        for i in range(maxIter):
+            fx, dfx = f_df(x)
+            if mpmath.isnan(fx) or mpmath.isnan(dfx):
+                return Resultado(Status.VALOR_INVALIDO, x, float(abs(fx)), i, i + 1, i + 1), dps
+            if abs(fx) < precisao:
+                return Resultado(Status.CONVERGIU, x, float(abs(fx)), i, i + 1, i + 1), dps
+            if dfx == 0:
+                return Resultado(Status.DERIVADA_NULA, x, float(abs(fx)), i, i + 1, i + 1), dps
+            passo = fx / dfx
+            x -= passo
+            if abs(passo) < precisao:
+                fx, _ = f_df(x)
+                return Resultado(Status.CONVERGIU, x, float(abs(fx)), i + 1, i + 2, i + 1), dps
+        return Resultado(Status.MAX_ITER, x, float(abs(fx)), maxIter, maxIter, maxIter), dps
+
+
+def resolver(func: Union[sp.Expr, str, Expressao], precisao: float, metodo: str = 'brent',
+             a: float = math.nan, b: float = math.nan, x0: float = math.nan, x1: float = math.nan,
+             maxIter: int = 100) -> Tuple[Resultado, Optional[int]]:
+    """
+    Resolve em float e, se necessário, pole a raiz no mpmath.
+
+    Args:
+        func: Função (sp.Expr, Expressao ou texto)
+        precisao: Tolerância, podendo estar abaixo do alcance do float (1e-30)
+        metodo: Método da etapa em float (chaves de METODOS)
+        a, b: Intervalo (métodos de intervalo)
+        x0, x1: Estimativas iniciais (Secante e Newton)
+        maxIter: Máximo de iterações de cada etapa
+
+    Retorno:
+        (Resultado, dígitos): dígitos é None quando o float bastou; caso
+        contrário a raiz do Resultado é um mpmath.mpf com esses dígitos de
+        trabalho, e iterações e avaliações somam as duas etapas.
+    """
+    f = avaliador.compilar(func)
+    df = avaliador.compilar_derivada(func) if metodo == 'newton' else None
+    # O float não vai abaixo do próprio arredondamento: pedir menos que isso
+    # só faz o método gastar as iterações
+    escala = max((abs(v) for v in (a, b, x0, x1) if math.isfinite(v)), default=1.0)
+    resultado = METODOS[metodo](a, b, x0, x1, f, df, max(precisao, piso(escala)), maxIter)
+    if not precisa_escalar(resultado, f, precisao):
+        return resultado, None
+
+    polido, dps = polir(func, resultado.raiz, precisao, maxIter)
+    return Resultado(polido.status, polido.raiz, polido.residuo, resultado.iteracoes + polido.iteracoes,
+                     resultado.avaliacoes_f + polido.avaliacoes_f,
+                     resultado.avaliacoes_df + polido.avaliacoes_df), dps
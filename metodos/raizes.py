@@ -0,0 +1,142 @@
+"""
+Módulo: Busca de Todas as Raízes em um Intervalo
+Descrição: Varre [a,b] com avaliação vetorizada, isola cada mudança de sinal
+e refina todos os intervalos encontrados de uma só vez pela Bissecção em lote.
+
+Os métodos de intervalo recebem um único [a,b] e desistem quando f(a)*f(b) > 0,
+mesmo que existam várias raízes dentro dele (por exemplo, um número par de
+cruzamentos de uma função oscilante). Aqui o intervalo é amostrado em uma
+malha uniforme e cada par de amostras vizinhas com sinais opostos vira um
+intervalo para a Bissecção.
+
+Pares de raízes muito próximas (quase tangentes) não trocam de sinal entre
+duas amostras. Eles são detectados pelos mínimos locais de |f| cuja parábola
+pelos três pontos vizinhos indica que f chega a zero ou muito perto disso;
+apenas essas janelas são reamostradas, em uma malha mais fina, até ficarem
+mais estreitas que a precisão ou até a profundidade máxima. Um mínimo com |f|
+abaixo da precisão que não troca de sinal nem no nível mais fino é reportado
+como raiz tangente (raiz dupla, como x = 2 em input2.txt).
+
+Cada etapa trabalha somente sobre as janelas suspeitas da etapa anterior, de
+modo que o custo cresce linearmente com o número de amostras e de raízes.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING, Callable, List, Tuple, Union
+from metodos import avaliador
+from metodos.lote import bisseccao_lote, CONVERGIU
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+
+def isolar(func: Union[sp.Expr, Callable], a: float, b: float, precisao: float = 1e-6,
+           amostras: int = 1024, subdivisoes: int = 16,
+           profundidade: int = 6) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Isola as mudanças de sinal de func em [a,b].
+
+    Args:
+        func: Expressão em x (ou função vetorizada já compilada)
+        a, b: Extremos do intervalo
+        precisao: |f| abaixo do qual um mínimo local é aceito como raiz tangente
+        amostras: Número de subintervalos da malha inicial
+        subdivisoes: Número de subintervalos de cada janela reamostrada
+        profundidade: Número máximo de reamostragens de uma mesma janela
+
+    Retorno:
+        (esq, dir, exatas): extremos dos intervalos com mudança de sinal e as
+        abscissas onde f é zero (ou |f| < precisao em um mínimo tangente).
+    """
+    f = avaliador.compilar_vetorial(func)
+
+    xs = np.linspace(a, b, amostras + 1)[np.newaxis, :]
+    ys = f(xs)
+
+    esq: List[np.ndarray] = []
+    dir: List[np.ndarray] = []
+    exatas: List[np.ndarray] = [xs[ys == 0]]
+
+    t = np.linspace(0.0, 1.0, subdivisoes + 1)
+    for nivel in range(profundidade + 1):
+        troca = ys[:, :-1] * ys[:, 1:] < 0
+        esq.append(xs[:, :-1][troca])
+        dir.append(xs[:, 1:][troca])
+
+        linhas, colunas = _suspeitos(ys)
+        if linhas.size == 0:
+            break
+
+        # Uma janela ainda mais larga que a precisão pode esconder duas raízes
+        # simples próximas: ela é refinada até a troca de sinal aparecer, e
+        # só no nível mais fino um mínimo com |f| < precisao vira raiz tangente
+        if nivel == profundidade:
+            final = np.ones(linhas.size, dtype=bool)
+        else:
+            final = xs[linhas, colunas + 2] - xs[linhas, colunas] <= precisao
+        tangente = final & (np.abs(ys[linhas, colunas + 1]) < precisao)
+        exatas.append(_vertice(xs[linhas[tangente]], ys[linhas[tangente]], colunas[tangente]))
+        if nivel == profundidade:
+            break
+
+        linhas, colunas = linhas[~final], colunas[~final]
+        if linhas.size == 0:
+            break
+        inicio = xs[linhas, colunas]
+        fim = xs[linhas, colunas + 2]
+        xs = inicio[:, np.newaxis] + (fim - inicio)[:, np.newaxis] * t
+        ys = f(xs)
+        # As bordas de cada janela já foram avaliadas e têm o mesmo sinal do
+        # centro; só o interior pode conter zeros novos
+        exatas.append(xs[:, 1:-1][ys[:, 1:-1] == 0])
+
+    return np.concatenate(esq), np.concatenate(dir), np.unique(np.concatenate(exatas))
+
+
+def _suspeitos(ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Posições (linha, coluna da amostra anterior) dos mínimos locais de |f|
+    sem troca de sinal cuja parábola interpolante chega perto de zero.
+    """
+    y0, y1, y2 = ys[:, :-2], ys[:, 1:-1], ys[:, 2:]
+    curvatura = y2 - 2 * y1 + y0
+
+    with np.errstate(all='ignore'):
+        vertice = y1 - (y2 - y0) ** 2 / (8 * curvatura)
+        minimo = ((y0 * y1 > 0) & (y1 * y2 > 0) & (np.sign(y1) * curvatura > 0)
+                  & (np.abs(y1) <= np.abs(y0)) & (np.abs(y1) <= np.abs(y2)))
+        suspeito = minimo & ((vertice * y1 <= 0) | (np.abs(vertice) < 0.5 * np.abs(y1)))
+
+    return np.nonzero(suspeito)
+
+
+def _vertice(xs: np.ndarray, ys: np.ndarray, colunas: np.ndarray) -> np.ndarray:
+    """Abscissa do vértice da parábola pelas amostras colunas, colunas+1 e colunas+2."""
+    linhas = np.arange(colunas.size)
+    h = xs[linhas, colunas + 1] - xs[linhas, colunas]
+    y0, y1, y2 = ys[linhas, colunas], ys[linhas, colunas + 1], ys[linhas, colunas + 2]
+    return xs[linhas, colunas + 1] - h * (y2 - y0) / (2 * (y2 - 2 * y1 + y0))
+
+
+def todas_raizes(func: Union[sp.Expr, Callable], a: float, b: float, precisao: float = 1e-6,
+                 maxIter: int = 100, amostras: int = 1024, subdivisoes: int = 16,
+                 profundidade: int = 6) -> np.ndarray:
+    """
+    Retorna todas as raízes de func em [a,b], em ordem crescente.
+
+    Os argumentos são os mesmos de isolar; maxIter limita a Bissecção em lote
+    que refina cada intervalo isolado. A malha inicial deve ter amostras
+    suficientes para separar raízes que não sejam quase tangentes.
+
+    Exemplo:
+        >>> todas_raizes("sin(50*x)", 0, 10)      # 160 raízes
+        >>> todas_raizes("x**3 - 5*x**2 + 8*x - 4", 0, 3)   # [1, 2]
+    """
+    f = avaliador.compilar_vetorial(func)
+    esq, dir, exatas = isolar(f, a, b, precisao, amostras, subdivisoes, profundidade)
+
+    raizes, _, status = bisseccao_lote(esq, dir, f, precisao, maxIter)
+    raizes = np.concatenate([raizes[status == CONVERGIU], exatas])
+    return np.unique(raizes)
@@ -0,0 +1,179 @@
+"""
+Módulo: Refinamento Incremental
+Descrição: Armazena, por problema, o resultado e o estado final de cada
+método, para que uma nova execução com tolerância menor continue de onde a
+anterior parou em vez de recomeçar do intervalo [a,b] ou de x0.
+
+É comum resolver um problema com precisão 1e-6 e depois repeti-lo com
+1e-10. A sequência de pontos da Bissecção, da Falsa Posição, da Secante e do
+Newton não depende da precisão, só o momento de parar; o metodos.resultado.Estado
+guarda o ponto de partida da iteração seguinte (intervalo, últimos iterados
+e os valores de f já calculados neles). Com ele, o Armazem decide cada
+pedido assim:
+
+    - Reaproveitado: o ponto guardado já satisfaz a nova precisão (pelo
+      resíduo ou pelo critério de passo do método), ou o método falhou antes
+      com precisão igual ou menor; nenhuma avaliação de f
+    - Retomado: o método continua do estado guardado, pagando só as
+      iterações novas; a raiz e o total de iterações são os mesmos de uma
+      execução nova com a precisão pedida
+    - Novo: problema ainda não visto, ou falha com precisão maior (uma
+      precisão menos exigente poderia ter parado antes da falha)
+
+A chave do problema é o método, a função (texto sem espaços, expressão do
+SymPy ou a própria função Python), os pontos iniciais e a variante da
+Falsa Posição; a precisão e o máximo de iterações ficam fora dela. O máximo
+de iterações conta o total desde a primeira execução, como em uma execução
+nova. Nos resultados retomados, avaliacoes_f e avaliacoes_df contam só as
+avaliações feitas na chamada.
+
+Exemplo:
+    >>> armazem = Armazem()
+    >>> armazem.bisseccao(1, 3, 100, "x**2 - 5", 1e-6)
+    >>> armazem.bisseccao(1, 3, 100, "x**2 - 5", 1e-12)   # 21 avaliacoes novas
+    >>> armazem.origem
+    'retomado'
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+from metodos import avaliador
+from metodos.bisseccao import bisseccao
+from metodos.expressao import Expressao
+from metodos.falsaPosicao import falsaPosicao
+from metodos.newton import newton
+from metodos.resultado import Estado, Resultado, Status
+from metodos.secante import secante
+
+logger = logging.getLogger(__name__)
+
+# Status com estado para retomar; os demais são falhas definitivas
+RETOMAVEIS = (Status.CONVERGIU, Status.MAX_ITER)
+
+
+def _chave_funcao(func) -> Hashable:
+    """Identifica a função: texto sem espaços, ou a própria função Python."""
+    if isinstance(func, Expressao):
+        return "".join(func.texto.split())
+    if isinstance(func, str):
+        return "".join(func.split())
+    if callable(func) and not avaliador._simbolica(func):
+        return func
+    return "".join(str(func).split())
+
+
+class Solucao:
+    """Último resultado de um problema, com a precisão pedida e o estado final."""
+
+    __slots__ = ("resultado", "precisao", "estado")
+
+    def __init__(self, resultado: Resultado, precisao: float, estado: Optional[Estado]):
+        self.resultado = resultado
+        self.precisao = precisao
+        self.estado = estado
+
+    def satisfaz(self, precisao: float) -> bool:
+        """O ponto guardado atende à precisão pelos critérios de parada do método?"""
+        r = self.resultado
+        if r.status not in RETOMAVEIS or r.iteracoes == 0:
+            return False
+        return r.residuo < precisao or self.estado.passo < precisao
+
+
+class Armazem:
+    """
+    Resultados e estados dos métodos por problema, com descarte LRU.
+
+    Os métodos têm os mesmos argumentos dos métodos genéricos (sem registro).
+    Depois de cada chamada, origem diz como o pedido foi atendido: 'novo',
+    'retomado' ou 'reaproveitado'. Uma trava permite compartilhar o armazém
+    entre threads.
+
+    Args:
+        capacidade: Número máximo de problemas guardados
+    """
+
+    def __init__(self, capacidade: int = 1024):
+        self.capacidade = capacidade
+        self._solucoes: "OrderedDict[Hashable, Solucao]" = OrderedDict()
+        self._trava = threading.RLock()
+        self.origem: Optional[str] = None
+        self.contagem = {"novo": 0, "retomado": 0, "reaproveitado": 0}
+
+    def bisseccao(self, a: float, b: float, intervalo: int, func, precisao: float) -> Resultado:
+        return self._resolver(("bisseccao", _chave_funcao(func), a, b), precisao, intervalo,
+                              lambda estado: bisseccao(a, b, intervalo, func, precisao, estado=estado))
+
+    def falsaPosicao(self, a: float, b: float, func, precisao: float, maxIter: int,
+                     variante: str = 'classica') -> Resultado:
+        return self._resolver(("falsaPosicao", _chave_funcao(func), a, b, variante), precisao, maxIter,
+                              lambda estado: falsaPosicao(a, b, func, precisao, maxIter,
+                                                          variante=variante, estado=estado))
+
+    def secante(self, x0: float, x1: float, func, precisao: float, iteracao: int) -> Resultado:
+        return self._resolver(("secante", _chave_funcao(func), x0, x1), precisao, iteracao,
+                              lambda estado: secante(x0, x1, func, precisao, iteracao, estado=estado))
+
+    def newton(self, x0: float, func, derivative, precisao: float, iteracoes: int) -> Resultado:
+        return self._resolver(("newton", _chave_funcao(func), x0), precisao, iteracoes,
+                              lambda estado: newton(x0, func, derivative, precisao, iteracoes, estado=estado))
+
+    def _resolver(self, chave: Hashable, precisao: float, maxIter: int,
+                  executar: Callable[[Estado], Resultado]) -> Resultado:
+        with self._trava:
+            solucao = self._solucoes.get(chave)
+            if solucao is not None:
+                self._solucoes.move_to_end(chave)
+                r = solucao.resultado
+                if solucao.satisfaz(precisao):
+                    return self._reaproveitar(Resultado(Status.CONVERGIU, r.raiz, r.residuo, r.iteracoes))
+                if r.status not in RETOMAVEIS and (r.iteracoes == 0 or precisao <= solucao.precisao):
+                    return self._reaproveitar(Resultado(r.status, r.raiz, r.residuo, r.iteracoes))
+                if r.status in RETOMAVEIS and solucao.estado.iteracao >= maxIter:
+                    return self._reaproveitar(Resultado(Status.MAX_ITER, r.raiz, r.residuo, r.iteracoes))
+
+            if solucao is not None and solucao.resultado.status in RETOMAVEIS:
+                # Cópia: se a continuação falhar, o estado antigo não serve mais
+                estado = copy.copy(solucao.estado)
+                self.origem = "retomado"
+                logger.debug("%s retomado na iteracao %d (precisao %g -> %g)",
+                             chave[0], estado.iteracao, solucao.precisao, precisao)
+            else:
+                estado = Estado()
+                self.origem = "novo"
+            self.contagem[self.origem] += 1
+
+            resultado = executar(estado)
+            self._guardar(chave, Solucao(resultado, precisao,
+                                         estado if resultado.status in RETOMAVEIS else None))
+            return resultado
+
+    def _reaproveitar(self, resultado: Resultado) -> Resultado:
+        self.origem = "reaproveitado"
+        self.contagem["reaproveitado"] += 1
+        return resultado
+
+    def _guardar(self, chave: Hashable, solucao: Solucao):
+        self._solucoes[chave] = solucao
+        self._solucoes.move_to_end(chave)
+        if len(self._solucoes) > self.capacidade:
+            self._solucoes.popitem(last=False)
+
+    def limpar(self):
+        with self._trava:
+            self._solucoes.clear()
+
+    def estatisticas(self) -> Dict[str, int]:
+        return {"problemas": len(self._solucoes), **self.contagem}
+
+
+_armazem = Armazem()
+
+
+def armazem() -> Armazem:
+    """Armazém de resultados usado pelo programa interativo."""
+    return _armazem
@@ -0,0 +1,180 @@
+"""
+Módulo: Resultado dos Métodos
+Descrição: Tipos de retorno compartilhados pelos métodos: o código de status,
+o objeto Resultado e o Traco, histórico de iterações em buffer circular.
+
+Antes os métodos retornavam [i, raiz] ou a sentinela [-1, 0] e imprimiam o
+motivo da falha. Quem resolve muitos problemas não conseguia distinguir as
+falhas, e as impressões custavam tempo nos laços. O Resultado guarda status,
+raiz, resíduo |f(raiz)|, iterações e avaliações em um objeto com __slots__,
+e as mensagens vão para o logger de cada módulo (silencioso por padrão).
+
+O Estado guarda onde um método parou (intervalo, últimos iterados e os
+valores de f já calculados neles), para que uma nova execução com
+tolerância menor continue dali em vez de recomeçar.
+
+Compatibilidade:
+    Resultado continua se comportando como a lista [i, raiz]: resultado[0] é
+    o índice da última iteração (-1 em caso de falha) e resultado[1] a raiz
+    (0 em caso de falha).
+"""
+
+import enum
+import math
+from array import array
+from typing import List, Optional, Tuple
+
+
+class Status(enum.IntEnum):
+    """Motivo pelo qual um método terminou."""
+    CONVERGIU = 0
+    SEM_MUDANCA_SINAL = 1
+    MAX_ITER = 2
+    VALOR_INVALIDO = 3
+    DIVISAO_ZERO = 4
+    DERIVADA_NULA = 5
+
+
+class Resultado:
+    """Resultado de uma execução de um método escalar."""
+
+    __slots__ = ("status", "raiz", "residuo", "iteracoes", "avaliacoes_f", "avaliacoes_df")
+
+    def __init__(self, status: Status, raiz: float = math.nan, residuo: float = math.nan,
+                 iteracoes: int = 0, avaliacoes_f: int = 0, avaliacoes_df: int = 0):
+        self.status = status
+        self.raiz = raiz
+        self.residuo = residuo
+        self.iteracoes = iteracoes
+        self.avaliacoes_f = avaliacoes_f
+        self.avaliacoes_df = avaliacoes_df
+
+    @property
+    def convergiu(self) -> bool:
+        return self.status == Status.CONVERGIU
+
+    @property
+    def avaliacoes(self) -> int:
+        """Total de avaliações, f e f' somadas."""
+        return self.avaliacoes_f + self.avaliacoes_df
+
+    # Interface de lista [i, raiz] usada pelo código anterior
+    def __getitem__(self, indice: int):
+        return (max(self.iteracoes - 1, 0), self.raiz)[indice] if self.convergiu else (-1, 0)[indice]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self):
+        return iter((self[0], self[1]))
+
+    def __eq__(self, outro) -> bool:
+        if isinstance(outro, (list, tuple)):
+            return list(self) == list(outro)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (f"Resultado({self.status.name}, raiz={self.raiz!r}, residuo={self.residuo:.2e}, "
+                f"iteracoes={self.iteracoes}, avaliacoes={self.avaliacoes})")
+
+
+class Estado:
+    """
+    Ponto de partida da próxima iteração de um método, para retomá-lo.
+
+    Os métodos que recebem o argumento estado o preenchem ao terminar por
+    convergência ou por limite de iterações, e o usam como partida quando
+    ele já está preenchido (iteracao não é None). A sequência de pontos dos
+    métodos não depende da precisão, só o momento de parar; por isso retomar
+    com precisão menor chega exatamente à mesma raiz, com o mesmo número
+    total de iterações, que uma execução nova, sem repetir as avaliações
+    já feitas.
+
+    Atributos:
+        iteracao: Índice da próxima iteração (None: estado vazio)
+        a, b, fa, fb: Intervalo e valores de f nos extremos (Bissecção e
+                      Falsa Posição)
+        mantido: Extremo mantido na última iteração (Falsa Posição)
+        x0, x1, fx0, fx1: Dois últimos iterados e seus valores de f (Secante;
+                          o Newton usa x1 e fx1)
+        passo: Critério de passo da última iteração (largura do intervalo
+               ou |x_novo - x|), NaN quando não se aplica
+    """
+
+    __slots__ = ("iteracao", "a", "b", "fa", "fb", "mantido", "x0", "x1", "fx0", "fx1", "passo")
+
+    def __init__(self):
+        self.iteracao: Optional[int] = None
+        self.a = self.b = self.fa = self.fb = math.nan
+        self.mantido = 0
+        self.x0 = self.x1 = self.fx0 = self.fx1 = math.nan
+        self.passo = math.nan
+
+    def intervalo(self, iteracao: int, a: float, b: float, fa: float, fb: float,
+                  passo: float = math.nan, mantido: int = 0):
+        """Guarda o intervalo com que a iteração seguinte começaria."""
+        self.iteracao = iteracao
+        self.a, self.b, self.fa, self.fb = a, b, fa, fb
+        self.mantido = mantido
+        self.passo = passo
+
+    def iterados(self, iteracao: int, x0: float, x1: float, fx0: float, fx1: float,
+                 passo: float = math.nan):
+        """Guarda os iterados com que a iteração seguinte começaria."""
+        self.iteracao = iteracao
+        self.x0, self.x1, self.fx0, self.fx1 = x0, x1, fx0, fx1
+        self.passo = passo
+
+    def __repr__(self) -> str:
+        if self.iteracao is None:
+            return "Estado(vazio)"
+        if math.isnan(self.x1):
+            return f"Estado(iteracao={self.iteracao}, a={self.a!r}, b={self.b!r})"
+        return f"Estado(iteracao={self.iteracao}, x0={self.x0!r}, x1={self.x1!r})"
+
+
+class Traco:
+    """
+    Histórico das últimas iterações de um método, em buffer circular.
+
+    Os valores ficam em um array de floats alocado uma única vez; quando o
+    método passa de capacidade iterações, as mais antigas são sobrescritas.
+    Pode ser passado diretamente aos métodos pelo argumento registro.
+    """
+
+    __slots__ = ("dados", "capacidade", "total")
+
+    COLUNAS = ("iteracao", "x", "abs_f", "largura", "passo")
+
+    def __init__(self, capacidade: int = 128):
+        self.capacidade = capacidade
+        self.dados = array('d', bytes(8 * len(self.COLUNAS) * capacidade))
+        self.total = 0
+
+    def iteracao(self, i: int, xi: float, fxi: float, largura: float = math.nan, passo: float = math.nan):
+        """Registra uma iteração: x, |f(x)|, largura do intervalo e tamanho do passo."""
+        k = (self.total % self.capacidade) * 5
+        dados = self.dados
+        dados[k] = i
+        dados[k + 1] = xi
+        dados[k + 2] = abs(fxi)
+        dados[k + 3] = largura
+        dados[k + 4] = passo
+        self.total += 1
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacidade)
+
+    def linhas(self) -> List[Tuple[float, ...]]:
+        """Iterações guardadas, da mais antiga para a mais recente."""
+        inicio = self.total - len(self)
+        return [tuple(self.dados[k * 5:k * 5 + 5])
+                for k in (j % self.capacidade for j in range(inicio, self.total))]
+
+    def como_array(self):
+        """Iterações guardadas como array NumPy de forma (n, 5), em ordem."""
+        import numpy as np
+
+        bruto = np.frombuffer(self.dados, dtype=float).reshape(self.capacidade, 5)
+        inicio = self.total % self.capacidade if self.total > self.capacidade else 0
+        return np.roll(bruto, -inicio, axis=0)[:len(self)].copy()
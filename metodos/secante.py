@@ -17,44 +17,68 @@ Desvantagens:
     - Menos robusto que métodos de intervalo
 """
 
-import sympy as sp
+from __future__ import annotations
+
+import logging
 import math
-from typing import List, Union
+from typing import TYPE_CHECKING, Optional
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Estado, Resultado, Status
 
+if TYPE_CHECKING:
+    import sympy as sp
 
-x = sp.Symbol('x')
+logger = logging.getLogger(__name__)
 
-def secante(x0: float, x1:float, func: sp.Expr,precisao:float,iteracao:int)-> List[Union[int,float]]:
+def secante(x0: float, x1:float, func: sp.Expr,precisao:float,iteracao:int,
+            registro: Optional[Registro] = None, estado: Optional[Estado] = None)-> Resultado:
     
-    for i in range(iteracao):
-        fx0 = float(func.subs(x,x0))
-        fx1 = float(func.subs(x,x1))
+    f = avaliador.compilar(func)
+
+    # extra: avaliações fora do laço, descontadas as iterações já feitas
+    if estado is not None and estado.iteracao is not None:
+        x0, x1, fx0, fx1 = estado.x0, estado.x1, estado.fx0, estado.fx1
+        inicio = estado.iteracao
+        extra = -inicio
+    else:
+        fx0, fx1 = f(x0), f(x1)
+        inicio, extra = 0, 2
+
+    for i in range(inicio, iteracao):
 
         if math.isnan(fx0) or math.isnan(fx1) or math.isinf(fx0) or math.isinf(fx1):
-            print(f"Erro: Valores inválidos na iteração {i}")
-            return [-1, 0]
+            logger.debug("Valores invalidos na iteracao %d", i)
+            return Resultado(Status.VALOR_INVALIDO, x1, abs(fx1), i, i + extra)
         
         if abs(fx1 - fx0) < 1e-15:
-            print(f"Erro: Divisão por zero iminente na iteração {i} (f(x1) - f(x0) ≈ 0)")
-            return [-1, 0]
+            logger.debug("Divisao por zero iminente na iteracao %d (f(x1) - f(x0) ~ 0)", i)
+            return Resultado(Status.DIVISAO_ZERO, x1, abs(fx1), i, i + extra)
         
         x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
         
         if math.isnan(x2) or math.isinf(x2):
-            print(f"Erro: x2 inválido na iteração {i}")
-            return [-1, 0]
+            logger.debug("x2 invalido na iteracao %d", i)
+            return Resultado(Status.VALOR_INVALIDO, x1, abs(fx1), i, i + extra)
         
-        fx2 = float(func.subs(x, x2))
+        fx2 = f(x2)
         
         if math.isnan(fx2) or math.isinf(fx2):
-            print(f"Erro: f(x2) inválido na iteração {i}")
-            return [-1, 0]
+            logger.debug("f(x2) invalido na iteracao %d", i)
+            return Resultado(Status.VALOR_INVALIDO, x2, abs(fx2), i + 1, i + 1 + extra)
 
-        if(abs(x2-x1)<precisao) or abs(func.subs(x,x2))<precisao:
-            return [i,x2] 
+        if registro is not None:
+            registro.iteracao(i, x2, fx2, passo=abs(x2 - x1))
+
+        if(abs(x2-x1)<precisao) or abs(fx2)<precisao:
+            if estado is not None:
+                estado.iterados(i + 1, x1, x2, fx1, fx2, abs(x2 - x1))
+            return Resultado(Status.CONVERGIU, x2, abs(fx2), i + 1, i + 1 + extra)
         
         x0,x1 = x1,x2
+        fx0,fx1 = fx1,fx2
         
-    return [-1,0]
-
-        
+    n = max(iteracao, inicio)
+    if estado is not None:
+        estado.iterados(n, x0, x1, fx0, fx1, abs(x1 - x0))
+    return Resultado(Status.MAX_ITER, x1, abs(fx1), n, n + extra)
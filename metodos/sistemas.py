@@ -0,0 +1,333 @@
+"""
+Módulo: Sistemas de Equações Não Lineares
+Descrição: Resolve F(x) = 0 com n equações em n incógnitas pelo método de
+Newton amortecido (com busca linear) e pelo quase-Newton de Broyden.
+
+O restante do pacote trabalha com uma única variável x. Aqui as equações
+podem usar quaisquer nomes de incógnitas. A Jacobiana é montada
+simbolicamente uma única vez, derivando cada equação apenas em relação às
+incógnitas que nela aparecem (nos sistemas grandes quase todas as entradas
+são zero), e F e J são compiladas pelo lambdify com as subexpressões comuns
+extraídas (cse). F e J recebem e retornam arrays NumPy, e os sistemas
+lineares de cada passo são resolvidos pelo NumPy (LAPACK).
+
+Newton amortecido:
+    Resolve J(x) dx = -F(x) e aceita x + t dx com o maior t em 1, 1/2,
+    1/4, ... que reduza suficientemente ||F||² (condição de Armijo). Longe da
+    solução, os passos curtos evitam a divergência do Newton puro; perto
+    dela, t = 1 e a convergência é quadrática.
+
+Broyden:
+    Calcula J uma única vez e depois atualiza uma aproximação da sua inversa
+    com correções de posto um (Sherman-Morrison), a partir das variações de
+    x e de F: cada iteração custa uma avaliação de F e O(n²) operações, em
+    vez de uma Jacobiana e uma fatoração O(n³). A Jacobiana só é recalculada
+    se a busca linear não consegue mais reduzir ||F||.
+
+Vantagens:
+    - Jacobiana exata, derivada e compilada uma vez por sistema
+    - Broyden evita reavaliar J: bom quando J é cara ou n é grande
+
+Desvantagens:
+    - Newton exige uma fatoração densa O(n³) por iteração
+    - Broyden converge só superlinearmente e guarda uma matriz n x n
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from metodos import avaliador
+from metodos.instrumentacao import Registro
+from metodos.resultado import Status
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+logger = logging.getLogger(__name__)
+
+# Condição de Armijo: redução mínima de ||F||² em relação à prevista
+ARMIJO = 1e-4
+# Menor fração do passo tentada pela busca linear
+PASSO_MINIMO = 1.0 / 1024
+
+
+class ResultadoSistema:
+    """Resultado de uma execução de um método para sistemas."""
+
+    __slots__ = ("status", "x", "residuo", "iteracoes", "avaliacoes_F", "avaliacoes_J")
+
+    def __init__(self, status: Status, x: np.ndarray, residuo: float = math.nan, iteracoes: int = 0,
+                 avaliacoes_F: int = 0, avaliacoes_J: int = 0):
+        self.status = status
+        self.x = x
+        self.residuo = residuo
+        self.iteracoes = iteracoes
+        self.avaliacoes_F = avaliacoes_F
+        self.avaliacoes_J = avaliacoes_J
+
+    @property
+    def convergiu(self) -> bool:
+        return self.status == Status.CONVERGIU
+
+    def __repr__(self) -> str:
+        return (f"ResultadoSistema({self.status.name}, n={len(self.x)}, residuo={self.residuo:.2e}, "
+                f"iteracoes={self.iteracoes}, avaliacoes_F={self.avaliacoes_F}, "
+                f"avaliacoes_J={self.avaliacoes_J})")
+
+
+class Sistema:
+    """
+    F(x) = 0 com F e a Jacobiana J compiladas.
+
+    Args:
+        equacoes: Expressões (texto ou SymPy), cada uma igual a zero
+        variaveis: Incógnitas, na ordem dos vetores x (padrão: os símbolos
+            das equações em ordem alfabética)
+
+    Atributos:
+        n: Número de incógnitas
+        jacobiana: Entradas não nulas (i, j, dFi/dxj) da Jacobiana simbólica
+        F: Função array -> array com os valores das equações
+        J: Função array -> matriz n x n
+    """
+
+    __slots__ = ("equacoes", "variaveis", "n", "jacobiana", "F", "J")
+
+    def __init__(self, equacoes: Sequence[Union[str, sp.Expr]],
+                 variaveis: Optional[Sequence[Union[str, sp.Symbol]]] = None):
+        sp = avaliador._sympy()
+        self.equacoes: List[sp.Expr] = [sp.sympify(e) for e in equacoes]
+        if variaveis is None:
+            simbolos = set().union(*(e.free_symbols for e in self.equacoes))
+            variaveis = sorted(simbolos, key=lambda s: s.name)
+        self.variaveis: List[sp.Symbol] = [sp.Symbol(v) if isinstance(v, str) else v for v in variaveis]
+        self.n = len(self.variaveis)
+        if len(self.equacoes) != self.n:
+            raise ValueError(f"O sistema tem {len(self.equacoes)} equacoes e {self.n} incognitas")
+        livres = set().union(*(e.free_symbols for e in self.equacoes)) - set(self.variaveis)
+        if livres:
+            raise ValueError(f"Simbolos sem valor: {', '.join(sorted(s.name for s in livres))}")
+
+        indices = {v: j for j, v in enumerate(self.variaveis)}
+        self.jacobiana: List[Tuple[int, int, sp.Expr]] = []
+        for i, equacao in enumerate(self.equacoes):
+            # Deriva só as parcelas que contêm cada incógnita: numa equação
+            # com muitas parcelas, bem mais barato que sp.diff da soma inteira
+            termos = equacao.args if equacao.is_Add else (equacao,)
+            for v in sorted(equacao.free_symbols, key=lambda s: indices[s]):
+                derivada = sp.Add(*[termo.diff(v) for termo in termos if v in termo.free_symbols])
+                if derivada != 0:
+                    self.jacobiana.append((i, indices[v], derivada))
+
+        self.F = self._compilar_F()
+        self.J = self._compilar_J()
+
+    def _lambdify(self, expressoes: List[sp.Expr]) -> Callable:
+        # Floats do Python com o módulo math são mais rápidos que escalares
+        # NumPy; funções sem equivalente em math vêm do NumPy
+        return avaliador._sympy().lambdify(self.variaveis, expressoes, modules=['math', 'numpy'], cse=True)
+
+    def _compilar_F(self) -> Callable[[np.ndarray], np.ndarray]:
+        bruta = self._lambdify(self.equacoes)
+        invalido = np.full(self.n, math.nan)
+
+        def F(x: np.ndarray) -> np.ndarray:
+            try:
+                return np.array(bruta(*x.tolist()), dtype=float)
+            except (ArithmeticError, ValueError, TypeError):
+                return invalido.copy()
+
+        return F
+
+    def _compilar_J(self) -> Callable[[np.ndarray], np.ndarray]:
+        n = self.n
+        linhas = np.array([i for i, _, _ in self.jacobiana], dtype=np.intp)
+        colunas = np.array([j for _, j, _ in self.jacobiana], dtype=np.intp)
+        bruta = self._lambdify([d for _, _, d in self.jacobiana])
+
+        def J(x: np.ndarray) -> np.ndarray:
+            matriz = np.zeros((n, n))
+            try:
+                matriz[linhas, colunas] = bruta(*x.tolist())
+            except (ArithmeticError, ValueError, TypeError):
+                matriz.fill(math.nan)
+            return matriz
+
+        return J
+
+    def __repr__(self) -> str:
+        return f"Sistema(n={self.n}, entradas_jacobiana={len(self.jacobiana)})"
+
+
+def _norma2(v: np.ndarray) -> float:
+    return float(v @ v)
+
+
+def _busca_linear(F: Callable[[np.ndarray], np.ndarray], x: np.ndarray, fx: np.ndarray,
+                  dx: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    """
+    Busca linear com retrocesso sobre ||F||²: retorna (x novo, F(x novo), t, avaliações).
+
+    Se nenhum t satisfaz Armijo até PASSO_MINIMO, retorna o último passo
+    tentado com valores finitos (t negativo indica a falha ao chamador).
+    """
+    atual = _norma2(fx)
+    t = 1.0
+    avaliacoes = 0
+    ultimo = None
+    while t >= PASSO_MINIMO:
+        x_novo = x + t * dx
+        f_novo = F(x_novo)
+        avaliacoes += 1
+        norma = _norma2(f_novo)
+        if math.isfinite(norma):
+            if norma <= (1 - 2 * ARMIJO * t) * atual:
+                return x_novo, f_novo, t, avaliacoes
+            ultimo = (x_novo, f_novo)
+        t /= 2
+    if ultimo is None:
+        return x, fx, math.nan, avaliacoes
+    return ultimo[0], ultimo[1], -2 * t, avaliacoes
+
+
+def _inicial(sistema: Sistema, x0: Union[float, Sequence[float]]) -> np.ndarray:
+    return np.array(np.broadcast_to(np.asarray(x0, dtype=float), (sistema.n,)))
+
+
+def newton_sistema(sistema: Sistema, x0: Union[float, Sequence[float]], precisao: float, iteracoes: int,
+                   registro: Optional[Registro] = None) -> ResultadoSistema:
+    """
+    Newton amortecido com busca linear.
+
+    Para quando ||F(x)||∞ < precisao ou o passo de Newton ||dx||∞ < precisao,
+    como os métodos escalares. O critério do passo usa dx antes do
+    amortecimento e só vale se a busca linear satisfez Armijo. x0 pode ser
+    um vetor ou um número (repetido em todas as incógnitas). O registro
+    recebe, por iteração, ||F||∞ e o tamanho do passo (x fica NaN: não é
+    escalar).
+    """
+    x = _inicial(sistema, x0)
+    fx = sistema.F(x)
+    avaliacoes_F, avaliacoes_J = 1, 0
+    residuo = float(np.max(np.abs(fx), initial=0.0))
+    if not math.isfinite(residuo):
+        return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, 0, avaliacoes_F, avaliacoes_J)
+    if residuo < precisao:
+        return ResultadoSistema(Status.CONVERGIU, x, residuo, 0, avaliacoes_F, avaliacoes_J)
+
+    for i in range(iteracoes):
+        J = sistema.J(x)
+        avaliacoes_J += 1
+        if not np.all(np.isfinite(J)):
+            return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, i, avaliacoes_F, avaliacoes_J)
+        try:
+            dx = np.linalg.solve(J, -fx)
+        except np.linalg.LinAlgError:
+            # Jacobiana singular: passo de mínimos quadrados
+            logger.debug("Jacobiana singular na iteracao %d", i + 1)
+            dx = np.linalg.lstsq(J, -fx, rcond=None)[0]
+            if not np.any(dx):
+                return ResultadoSistema(Status.DERIVADA_NULA, x, residuo, i, avaliacoes_F, avaliacoes_J)
+        if not np.all(np.isfinite(dx)):
+            return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, i, avaliacoes_F, avaliacoes_J)
+
+        x_novo, fx, t, avaliacoes = _busca_linear(sistema.F, x, fx, dx)
+        avaliacoes_F += avaliacoes
+        if math.isnan(t):
+            logger.debug("F invalida em toda a busca linear na iteracao %d", i + 1)
+            return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, i, avaliacoes_F, avaliacoes_J)
+
+        erro_x = float(np.max(np.abs(x_novo - x)))
+        x = x_novo
+        residuo = float(np.max(np.abs(fx)))
+
+        if registro is not None:
+            registro.iteracao(i, math.nan, residuo, passo=erro_x)
+
+        # O passo amortecido t*dx fica curto perto de um mínimo local de ||F||
+        # que não é raiz; só o passo de Newton inteiro indica convergência
+        if residuo < precisao or (t > 0 and float(np.max(np.abs(dx))) < precisao):
+            return ResultadoSistema(Status.CONVERGIU, x, residuo, i + 1, avaliacoes_F, avaliacoes_J)
+
+    return ResultadoSistema(Status.MAX_ITER, x, residuo, iteracoes, avaliacoes_F, avaliacoes_J)
+
+
+def broyden(sistema: Sistema, x0: Union[float, Sequence[float]], precisao: float, iteracoes: int,
+            registro: Optional[Registro] = None) -> ResultadoSistema:
+    """
+    Quase-Newton de Broyden ("bom"), com atualização da inversa da Jacobiana.
+
+    A Jacobiana exata é calculada e invertida no início e sempre que a busca
+    linear falha (a aproximação deixou de ser uma direção de descida). Mesmos
+    critérios de parada e argumentos de newton_sistema.
+    """
+    x = _inicial(sistema, x0)
+    fx = sistema.F(x)
+    avaliacoes_F, avaliacoes_J = 1, 0
+    residuo = float(np.max(np.abs(fx), initial=0.0))
+    if not math.isfinite(residuo):
+        return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, 0, avaliacoes_F, avaliacoes_J)
+    if residuo < precisao:
+        return ResultadoSistema(Status.CONVERGIU, x, residuo, 0, avaliacoes_F, avaliacoes_J)
+
+    H = None
+    for i in range(iteracoes):
+        if H is None:
+            avaliacoes_J += 1
+            J = sistema.J(x)
+            if not np.all(np.isfinite(J)):
+                return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, i, avaliacoes_F, avaliacoes_J)
+            try:
+                H = np.linalg.inv(J)
+            except np.linalg.LinAlgError:
+                # Jacobiana singular: pseudo-inversa (passo de mínimos quadrados)
+                logger.debug("Jacobiana singular na iteracao %d", i + 1)
+                H = np.linalg.pinv(J)
+                if not np.any(H @ fx):
+                    return ResultadoSistema(Status.DERIVADA_NULA, x, residuo, i, avaliacoes_F, avaliacoes_J)
+            recalculada = True
+        else:
+            recalculada = False
+
+        dx = -(H @ fx)
+        if not np.all(np.isfinite(dx)):
+            return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, i, avaliacoes_F, avaliacoes_J)
+
+        x_novo, f_novo, t, avaliacoes = _busca_linear(sistema.F, x, fx, dx)
+        avaliacoes_F += avaliacoes
+        if math.isnan(t) or (t < 0 and not recalculada):
+            if recalculada:
+                return ResultadoSistema(Status.VALOR_INVALIDO, x, residuo, i, avaliacoes_F, avaliacoes_J)
+            # A aproximação não desce mais: recalcula a Jacobiana no mesmo ponto
+            logger.debug("Busca linear falhou na iteracao %d: recalculando J", i + 1)
+            H = None
+            continue
+
+        s = x_novo - x
+        y = f_novo - fx
+        # Sherman-Morrison: H += (s - H y) (s^T H) / (s^T H y)
+        Hy = H @ y
+        denominador = float(s @ Hy)
+        if denominador != 0 and math.isfinite(denominador):
+            H += np.outer(s - Hy, s @ H) / denominador
+        else:
+            H = None
+
+        erro_x = float(np.max(np.abs(s)))
+        x, fx = x_novo, f_novo
+        residuo = float(np.max(np.abs(fx)))
+
+        if registro is not None:
+            registro.iteracao(i, math.nan, residuo, passo=erro_x)
+
+        # O passo amortecido t*dx fica curto perto de um mínimo local de ||F||
+        # que não é raiz; só o passo de Newton inteiro indica convergência
+        if residuo < precisao or (t > 0 and float(np.max(np.abs(dx))) < precisao):
+            return ResultadoSistema(Status.CONVERGIU, x, residuo, i + 1, avaliacoes_F, avaliacoes_J)
+
+    return ResultadoSistema(Status.MAX_ITER, x, residuo, iteracoes, avaliacoes_F, avaliacoes_J)
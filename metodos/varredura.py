@@ -0,0 +1,218 @@
+"""
+Módulo: Varredura Paramétrica com Continuação
+Descrição: Resolve f(x; p) = 0 ao longo de uma grade de valores dos parâmetros
+livres da expressão, reaproveitando a raiz do ponto anterior como estimativa
+inicial do próximo (continuação pelo parâmetro natural).
+
+Os problemas de engenharia do projeto são, na prática, famílias de equações:
+o deslocamento 10*exp(-k*x)*cos(w*x) - 5 para vários k e w, ou a curva das
+bactérias para vários níveis de concentração. Entre dois pontos vizinhos da
+grade a raiz muda pouco, então partir da raiz anterior faz Newton e Secante
+convergirem em 2 ou 3 iterações em vez de recomeçar do x0 do usuário.
+
+A grade é percorrida em zigue-zague (a última dimensão vai e volta), de modo
+que pontos consecutivos sempre diferem em um único passo de um parâmetro.
+
+Salto de ramo:
+    Se o método aberto falhar ou a raiz encontrada se afastar mais que
+    `salto` da raiz anterior, considera-se que ele abandonou o ramo. Nesse
+    caso procura-se uma mudança de sinal em uma janela crescente em torno da
+    raiz anterior e o ponto é resolvido pela Bissecção dentro dela.
+
+Códigos de status:
+    CONTINUACAO, INTERVALO, FALHOU
+"""
+
+from __future__ import annotations
+
+import math
+import numpy as np
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+from metodos import avaliador
+from metodos.bisseccao import bisseccao
+from metodos.falsaPosicao import falsaPosicao
+from metodos.newton import newton
+from metodos.resultado import Resultado, Status
+from metodos.secante import secante
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+CONTINUACAO = 0
+INTERVALO = 1
+FALHOU = 2
+
+_NOMES_STATUS = {CONTINUACAO: "continuacao", INTERVALO: "intervalo", FALHOU: "falhou"}
+
+
+def _ordem_zigue_zague(tamanhos: Sequence[int]) -> List[Tuple[int, ...]]:
+    """Índices da grade em zigue-zague: pontos consecutivos diferem em um passo."""
+    ordem = [()]
+    for n in tamanhos:
+        nova = []
+        for i, prefixo in enumerate(ordem):
+            linha = range(n) if i % 2 == 0 else range(n - 1, -1, -1)
+            nova.extend(prefixo + (j,) for j in linha)
+        ordem = nova
+    return ordem
+
+
+def _isolar(f, centro: float, a: Optional[float], b: Optional[float],
+            maxDobras: int = 60) -> Optional[Tuple[float, float]]:
+    """
+    Procura a mudança de sinal mais próxima de centro, dobrando a janela.
+
+    Retorna o intervalo [esq, dir] com f(esq)*f(dir) <= 0, limitado a [a,b]
+    quando informado, ou None se nenhuma mudança de sinal for encontrada.
+    """
+    fc = f(centro)
+    if fc == 0:
+        return centro, centro
+
+    h = 1e-3 * (1 + abs(centro))
+    for _ in range(maxDobras):
+        esq, dir = centro - h, centro + h
+        if a is not None:
+            esq = max(esq, a)
+        if b is not None:
+            dir = min(dir, b)
+
+        fd, fe = f(dir), f(esq)
+        if fc * fd <= 0:
+            return centro, dir
+        if fe * fc <= 0:
+            return esq, centro
+
+        if (a is not None and esq <= a) and (b is not None and dir >= b):
+            return None
+        h *= 2
+    return None
+
+
+def varredura(func: Union[sp.Expr, str], grade: Dict[str, Sequence[float]], x0: float,
+              x1: Optional[float] = None, a: Optional[float] = None, b: Optional[float] = None,
+              precisao: float = 1e-6, maxIter: int = 100, metodo: str = 'newton',
+              salto: Optional[float] = None) -> np.ndarray:
+    """
+    Resolve func = 0 em cada ponto da grade de parâmetros com continuação.
+
+    Args:
+        func: Expressão em x e nos símbolos listados em grade
+        grade: Dicionário nome -> valores de cada parâmetro; a grade é o
+               produto cartesiano desses valores
+        x0: Estimativa inicial para o primeiro ponto da grade
+        x1: Segunda estimativa (Secante) para o primeiro ponto
+        a, b: Intervalo usado pelos métodos de intervalo no primeiro ponto e
+              como limite da busca de mudança de sinal nos demais
+        precisao: Critério de parada de cada resolução
+        maxIter: Número máximo de iterações de cada resolução
+        metodo: 'newton', 'secante', 'bisseccao' ou 'falsaPosicao'
+        salto: Distância máxima aceitável entre raízes de pontos vizinhos;
+               por padrão (b - a)/10, ou 1.0 sem intervalo
+
+    Retorno:
+        Array estruturado com um campo por parâmetro seguido de 'raiz'
+        (NaN quando não encontrada), 'iteracoes' e 'status', na ordem em
+        que os pontos foram resolvidos.
+
+    Exemplo:
+        >>> tabela = varredura("10*exp(-k*x)*cos(w*x) - 5",
+        ...                    {"k": np.linspace(0.3, 0.7, 21), "w": np.linspace(1.5, 2.5, 21)},
+        ...                    x0=0.5, a=0, b=2)
+        >>> imprimir_tabela(tabela)
+    """
+    sp = avaliador._sympy()
+    if not isinstance(func, sp.Basic):
+        func = sp.sympify(func)
+    if metodo not in ('newton', 'secante', 'bisseccao', 'falsaPosicao'):
+        raise ValueError(f"Metodo desconhecido: {metodo}")
+
+    nomes = list(grade)
+    valores = [np.asarray(grade[nome], dtype=float).ravel() for nome in nomes]
+    simbolos = tuple(sp.Symbol(nome) for nome in nomes)
+
+    fp = avaliador.compilar_parametrico(func, simbolos)
+    dfp = avaliador.compilar_parametrico(avaliador.derivada(func), simbolos) if metodo == 'newton' else None
+
+    if salto is None:
+        salto = (b - a) / 10 if a is not None and b is not None else 1.0
+
+    campos = [(nome, float) for nome in nomes] + [('raiz', float), ('iteracoes', np.int64), ('status', np.int8)]
+    ordem = _ordem_zigue_zague([v.size for v in valores])
+    tabela = np.zeros(len(ordem), dtype=campos)
+
+    anterior = None
+    for linha, indice in enumerate(ordem):
+        p = tuple(v[j] for v, j in zip(valores, indice))
+
+        def f(v, p=p):
+            return fp(v, *p)
+
+        raiz, iteracoes, status = _resolver(f, dfp, p, anterior, x0, x1, a, b,
+                                            precisao, maxIter, metodo, salto)
+
+        tabela[linha] = p + (raiz, iteracoes, status)
+        if status != FALHOU:
+            anterior = raiz
+
+    return tabela
+
+
+def _resolver(f, dfp, p, anterior, x0, x1, a, b, precisao, maxIter, metodo, salto):
+    """Resolve um ponto da grade; retorna (raiz, iterações, status)."""
+    if anterior is None:
+        inicio, janela = x0, (a, b) if a is not None and b is not None else None
+        segundo = x1 if x1 is not None else x0 + 1e-4 * (1 + abs(x0))
+    else:
+        inicio, janela = anterior, None
+        segundo = anterior + 1e-4 * (1 + abs(anterior))
+
+    resultado = Resultado(Status.SEM_MUDANCA_SINAL)
+    if metodo == 'newton':
+        resultado = newton(inicio, f, lambda v: dfp(v, *p), precisao, maxIter)
+    elif metodo == 'secante':
+        resultado = secante(inicio, segundo, f, precisao, maxIter)
+    else:
+        if janela is None:
+            janela = _isolar(f, inicio, a, b)
+        if janela is not None and metodo == 'bisseccao':
+            resultado = bisseccao(janela[0], janela[1], maxIter, f, precisao)
+        elif janela is not None:
+            resultado = falsaPosicao(janela[0], janela[1], f, precisao, maxIter)
+
+    if resultado.convergiu:
+        raiz = resultado.raiz
+        dentro = (a is None or raiz >= a) and (b is None or raiz <= b)
+        if dentro and (anterior is None or abs(raiz - anterior) <= salto):
+            return raiz, resultado.iteracoes, CONTINUACAO
+
+    # Ramo perdido: volta a um método de intervalo perto da raiz anterior
+    janela = _isolar(f, inicio, a, b)
+    if janela is not None:
+        if janela[0] == janela[1]:
+            return janela[0], 0, INTERVALO
+        resultado = bisseccao(janela[0], janela[1], maxIter, f, precisao)
+        if resultado.convergiu:
+            return resultado.raiz, resultado.iteracoes, INTERVALO
+
+    return math.nan, 0, FALHOU
+
+
+def imprimir_tabela(tabela: np.ndarray, casas: int = 8):
+    """Imprime o resultado de varredura como uma tabela de colunas alinhadas."""
+    nomes = [nome for nome in tabela.dtype.names if nome not in ('raiz', 'iteracoes', 'status')]
+
+    cabecalho = "".join(f"{nome:<12}" for nome in nomes)
+    print(f"{cabecalho}{'Raiz':<18} {'Iteracoes':<10} {'Status':<12}")
+    print("-" * (12 * len(nomes) + 42))
+    for linha in tabela:
+        params = "".join(f"{linha[nome]:<12.6g}" for nome in nomes)
+        print(f"{params}{linha['raiz']:<18.{casas}f} {linha['iteracoes']:<10d} "
+              f"{_NOMES_STATUS[int(linha['status'])]:<12}")
+
+    iteracoes = tabela['iteracoes'][tabela['status'] != FALHOU]
+    if iteracoes.size:
+        print("-" * (12 * len(nomes) + 42))
+        print(f"Media de iteracoes por ponto: {iteracoes.mean():.2f} "
+              f"({np.count_nonzero(tabela['status'] == INTERVALO)} recuperados por intervalo, "
+              f"{np.count_nonzero(tabela['status'] == FALHOU)} falhas)")
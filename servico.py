@@ -0,0 +1,368 @@
+"""
+Módulo: Serviço HTTP de Solução
+Descrição: Servidor HTTP local (biblioteca padrão) que expõe os métodos do
+pacote metodos para outros serviços, com os mesmos campos de problema do
+modo em fluxo (fluxo.py).
+
+Endpoints:
+    POST /resolver   um problema em JSON; responde com um resultado
+    POST /lote       {"problemas": [...]}; responde {"resultados": [...]}
+    GET  /saude      estado do serviço e do cache de expressões
+
+As funções são lidas só pelo compilador restrito (metodos.expressao), como
+no modo em fluxo: o sympify executaria o texto recebido como código Python.
+Textos fora do subconjunto aceito recebem o motivo no campo erro.
+
+Agrupamento de pedidos:
+    Pedidos simultâneos de Bissecção, Falsa Posição, Newton ou Secante com
+    a mesma função, precisão e limite de iterações são reunidos e
+    resolvidos juntos. O primeiro pedido de um grupo espera uma janela curta
+    (--janela, em milissegundos) para que os outros cheguem, resolve o grupo
+    inteiro e entrega a cada pedido o seu resultado. Grupos com pelo menos
+    --minimo pedidos vão para uma única chamada vetorizada de metodos.lote;
+    os menores são resolvidos pelos métodos escalares na mesma passada. Os
+    demais métodos são resolvidos diretamente, e todos usam o mesmo cache de
+    funções compiladas do avaliador. Se o líder falha, todos os pedidos do
+    grupo recebem o erro no campo erro, e nenhum espera mais que ESPERA
+    segundos pelo grupo.
+
+    O padrão de --minimo (MINIMO) vem de python carga_servico.py
+    --cruzamento: o lote ficou mais rápido que os métodos escalares a partir
+    de 32 a 48 pedidos por grupo (Bissecção, Newton e Secante; a Falsa
+    Posição não compensou até 128). Um grupo nunca passa do número de
+    clientes simultâneos: com o teste de carga padrão (64 clientes) os
+    grupos passam de MINIMO e seguem pelo lote.
+
+Uso:
+    python servico.py [--endereco 127.0.0.1] [--porta 8080] [--janela 2] [--maximo 4096] [--minimo 32]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import fluxo
+import metodos.lote
+from metodos import avaliador
+from metodos.resultado import Status
+
+logger = logging.getLogger(__name__)
+
+# Métodos com versão vetorizada, que podem ser agrupados: função do lote,
+# campos com as estimativas de cada problema e avaliações de f e f' (fixas,
+# por iteração) do método escalar, que o lote repete ponto a ponto
+VETORIZADOS = {
+    "bisseccao": (metodos.lote.bisseccao_lote, ("a", "b"), (2, 1)),
+    "falsaPosicao": (metodos.lote.falsaPosicao_lote, ("a", "b"), (2, 1)),
+    "newton": (metodos.lote.newton_lote, ("x0",), (1, 2)),
+    "secante": (metodos.lote.secante_lote, ("x0", "x1"), (2, 1)),
+}
+
+# Espera máxima, em segundos, de um pedido pelo resultado do seu grupo
+ESPERA = 30.0
+# Menor grupo resolvido pelo lote vetorizado: abaixo disso os métodos escalares
+# são mais rápidos (medido com python carga_servico.py --cruzamento)
+MINIMO = 32
+# Nome do status de quem convergiu no lote (o acesso ao membro do Enum é lento)
+_CONVERGIU = Status.CONVERGIU.name
+
+
+class _Pedido:
+    __slots__ = ("problema", "resultado", "pronto")
+
+    def __init__(self, problema: Dict[str, object]):
+        self.problema = problema
+        self.resultado: Optional[Dict[str, object]] = None
+        self.pronto = threading.Event()
+
+
+class _Grupo:
+    __slots__ = ("pedidos", "cheio")
+
+    def __init__(self):
+        self.pedidos: List[_Pedido] = []
+        self.cheio = threading.Event()
+
+
+def _resolver_grupo(chave: Tuple, problemas: List[Dict[str, object]], minimo: int = MINIMO) -> List[Dict[str, object]]:
+    """
+    Resolve problemas com a mesma chave (funcao, metodo, precisao, iteracoes) de uma vez.
+
+    Abaixo de minimo problemas o lote NumPy custa mais que os métodos
+    escalares (de 0,3 a 5 ms fixos contra 10 a 100 microssegundos por
+    problema), e cada um é resolvido pelo caminho escalar. Os problemas que
+    não convergem no lote também são refeitos pelo caminho escalar, que
+    informa o status, as iterações e as avaliações da falha.
+    """
+    if len(problemas) < minimo:
+        return [fluxo.resolver_problema(p) for p in problemas]
+    funcao, metodo, precisao, iteracoes = chave
+    vetorizado, campos, (fixas, por_iteracao) = VETORIZADOS[metodo]
+    try:
+        estimativas = [np.array([p[campo] for p in problemas], dtype=float) for campo in campos]
+        # Só o compilador restrito: o texto vem da rede e o sympify o executaria
+        expressao = avaliador.interpretar(funcao, simbolica=False)
+        raizes, indices, status = vetorizado(*estimativas, expressao, precisao, iteracoes)
+        residuos = np.abs(avaliador.compilar_vetorial(expressao)(raizes))
+    except Exception:
+        # Algum problema inválido no grupo: cada um segue pelo caminho escalar,
+        # que aponta o erro no seu próprio resultado
+        return [fluxo.resolver_problema(p) for p in problemas]
+
+    # Listas de floats e ints do Python: indexar os arrays NumPy elemento a
+    # elemento custaria mais que o próprio lote nos grupos pequenos
+    convergiu = status == Status.CONVERGIU
+    if campos == ("a", "b"):
+        # O lote aceita um extremo que já é raiz e os métodos escalares não:
+        # esses problemas seguem pelo caminho escalar, para que o resultado
+        # não dependa de o pedido ter sido agrupado
+        convergiu &= (raizes != estimativas[0]) & (raizes != estimativas[1])
+    convergiu = convergiu.tolist()
+    raizes, indices, residuos = raizes.tolist(), indices.tolist(), residuos.tolist()
+    resultados = []
+    for k, problema in enumerate(problemas):
+        if not convergiu[k]:
+            resultados.append(fluxo.resolver_problema(problema))
+            continue
+        # O lote guarda o índice da iteração de convergência
+        n = indices[k] + 1
+        resultados.append({
+            "id": problema.get("id"),
+            "metodo": metodo,
+            "status": _CONVERGIU,
+            "convergiu": True,
+            "raiz": raizes[k],
+            "iteracoes": n,
+            "avaliacoes": fixas + por_iteracao * n,
+            "residuo": residuos[k],
+            "erro": None,
+        })
+    return resultados
+
+
+def _falha(problema: Dict[str, object], erro: str) -> Dict[str, object]:
+    """Resultado de um pedido que não recebeu a resposta do seu grupo."""
+    return {**dict.fromkeys(fluxo.CAMPOS[1:]), "id": problema.get("id"), "metodo": problema.get("metodo"),
+            "convergiu": False, "erro": erro}
+
+
+def _chave(problema: Dict[str, object]) -> Optional[Tuple]:
+    """Chave de agrupamento do problema, ou None se ele não pode ser agrupado."""
+    if not isinstance(problema, dict):
+        return None
+    problema = {**fluxo.PADROES, **problema}
+    if problema["metodo"] not in VETORIZADOS or not isinstance(problema.get("funcao"), str):
+        return None
+    try:
+        # Problemas sem estimativas válidas seguem pelo caminho escalar, que aponta o erro
+        for campo in VETORIZADOS[problema["metodo"]][1]:
+            float(problema[campo])
+        return (problema["funcao"], problema["metodo"], float(problema["precisao"]), int(problema["iteracoes"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class Agrupador:
+    """
+    Reúne pedidos simultâneos com a mesma chave em um único lote vetorizado.
+
+    O primeiro pedido de cada grupo é o líder: espera até janela segundos (ou
+    até o grupo atingir maximo pedidos), fecha o grupo e resolve todos. Se
+    não há outros pedidos em andamento o líder não espera, e um pedido
+    isolado não paga a janela.
+
+    Os demais esperam no máximo espera segundos pelo líder; se ele falha, cada
+    pedido do grupo recebe o erro no seu próprio resultado.
+    """
+
+    def __init__(self, janela: float = 0.002, maximo: int = 4096, minimo: int = MINIMO, espera: float = ESPERA):
+        self.janela = janela
+        self.maximo = maximo
+        self.minimo = minimo
+        self.espera = espera
+        self._trava = threading.Lock()
+        self._grupos: Dict[Tuple, _Grupo] = {}
+        self._ativos = 0
+        self.lotes = 0
+        self.agrupados = 0
+        self.vetorizados = 0
+
+    def resolver(self, problema: Dict[str, object]) -> Dict[str, object]:
+        chave = _chave(problema)
+        if chave is None:
+            return fluxo.resolver_problema(problema)
+
+        pedido = _Pedido({**fluxo.PADROES, **problema})
+        with self._trava:
+            self._ativos += 1
+            grupo = self._grupos.get(chave)
+            lider = grupo is None
+            if lider:
+                grupo = self._grupos[chave] = _Grupo()
+            grupo.pedidos.append(pedido)
+            if len(grupo.pedidos) >= self.maximo:
+                # Grupo cheio: os próximos pedidos abrem outro
+                del self._grupos[chave]
+                grupo.cheio.set()
+
+        try:
+            if lider:
+                # Cede a vez (e o GIL) para que pedidos já prontos entrem no grupo
+                time.sleep(0)
+                if self._ativos > 1:
+                    grupo.cheio.wait(self.janela)
+                with self._trava:
+                    if self._grupos.get(chave) is grupo:
+                        del self._grupos[chave]
+                    self.lotes += 1
+                    self.agrupados += len(grupo.pedidos)
+                    if len(grupo.pedidos) >= self.minimo:
+                        self.vetorizados += len(grupo.pedidos)
+                resultados: List[Dict[str, object]] = []
+                erro = "Falha ao resolver o grupo"
+                try:
+                    resultados = _resolver_grupo(chave, [p.problema for p in grupo.pedidos], self.minimo)
+                except Exception as e:
+                    logger.exception("Falha ao resolver um grupo de %d pedidos", len(grupo.pedidos))
+                    erro = f"{erro}: {e}"
+                finally:
+                    # Libera todos os pedidos do grupo, mesmo que o líder tenha falhado
+                    for k, outro in enumerate(grupo.pedidos):
+                        outro.resultado = resultados[k] if k < len(resultados) else _falha(outro.problema, erro)
+                        outro.pronto.set()
+            elif not pedido.pronto.wait(self.espera):
+                logger.warning("Pedido sem resultado do grupo apos %g s", self.espera)
+                pedido.resultado = _falha(pedido.problema, f"Tempo esgotado ({self.espera:g} s) esperando o grupo")
+        finally:
+            with self._trava:
+                self._ativos -= 1
+        return pedido.resultado
+
+    def resolver_lote(self, problemas: List[Dict[str, object]]) -> List[Dict[str, object]]:
+        """Resolve uma lista de uma vez: os agrupáveis por chave, os demais um a um."""
+        resultados: List[Optional[Dict[str, object]]] = [None] * len(problemas)
+        grupos: Dict[Tuple, List[int]] = {}
+        for k, problema in enumerate(problemas):
+            chave = _chave(problema)
+            if chave is None:
+                resultados[k] = fluxo.resolver_problema(problema)
+            else:
+                grupos.setdefault(chave, []).append(k)
+        for chave, indices in grupos.items():
+            resolvidos = _resolver_grupo(chave, [{**fluxo.PADROES, **problemas[k]} for k in indices], self.minimo)
+            for k, resultado in zip(indices, resolvidos):
+                resultados[k] = resultado
+        return resultados
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    # HTTP/1.1 mantém a conexão aberta entre pedidos do mesmo cliente; sem o
+    # algoritmo de Nagle a resposta não espera o ACK atrasado do cliente (~40 ms)
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "Servico"
+
+    def _responder(self, codigo: int, corpo: object):
+        dados = json.dumps(corpo).encode()
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _ler_json(self):
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(tamanho) or b"null")
+
+    def do_GET(self):
+        if self.path != "/saude":
+            self._responder(404, {"erro": f"Caminho desconhecido: {self.path}"})
+            return
+        agrupador = self.server.agrupador
+        self._responder(200, {"ok": True, "lotes": agrupador.lotes, "agrupados": agrupador.agrupados,
+                              "vetorizados": agrupador.vetorizados, "cache": avaliador.cache().estatisticas()})
+
+    def do_POST(self):
+        try:
+            corpo = self._ler_json()
+        except ValueError as e:
+            self._responder(400, {"erro": f"JSON invalido: {e}"})
+            return
+
+        if self.path == "/resolver":
+            self._responder(200, _limpar(self.server.agrupador.resolver(corpo)))
+        elif self.path == "/lote":
+            problemas = corpo.get("problemas") if isinstance(corpo, dict) else None
+            if not isinstance(problemas, list):
+                self._responder(400, {"erro": "Esperado {\"problemas\": [...]}"})
+                return
+            resultados = self.server.agrupador.resolver_lote(problemas)
+            self._responder(200, {"resultados": [_limpar(r) for r in resultados]})
+        else:
+            self._responder(404, {"erro": f"Caminho desconhecido: {self.path}"})
+
+    def log_message(self, formato, *args):
+        logger.debug("%s - %s", self.address_string(), formato % args)
+
+
+def _limpar(resultado: Dict[str, object]) -> Dict[str, object]:
+    return {k: fluxo.valor_json(v) for k, v in resultado.items()}
+
+
+class Servico(ThreadingHTTPServer):
+    """Servidor com uma thread por conexão e um Agrupador compartilhado."""
+
+    daemon_threads = True
+    # Fila de conexões pendentes (o padrão do socketserver, 5, recusa clientes sob carga)
+    request_queue_size = 128
+
+    def __init__(self, endereco: Tuple[str, int] = ("127.0.0.1", 8080), janela: float = 0.002,
+                 maximo: int = 4096, minimo: int = MINIMO):
+        super().__init__(endereco, _Manipulador)
+        self.agrupador = Agrupador(janela, maximo, minimo)
+
+    @property
+    def url(self) -> str:
+        host, porta = self.server_address[:2]
+        return f"http://{host}:{porta}"
+
+
+def iniciar(endereco: Tuple[str, int] = ("127.0.0.1", 0), janela: float = 0.002,
+            maximo: int = 4096, minimo: int = MINIMO) -> Servico:
+    """Inicia o serviço em uma thread de fundo (porta 0: escolhida pelo sistema) e o retorna."""
+    servico = Servico(endereco, janela, maximo, minimo)
+    threading.Thread(target=servico.serve_forever, daemon=True).start()
+    return servico
+
+
+def main_servico(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serviço HTTP de busca de zeros de funções.")
+    parser.add_argument("--endereco", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--janela", type=float, default=2.0,
+                        help="Espera, em milissegundos, para agrupar pedidos da mesma função (padrão: 2)")
+    parser.add_argument("--maximo", type=int, default=4096, help="Pedidos por grupo (padrão: 4096)")
+    parser.add_argument("--minimo", type=int, default=MINIMO,
+                        help=f"Tamanho mínimo de grupo para usar o lote vetorizado (padrão: {MINIMO})")
+    args = parser.parse_args(argv)
+
+    servico = Servico((args.endereco, args.porta), args.janela / 1000, args.maximo, args.minimo)
+    print(f"Servico em {servico.url} (Ctrl+C para encerrar)", file=sys.stderr)
+    try:
+        servico.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servico.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_servico())
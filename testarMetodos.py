@@ -3,41 +3,119 @@ Módulo: Teste e Comparação de Métodos Numéricos
 Descrição: Módulo responsável por executar e comparar os diferentes métodos
           numéricos de busca de zeros de funções.
 
-Este módulo executa os quatro métodos principais (Bissecção, Falsa Posição,
-Secante e Newton-Raphson) com os mesmos parâmetros e gera uma análise
-comparativa detalhada incluindo:
-    - Número de iterações
-    - Tempo de execução (em milissegundos)
+Este módulo executa os cinco métodos (Bissecção, Falsa Posição, Secante,
+Newton-Raphson e Brent) com os mesmos parâmetros e gera uma análise
+comparativa detalhada. A análise inclui:
+    - Número de iterações e de avaliações de f e f'
+    - Tempo de execução (da mesma execução que produziu a raiz, em
+      milissegundos; medições repetidas ficam no benchmark.py)
     - Raiz encontrada
     - Precisão final alcançada |f(raiz)|
     - Estatísticas e ranking de desempenho
+
+Análises adicionais, executadas à parte:
+    - tests_polinomio: Newton polinomial e todas as raízes reais de um
+      polinômio (metodos.polinomio)
+    - tests_portfolio: os métodos intercalados (metodos.portfolio), com a
+      latência comparada à do melhor método isolado
+    - tests_precisao: o modo de precisão adaptativa (metodos.precisao), que
+      só recorre ao mpmath quando a precisão pedida está fora do alcance do
+      float
+    - tests_ordem_alta: Halley e Householder (metodos.halley,
+      metodos.householder), com f e as derivadas fundidas, ao lado do Newton
+    - tests_chebyshev: o proxy de Chebyshev (metodos.chebyshev), com todas as
+      raízes de [a,b]
+    - tests_lote: o Newton e a Secante em lote (metodos.lote) sobre uma
+      malha de estimativas iniciais
+    - tests_sistema: Newton amortecido e Broyden em sistemas não lineares
 """
 
-import sympy as sp
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Tuple
 import metodos.bisseccao
 import metodos.falsaPosicao
 import metodos.secante
 import metodos.newton
-import time
+import metodos.brent
+import metodos.halley
+import metodos.householder
+import metodos.polinomio
+import metodos.precisao
+import metodos.refinamento
+from metodos import avaliador
+from metodos.instrumentacao import Instrumento
+from metodos.resultado import Resultado, Status
+import benchmark
+
+if TYPE_CHECKING:
+    import sympy as sp
+    from metodos.sistemas import Sistema
+
+def _instrumentar(executar, f, df=None) -> Tuple[Resultado, Instrumento]:
+    """
+    Executa o método uma única vez com f (e f') instrumentadas e devolve o
+    resultado dessa execução com o instrumento que a mediu.
+
+    executar recebe (f, df, registro) e chama o método com esses argumentos.
+    """
+    inst = Instrumento()
+    fi = inst.envolver(f)
+    dfi = inst.envolver(df, derivada=True) if df is not None else None
+    resultado = inst.medir(lambda: executar(fi, dfi, inst))
+    return resultado, inst
+
+def _consultar(chamada) -> Tuple[Resultado, Instrumento]:
+    """
+    Executa uma chamada do armazém uma única vez, medindo só o tempo total.
+
+    f não é instrumentada: o armazém identifica o problema pela função, e uma
+    função envolvida seria sempre um problema novo.
+    """
+    inst = Instrumento()
+    return inst.medir(chamada), inst
 
-x = sp.Symbol('x')
+def _imprimir_custo(resultado: Resultado, inst: Instrumento):
+    # As contagens são as do resultado mostrado: sem avaliações se ele foi
+    # reaproveitado, só as novas se foi retomado
+    if resultado.avaliacoes_df:
+        print(f"Avaliacoes: {resultado.avaliacoes_f} de f + {resultado.avaliacoes_df} de f' = {resultado.avaliacoes}")
+    else:
+        print(f"Avaliacoes de f: {resultado.avaliacoes_f}")
+    if inst.avaliacoes and inst.tempo_total > 0:
+        fracao = inst.tempo_avaliacao / inst.tempo_total * 100
+        print(f"Tempo em avaliacoes: {fracao:.1f}% (restante no proprio metodo)")
+
+def _imprimir_origem(armazem: metodos.refinamento.Armazem, resultado: Resultado):
+    if armazem.origem == "reaproveitado":
+        print("Resultado guardado reaproveitado: 0 avaliacoes")
+    elif armazem.origem == "retomado":
+        print(f"Retomado do resultado guardado: {resultado.avaliacoes} avaliacoes novas")
 
-def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: float, iteracoes: int):
+def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: float, iteracoes: int,
+          armazem: Optional[metodos.refinamento.Armazem] = None):
     """
-    Executa e compara os quatro métodos numéricos de busca de zeros.
+    Executa e compara os cinco métodos numéricos de busca de zeros.
     
-    Esta função executa os métodos da Bissecção, Falsa Posição, Secante e
-    Newton-Raphson sobre a mesma função com os mesmos parâmetros, medindo
+    Esta função executa os métodos da Bissecção, Falsa Posição, Secante,
+    Newton-Raphson e Brent sobre a mesma função com os mesmos parâmetros, medindo
     o desempenho de cada um e gerando uma análise comparativa completa.
+
+    Cada método é executado uma única vez: raiz, iterações, avaliações e
+    tempo vêm todos dessa execução. Para tempos estáveis (mediana de várias
+    execuções), use o benchmark.py.
     
     Args:
         a (float): Extremo inferior do intervalo [a,b] para métodos de intervalo
         b (float): Extremo superior do intervalo [a,b] para métodos de intervalo
         x0 (float): Primeira estimativa inicial para Secante e Newton-Raphson
         x1 (float): Segunda estimativa inicial para o método da Secante
-        func (sp.Expr): Função simbólica a ser analisada
+        func (sp.Expr | Expressao): Função a ser analisada
         precisao (float): Critério de parada (tolerância) para todos os métodos
         iteracoes (int): Número máximo de iterações permitidas
+        armazem (Armazem): Se informado, Bissecção, Falsa Posição, Secante e
+            Newton partem dos resultados guardados para o mesmo problema
+            (reaproveitados ou retomados com a nova precisão)
         
     Saída:
         Imprime na tela:
@@ -53,54 +131,65 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
         >>> func = sp.sympify("x**2 - 4")
         >>> tests(1, 3, 1.5, 2.5, func, 0.000001, 100)
     """
-    # Calcular a derivada da função para Newton-Raphson
-    derivada = sp.diff(func, x)
+    # Calcular a derivada da função para Newton-Raphson e compilar ambas
+    # uma única vez para avaliação numérica rápida
+    derivada = avaliador.derivada(func)
+    f = avaliador.compilar(func)
+    df = avaliador.compilar_derivada(func)
     
     # Método da Bissecção
     print("\n1. MÉTODO DA BISSECÇÃO")
     print("-" * 30)
-    tempo_inicio = time.perf_counter()
-    resultado_biss = metodos.bisseccao.bisseccao(a, b, iteracoes, func, precisao)
-    tempo_fim = time.perf_counter()
-    tempo_biss = (tempo_fim - tempo_inicio) * 1000  # Converter para milissegundos
+    if armazem is not None:
+        resultado_biss, inst_biss = _consultar(lambda: armazem.bisseccao(a, b, iteracoes, func, precisao))
+        _imprimir_origem(armazem, resultado_biss)
+    else:
+        resultado_biss, inst_biss = _instrumentar(
+            lambda f_, df_, r: metodos.bisseccao.bisseccao(a, b, iteracoes, f_, precisao, registro=r), f)
+    tempo_biss = inst_biss.tempo_total * 1000
     
     print(f"Resultado: {resultado_biss}")
-    if resultado_biss[0] != -1:
-        print(f"[OK] Raiz encontrada: {resultado_biss[1]:.8f}")
-        print(f"Iteracoes: {resultado_biss[0] + 1}")
+    if resultado_biss.convergiu:
+        print(f"[OK] Raiz encontrada: {resultado_biss.raiz:.8f}")
+        print(f"Iteracoes: {resultado_biss.iteracoes}")
         print(f"Tempo de execucao: {tempo_biss:.6f} ms")
+        _imprimir_custo(resultado_biss, inst_biss)
         
         # Verificação - Precisão final alcançada
-        verificacao = func.subs(x, resultado_biss[1])
+        verificacao = f(resultado_biss.raiz)
         precisao_final = abs(float(verificacao))
-        print(f"Verificacao f({resultado_biss[1]:.8f}) = {float(verificacao):.2e}")
+        print(f"Verificacao f({resultado_biss.raiz:.8f}) = {float(verificacao):.2e}")
         print(f"Precisao final |f(raiz)| = {precisao_final:.2e}")
     else:
-        print("[ERRO] Raiz nao encontrada no numero maximo de iteracoes")
+        print(f"[ERRO] Raiz nao encontrada ({resultado_biss.status.name})")
         tempo_biss = float('inf')
         precisao_final = float('inf')
     
     # Método da Falsa Posição
     print("\n2. MÉTODO DA FALSA POSIÇÃO")
     print("-" * 30)
-    tempo_inicio = time.perf_counter()
-    resultado_fp = metodos.falsaPosicao.falsaPosicao(a, b, func, precisao, iteracoes)
-    tempo_fim = time.perf_counter()
-    tempo_fp = (tempo_fim - tempo_inicio) * 1000  # Converter para milissegundos
+    if armazem is not None:
+        resultado_fp, inst_fp = _consultar(lambda: armazem.falsaPosicao(a, b, func, precisao, iteracoes))
+        _imprimir_origem(armazem, resultado_fp)
+    else:
+        resultado_fp, inst_fp = _instrumentar(
+            lambda f_, df_, r: metodos.falsaPosicao.falsaPosicao(a, b, f_, precisao, iteracoes, registro=r), f)
+    tempo_fp = inst_fp.tempo_total * 1000
     
     print(f"Resultado: {resultado_fp}")
-    if resultado_fp[0] != -1:
-        print(f"[OK] Raiz encontrada: {resultado_fp[1]:.8f}")
-        print(f"Iteracoes: {resultado_fp[0] + 1}")
+    if resultado_fp.convergiu:
+        print(f"[OK] Raiz encontrada: {resultado_fp.raiz:.8f}")
+        print(f"Iteracoes: {resultado_fp.iteracoes}")
         print(f"Tempo de execucao: {tempo_fp:.6f} ms")
+        _imprimir_custo(resultado_fp, inst_fp)
         
         # Verificação - Precisão final alcançada
-        verificacao = func.subs(x, resultado_fp[1])
+        verificacao = f(resultado_fp.raiz)
         precisao_final_fp = abs(float(verificacao))
-        print(f"Verificacao f({resultado_fp[1]:.8f}) = {float(verificacao):.2e}")
+        print(f"Verificacao f({resultado_fp.raiz:.8f}) = {float(verificacao):.2e}")
         print(f"Precisao final |f(raiz)| = {precisao_final_fp:.2e}")
     else:
-        print("[ERRO] Raiz nao encontrada no numero maximo de iteracoes")
+        print(f"[ERRO] Raiz nao encontrada ({resultado_fp.status.name})")
         tempo_fp = float('inf')
         precisao_final_fp = float('inf')
     
@@ -108,29 +197,33 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
     print("\n3. MÉTODO DA SECANTE")
     print("-" * 30)
     try:
-        tempo_inicio = time.perf_counter()
-        resultado_sc = metodos.secante.secante(x0, x1, func, precisao, iteracoes)
-        tempo_fim = time.perf_counter()
-        tempo_sc = (tempo_fim - tempo_inicio) * 1000  # Converter para milissegundos
+        if armazem is not None:
+            resultado_sc, inst_sc = _consultar(lambda: armazem.secante(x0, x1, func, precisao, iteracoes))
+            _imprimir_origem(armazem, resultado_sc)
+        else:
+            resultado_sc, inst_sc = _instrumentar(
+                lambda f_, df_, r: metodos.secante.secante(x0, x1, f_, precisao, iteracoes, registro=r), f)
+        tempo_sc = inst_sc.tempo_total * 1000
         
         print(f"Resultado: {resultado_sc}")
-        if resultado_sc[0] != -1:
-            print(f"[OK] Raiz encontrada: {resultado_sc[1]:.8f}")
-            print(f"Iteracoes: {resultado_sc[0] + 1}")
+        if resultado_sc.convergiu:
+            print(f"[OK] Raiz encontrada: {resultado_sc.raiz:.8f}")
+            print(f"Iteracoes: {resultado_sc.iteracoes}")
             print(f"Tempo de execucao: {tempo_sc:.6f} ms")
+            _imprimir_custo(resultado_sc, inst_sc)
             
             # Verificação - Precisão final alcançada
-            verificacao = func.subs(x, resultado_sc[1])
+            verificacao = f(resultado_sc.raiz)
             precisao_final_sc = abs(float(verificacao))
-            print(f"Verificacao f({resultado_sc[1]:.8f}) = {float(verificacao):.2e}")
+            print(f"Verificacao f({resultado_sc.raiz:.8f}) = {float(verificacao):.2e}")
             print(f"Precisao final |f(raiz)| = {precisao_final_sc:.2e}")
         else:
-            print("[ERRO] Raiz nao encontrada no numero maximo de iteracoes")
+            print(f"[ERRO] Raiz nao encontrada ({resultado_sc.status.name})")
             tempo_sc = float('inf')
             precisao_final_sc = float('inf')
     except Exception as e:
         print(f"[ERRO] Erro no metodo da secante: {e}")
-        resultado_sc = [-1, 0]
+        resultado_sc = Resultado(Status.VALOR_INVALIDO)
         tempo_sc = float('inf')
         precisao_final_sc = float('inf')
 
@@ -139,71 +232,104 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
     print("-" * 30)
     print(f"Derivada: f'(x) = {derivada}")
     try:
-        tempo_inicio = time.perf_counter()
-        resultado_newton = metodos.newton.newton(x0, func, derivada, precisao, iteracoes)
-        tempo_fim = time.perf_counter()
-        tempo_newton = (tempo_fim - tempo_inicio) * 1000  # Converter para milissegundos
+        if armazem is not None:
+            resultado_newton, inst_newton = _consultar(lambda: armazem.newton(x0, func, df, precisao, iteracoes))
+            _imprimir_origem(armazem, resultado_newton)
+        else:
+            resultado_newton, inst_newton = _instrumentar(
+                lambda f_, df_, r: metodos.newton.newton(x0, f_, df_, precisao, iteracoes, registro=r), f, df)
+        tempo_newton = inst_newton.tempo_total * 1000
         
         print(f"Resultado: {resultado_newton}")
-        if resultado_newton[0] != -1:
-            print(f"[OK] Raiz encontrada: {resultado_newton[1]:.8f}")
-            print(f"Iteracoes: {resultado_newton[0] + 1}")
+        if resultado_newton.convergiu:
+            print(f"[OK] Raiz encontrada: {resultado_newton.raiz:.8f}")
+            print(f"Iteracoes: {resultado_newton.iteracoes}")
             print(f"Tempo de execucao: {tempo_newton:.6f} ms")
+            _imprimir_custo(resultado_newton, inst_newton)
             
             # Verificação - Precisão final alcançada
-            verificacao = func.subs(x, resultado_newton[1])
+            verificacao = f(resultado_newton.raiz)
             precisao_final_newton = abs(float(verificacao))
-            print(f"Verificacao f({resultado_newton[1]:.8f}) = {float(verificacao):.2e}")
+            print(f"Verificacao f({resultado_newton.raiz:.8f}) = {float(verificacao):.2e}")
             print(f"Precisao final |f(raiz)| = {precisao_final_newton:.2e}")
             
             # Verificação da derivada no ponto
-            verificacao_deriv = derivada.subs(x, resultado_newton[1])
-            print(f"f'({resultado_newton[1]:.8f}) = {float(verificacao_deriv):.2e}")
+            verificacao_deriv = df(resultado_newton.raiz)
+            print(f"f'({resultado_newton.raiz:.8f}) = {float(verificacao_deriv):.2e}")
         else:
-            print("[ERRO] Raiz nao encontrada no numero maximo de iteracoes")
+            print(f"[ERRO] Raiz nao encontrada ({resultado_newton.status.name})")
             tempo_newton = float('inf')
             precisao_final_newton = float('inf')
     except Exception as e:
         print(f"[ERRO] Erro no metodo de Newton-Raphson: {e}")
-        resultado_newton = [-1, 0]
+        resultado_newton = Resultado(Status.VALOR_INVALIDO)
         tempo_newton = float('inf')
         precisao_final_newton = float('inf')
 
+    # Método de Brent
+    print("\n5. MÉTODO DE BRENT")
+    print("-" * 30)
+    resultado_brent, inst_brent = _instrumentar(
+        lambda f_, df_, r: metodos.brent.brent(a, b, f_, precisao, iteracoes, registro=r), f)
+    tempo_brent = inst_brent.tempo_total * 1000
+    
+    print(f"Resultado: {resultado_brent}")
+    if resultado_brent.convergiu:
+        print(f"[OK] Raiz encontrada: {resultado_brent.raiz:.8f}")
+        print(f"Iteracoes: {resultado_brent.iteracoes}")
+        print(f"Tempo de execucao: {tempo_brent:.6f} ms")
+        _imprimir_custo(resultado_brent, inst_brent)
+        
+        # Verificação - Precisão final alcançada
+        verificacao = f(resultado_brent.raiz)
+        precisao_final_brent = abs(float(verificacao))
+        print(f"Verificacao f({resultado_brent.raiz:.8f}) = {float(verificacao):.2e}")
+        print(f"Precisao final |f(raiz)| = {precisao_final_brent:.2e}")
+    else:
+        print(f"[ERRO] Raiz nao encontrada ({resultado_brent.status.name})")
+        tempo_brent = float('inf')
+        precisao_final_brent = float('inf')
+
     # ANÁLISE DE EFICIÊNCIA MELHORADA
     print("\n" + "=" * 100)
     print("                           ANÁLISE DE EFICIÊNCIA E COMPARAÇÃO DE MÉTODOS")
     print("=" * 100)
     
-    # Coletar dados dos métodos que convergiram (método, iterações, raiz, tempo, precisão)
+    # Coletar dados dos métodos que convergiram (método, iterações, raiz, tempo, precisão, avaliações)
     metodos_data = []
     
-    if resultado_biss[0] != -1:
-        metodos_data.append(("Bissecção", resultado_biss[0] + 1, resultado_biss[1], tempo_biss, precisao_final))
+    if resultado_biss.convergiu:
+        metodos_data.append(("Bissecção", resultado_biss.iteracoes, resultado_biss.raiz, tempo_biss, precisao_final, resultado_biss.avaliacoes))
+    
+    if resultado_fp.convergiu:
+        metodos_data.append(("Falsa Posição", resultado_fp.iteracoes, resultado_fp.raiz, tempo_fp, precisao_final_fp, resultado_fp.avaliacoes))
     
-    if resultado_fp[0] != -1:
-        metodos_data.append(("Falsa Posição", resultado_fp[0] + 1, resultado_fp[1], tempo_fp, precisao_final_fp))
+    if resultado_sc.convergiu:
+        metodos_data.append(("Secante", resultado_sc.iteracoes, resultado_sc.raiz, tempo_sc, precisao_final_sc, resultado_sc.avaliacoes))
     
-    if resultado_sc[0] != -1:
-        metodos_data.append(("Secante", resultado_sc[0] + 1, resultado_sc[1], tempo_sc, precisao_final_sc))
+    if resultado_newton.convergiu:
+        metodos_data.append(("Newton-Raphson", resultado_newton.iteracoes, resultado_newton.raiz, tempo_newton, precisao_final_newton, resultado_newton.avaliacoes))
+    
+    if resultado_brent.convergiu:
+        metodos_data.append(("Brent", resultado_brent.iteracoes, resultado_brent.raiz, tempo_brent, precisao_final_brent, resultado_brent.avaliacoes))
     
-    if resultado_newton[0] != -1:
-        metodos_data.append(("Newton-Raphson", resultado_newton[0] + 1, resultado_newton[1], tempo_newton, precisao_final_newton))
     
     # Verificar se algum método convergiu
     if not metodos_data:
         print("[ERRO] NENHUM METODO CONVERGIU!")
         return
     
-    # Ordenar por número de iterações (menor = mais eficiente)
-    metodos_data.sort(key=lambda x: x[1])
+    # Ordenar pelo custo real: avaliações de f e f' (Newton paga as duas por
+    # iteração) e, em caso de empate, pelo tempo
+    metodos_data.sort(key=lambda x: (x[5], x[3]))
     
     # Exibir tabela de resultados completa
     print("\nTABELA COMPARATIVA COMPLETA DE RESULTADOS:")
     print("-" * 100)
-    print(f"{'Posicao':<10} {'Metodo':<18} {'Iteracoes':<12} {'Tempo (ms)':<15} {'Raiz':<18} {'|f(raiz)|':<15}")
+    print(f"{'Posicao':<10} {'Metodo':<18} {'Iteracoes':<12} {'Avaliacoes':<12} {'Tempo (ms)':<15} {'Raiz':<18} {'|f(raiz)|':<15}")
     print("-" * 100)
     
-    for i, (metodo, iter_count, raiz, tempo, precisao_f) in enumerate(metodos_data, 1):
+    for i, (metodo, iter_count, raiz, tempo, precisao_f, avaliacoes) in enumerate(metodos_data, 1):
         if i == 1:
             simbolo = "[1o]"  # Ouro
         elif i == 2:
@@ -213,13 +339,14 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
         else:
             simbolo = f"[{i}o]"  # Menção honrosa
             
-        print(f"{simbolo}       {metodo:<18} {iter_count:<12} {tempo:<15.6f} {raiz:<18.10f} {precisao_f:<15.2e}")
+        print(f"{simbolo}       {metodo:<18} {iter_count:<12} {avaliacoes:<12} {tempo:<15.6f} {raiz:<18.10f} {precisao_f:<15.2e}")
     
     print("-" * 100)
     
     # Análise detalhada
     print(f"\n[MELHOR] METODO MAIS EFICIENTE: {metodos_data[0][0].upper()}")
     print(f"   - Convergiu em apenas {metodos_data[0][1]} iteracoes")
+    print(f"   - Avaliacoes de f e f': {metodos_data[0][5]}")
     print(f"   - Tempo de execucao: {metodos_data[0][3]:.6f} ms")
     print(f"   - Raiz encontrada: {metodos_data[0][2]:.10f}")
     print(f"   - Precisao final |f(raiz)|: {metodos_data[0][4]:.2e}")
@@ -231,24 +358,26 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
         
         for i in range(1, len(metodos_data)):
             metodo_atual = metodos_data[i]
-            diferenca = metodo_atual[1] - melhor_metodo[1]
-            if melhor_metodo[1] > 0:
-                percentual = ((metodo_atual[1] - melhor_metodo[1]) / melhor_metodo[1]) * 100
-                print(f"   - {melhor_metodo[0]} foi {diferenca} iteracoes mais rapido que {metodo_atual[0]}")
-                print(f"     (Reducao de {percentual:.1f}% nas iteracoes)")
+            diferenca = metodo_atual[5] - melhor_metodo[5]
+            if melhor_metodo[5] > 0:
+                percentual = ((metodo_atual[5] - melhor_metodo[5]) / melhor_metodo[5]) * 100
+                print(f"   - {melhor_metodo[0]} usou {diferenca} avaliacoes a menos que {metodo_atual[0]}")
+                print(f"     (Reducao de {percentual:.1f}% nas avaliacoes)")
     
     # Estatísticas gerais
     total_iter = sum(data[1] for data in metodos_data)
     media_iter = total_iter / len(metodos_data)
+    media_aval = sum(data[5] for data in metodos_data) / len(metodos_data)
     total_tempo = sum(data[3] for data in metodos_data)
     media_tempo = total_tempo / len(metodos_data)
     
     print(f"\nESTATISTICAS GERAIS:")
     print(f"   - Total de metodos que convergiram: {len(metodos_data)}")
     print(f"   - Media de iteracoes: {media_iter:.1f}")
+    print(f"   - Media de avaliacoes: {media_aval:.1f}")
     print(f"   - Media de tempo de execucao: {media_tempo:.6f} ms")
-    print(f"   - Melhor performance (iteracoes): {metodos_data[0][1]} iteracoes")
-    print(f"   - Pior performance (iteracoes): {metodos_data[-1][1]} iteracoes")
+    print(f"   - Melhor performance (avaliacoes): {metodos_data[0][5]} avaliacoes")
+    print(f"   - Pior performance (avaliacoes): {metodos_data[-1][5]} avaliacoes")
     
     # Análise por tempo de execução
     metodos_por_tempo = sorted(metodos_data, key=lambda x: x[3])
@@ -258,14 +387,14 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
     # Análise por eficiência relativa
     if len(metodos_data) > 1:
         print(f"\nEFICIENCIA RELATIVA:")
-        base_iter = metodos_data[0][1]  # Melhor método como base
+        base_aval = metodos_data[0][5]  # Melhor método como base
         
-        for metodo, iter_count, raiz, tempo, precisao_f in metodos_data:
-            if iter_count == base_iter:
+        for metodo, iter_count, raiz, tempo, precisao_f, avaliacoes in metodos_data:
+            if avaliacoes == base_aval:
                 eficiencia = 100.0
                 status = "[MAXIMA]"
             else:
-                eficiencia = (base_iter / iter_count) * 100
+                eficiencia = (base_aval / avaliacoes) * 100
                 if eficiencia >= 80:
                     status = "[ALTA]"
                 elif eficiencia >= 60:
@@ -280,4 +409,259 @@ def tests(a:float, b: float, x0: float, x1: float, func: sp.Expr, precisao: floa
     print(f"   - Bisseccao: Metodo robusto, sempre converge se ha mudanca de sinal")
     print(f"   - Falsa Posicao: Melhora a bisseccao usando interpolacao linear")
     print(f"   - Secante: Aproxima a derivada numericamente")
-    print(f"   - Newton-Raphson: Convergencia quadratica quando proximo da raiz")
\ No newline at end of file
+    print(f"   - Newton-Raphson: Convergencia quadratica quando proximo da raiz")
+    print(f"   - Brent: Garantia da bisseccao com convergencia superlinear por interpolacao")
+
+def tests_polinomio(func: sp.Expr, x0: float, precisao: float, iteracoes: int,
+                    repeticoes: int = 100, coefs: Optional[list] = None):
+    """
+    Executa o caminho rápido para polinômios (metodos.polinomio).
+
+    O Newton polinomial avalia p, p' e p'' em uma passada de Horner e corrige
+    o passo pela multiplicidade estimada; a deflação lista todas as raízes
+    reais. O Newton-Raphson genérico é mostrado ao lado para comparação.
+
+    Args:
+        func (sp.Expr | Expressao): Polinômio em x
+        x0 (float): Estimativa inicial
+        precisao (float): Critério de parada
+        iteracoes (int): Número máximo de iterações
+        repeticoes (int): Amostras usadas na medição de tempo
+        coefs (list): Coeficientes já extraídos de func, se houver
+    """
+    if coefs is None:
+        coefs = metodos.polinomio.coeficientes(func)
+    print("\nNEWTON POLINOMIAL (HORNER + MULTIPLICIDADE)")
+    print("-" * 30)
+    if coefs is None:
+        print(f"[ERRO] f(x) = {func} nao e um polinomio em x")
+        return
+
+    resultado_poli = metodos.polinomio.newton_polinomio(coefs, x0, precisao, iteracoes)
+    tempo_poli = benchmark.cronometrar(lambda: metodos.polinomio.newton_polinomio(coefs, x0, precisao, iteracoes), repeticoes)['mediana_ms']
+
+    print(f"Resultado: {resultado_poli}")
+    if resultado_poli.convergiu:
+        print(f"[OK] Raiz encontrada: {resultado_poli.raiz:.8f}")
+        print(f"Iteracoes: {resultado_poli.iteracoes}")
+        print(f"Tempo de execucao (mediana): {tempo_poli:.6f} ms")
+        print(f"Passadas de Horner (p, p' e p''): {resultado_poli.avaliacoes_f}")
+        print(f"Precisao final |f(raiz)| = {resultado_poli.residuo:.2e}")
+    else:
+        print(f"[ERRO] Raiz nao encontrada ({resultado_poli.status.name})")
+
+    f = avaliador.compilar(func)
+    df = avaliador.compilar_derivada(func)
+    resultado_newton = metodos.newton.newton(x0, f, df, precisao, iteracoes)
+    if resultado_newton.convergiu:
+        print(f"Newton-Raphson generico: {resultado_newton.iteracoes} iteracoes, "
+              f"{resultado_newton.avaliacoes} avaliacoes de f e f'")
+
+    raizes = metodos.polinomio.raizes_reais(coefs)
+    print("Todas as raizes reais: " + (", ".join(
+        f"{r:.8f}" + (f" (multiplicidade {m})" if m > 1 else "") for r, m in raizes) or "nenhuma"))
+
+def tests_portfolio(a: float, b: float, x0: float, x1: float, func: sp.Expr, precisao: float,
+                    iteracoes: int, repeticoes: int = 100):
+    """
+    Executa o portfólio (metodos.portfolio) e compara a sua latência com a
+    do melhor método isolado entre os quatro que ele intercala.
+
+    Args:
+        a, b (float): Intervalo para Bissecção e Falsa Posição
+        x0, x1 (float): Estimativas iniciais para Secante e Newton
+        func (sp.Expr | Expressao): Função a ser analisada
+        precisao (float): Critério de parada
+        iteracoes (int): Número máximo de iterações de cada método
+        repeticoes (int): Amostras usadas na medição de tempo
+    """
+    from metodos.portfolio import portfolio
+
+    f = avaliador.compilar(func)
+    df = avaliador.compilar_derivada(func)
+
+    print("\nPORTFOLIO (METODOS INTERCALADOS)")
+    print("-" * 30)
+    corrida = portfolio(a, b, x0, x1, f, precisao, iteracoes, derivada=df)
+    tempo_port = benchmark.cronometrar(lambda: portfolio(a, b, x0, x1, f, precisao, iteracoes, derivada=df),
+                                       repeticoes)['mediana_ms']
+    print(f"Resultado: {corrida.resultado}")
+    if not corrida.convergiu:
+        print("[ERRO] Nenhum metodo passou na verificacao do residuo")
+        return
+
+    print(f"[OK] Vencedor: {corrida.vencedor}, raiz {corrida.resultado.raiz:.8f}")
+    print(f"Tempo de execucao (mediana): {tempo_port:.6f} ms")
+    print("Avaliacoes por metodo: " + ", ".join(
+        f"{nome} {gasto} ({corrida.estados[nome]})" for nome, gasto in corrida.avaliacoes.items()))
+
+    isolados = []
+    for nome, executar in (("Bissecção", lambda: metodos.bisseccao.bisseccao(a, b, iteracoes, f, precisao)),
+                           ("Falsa Posição", lambda: metodos.falsaPosicao.falsaPosicao(a, b, f, precisao, iteracoes)),
+                           ("Secante", lambda: metodos.secante.secante(x0, x1, f, precisao, iteracoes)),
+                           ("Newton-Raphson", lambda: metodos.newton.newton(x0, f, df, precisao, iteracoes))):
+        try:
+            if executar().convergiu:
+                isolados.append((benchmark.cronometrar(executar, repeticoes)['mediana_ms'], nome))
+        except Exception:
+            continue
+    if isolados:
+        melhor_tempo, melhor = min(isolados)
+        print(f"Latencia contra o melhor metodo isolado ({melhor}, {melhor_tempo:.6f} ms): "
+              f"{tempo_port / melhor_tempo:.2f}x")
+
+def tests_precisao(a: float, b: float, x0: float, x1: float, func: sp.Expr, precisao: float,
+                   iteracoes: int, metodo: str = 'brent'):
+    """
+    Resolve no modo de precisão adaptativa (metodos.precisao): em float e,
+    só quando a precisão pedida está fora do alcance do float, com o
+    polimento no mpmath.
+
+    Args:
+        a, b (float): Intervalo para os métodos de intervalo
+        x0, x1 (float): Estimativas iniciais para os métodos abertos
+        func (sp.Expr | Expressao): Função a ser analisada
+        precisao (float): Critério de parada (pode ser menor que 1e-16)
+        iteracoes (int): Número máximo de iterações
+        metodo (str): Método usado na fase em float
+    """
+    print("\nPRECISAO ADAPTATIVA (FLOAT, MPMATH SE NECESSARIO)")
+    print("-" * 30)
+    resultado_prec, dps = metodos.precisao.resolver(func, precisao, metodo, a, b, x0, x1, iteracoes)
+    print(f"Resultado: {resultado_prec}")
+    if not resultado_prec.convergiu:
+        print("[ERRO] Nao convergiu")
+    elif dps is None:
+        print(f"[OK] Float de 64 bits bastou para a precisao {precisao:g}: raiz {resultado_prec.raiz:.8f}")
+    else:
+        import mpmath
+
+        with mpmath.workdps(dps):
+            raiz_texto = mpmath.nstr(resultado_prec.raiz, dps - 5)
+        print(f"[OK] Precisao {precisao:g} fora do alcance do float: polida no mpmath com {dps} digitos")
+        print(f"Raiz: {raiz_texto}")
+
+def tests_ordem_alta(x0: float, func: sp.Expr, precisao: float, iteracoes: int, repeticoes: int = 100):
+    """
+    Executa os métodos de ordem alta de Halley e Householder, com f e as
+    derivadas em uma única avaliação fundida, ao lado do Newton-Raphson.
+
+    Args:
+        x0 (float): Estimativa inicial
+        func (sp.Expr | Expressao): Função a ser analisada
+        precisao (float): Critério de parada
+        iteracoes (int): Número máximo de iterações
+        repeticoes (int): Amostras usadas na medição de tempo
+    """
+    print("\nHALLEY E HOUSEHOLDER (f, f' E f'' FUNDIDAS)")
+    print("-" * 30)
+    f = avaliador.compilar(func)
+    df = avaliador.compilar_derivada(func)
+    for nome, executar in (("Halley", lambda: metodos.halley.halley(x0, func, precisao, iteracoes)),
+                           ("Householder", lambda: metodos.householder.householder(x0, func, precisao, iteracoes)),
+                           ("Newton-Raphson", lambda: metodos.newton.newton(x0, f, df, precisao, iteracoes))):
+        resultado_alta = executar()
+        if resultado_alta.convergiu:
+            tempo_alta = benchmark.cronometrar(executar, repeticoes)['mediana_ms']
+            avaliacoes = (f"{resultado_alta.avaliacoes} avaliacoes de f e f'" if nome == "Newton-Raphson"
+                          else f"{resultado_alta.avaliacoes_f} avaliacoes fundidas")
+            print(f"[OK] {nome}: raiz {resultado_alta.raiz:.8f} em {resultado_alta.iteracoes} iteracoes, "
+                  f"{avaliacoes}, {tempo_alta:.6f} ms")
+        else:
+            print(f"[ERRO] {nome}: raiz nao encontrada ({resultado_alta.status.name})")
+
+def tests_chebyshev(a: float, b: float, func: sp.Expr, repeticoes: int = 100):
+    """
+    Constrói o proxy de Chebyshev (metodos.chebyshev) de func em [a,b] e
+    lista todas as raízes do intervalo, com o custo da construção e o de uma
+    consulta repetida.
+
+    Args:
+        a, b (float): Intervalo amostrado
+        func (sp.Expr | Expressao): Função suave em [a,b]
+        repeticoes (int): Amostras usadas na medição da consulta
+    """
+    from metodos.chebyshev import Proxy
+
+    print("\nPROXY DE CHEBYSHEV (TODAS AS RAIZES EM [a,b])")
+    print("-" * 30)
+    try:
+        proxy = Proxy(func, a, b)
+        tempo_proxy = benchmark.cronometrar(lambda: Proxy(func, a, b), 5, 1)['mediana_ms']
+        avaliacoes_proxy = proxy.avaliacoes
+        raizes_proxy = proxy.raizes()
+        avaliacoes_consulta = proxy.avaliacoes - avaliacoes_proxy
+        tempo_consulta = benchmark.cronometrar(proxy.raizes, repeticoes)['mediana_ms']
+        print(f"Grau {proxy.grau}, construido com {avaliacoes_proxy} avaliacoes de f em {tempo_proxy:.3f} ms")
+        print("Raizes: " + (", ".join(f"{r:.8f}" for r in raizes_proxy) or "nenhuma"))
+        print(f"Consulta repetida (mediana): {tempo_consulta:.6f} ms, "
+              f"{avaliacoes_consulta} avaliacoes de f (polimento)")
+    except ValueError as e:
+        print(f"[ERRO] {e}")
+
+def tests_lote(a: float, b: float, x0: float, x1: float, func: sp.Expr, precisao: float,
+               iteracoes: int, repeticoes: int = 100):
+    """
+    Executa o Newton e a Secante em lote (metodos.lote) sobre uma malha de
+    1000 estimativas iniciais em [a,b] e agrupa as raízes alcançadas.
+
+    Args:
+        a, b (float): Intervalo coberto pela malha
+        x0, x1 (float): A Secante parte de cada ponto x e de x + (x1 - x0)
+        func (sp.Expr | Expressao): Função a ser analisada
+        precisao (float): Critério de parada
+        iteracoes (int): Número máximo de iterações
+        repeticoes (int): Amostras da medição de tempo (um décimo, no lote)
+    """
+    import numpy as np
+    from metodos.lote import newton_lote, secante_lote
+
+    print("\nNEWTON E SECANTE EM LOTE (MALHA DE ESTIMATIVAS EM [a,b])")
+    print("-" * 30)
+    malha = np.linspace(a, b, 1000)
+    for nome, executar in (("Newton", lambda: newton_lote(malha, func, precisao, iteracoes)),
+                           ("Secante", lambda: secante_lote(malha, malha + (x1 - x0), func, precisao, iteracoes))):
+        raizes_lote, _, status_lote = executar()
+        tempo_lote = benchmark.cronometrar(executar, max(1, repeticoes // 10))['mediana_ms']
+        convergidas = status_lote == Status.CONVERGIU
+        # Raízes iguais a menos da precisão contam como a mesma
+        casas = max(1, int(-np.log10(precisao)) - 1)
+        valores, contagens = np.unique(np.round(raizes_lote[convergidas], casas), return_counts=True)
+        print(f"{nome}: {convergidas.sum()} de {malha.size} estimativas convergiram para {valores.size} "
+              f"raizes distintas em {tempo_lote:.3f} ms")
+        for k in np.argsort(-contagens, kind='stable')[:3]:
+            print(f"  raiz {valores[k]:.{casas}f} alcancada por {contagens[k]} estimativas")
+
+def tests_sistema(sistema: Sistema, x0, precisao: float, iteracoes: int, repeticoes: int = 100):
+    """
+    Executa e compara o Newton amortecido e o Broyden em um sistema não linear.
+
+    Mostra, para cada método, a solução, as iterações, as avaliações de F e
+    de J (a Jacobiana é o que o Broyden economiza) e o tempo mediano.
+    """
+    import metodos.sistemas
+
+    print(f"\nSISTEMA: {sistema.n} equacoes, {len(sistema.jacobiana)} entradas nao nulas na Jacobiana")
+    for equacao in sistema.equacoes[:5]:
+        print(f"   {equacao} = 0")
+    if sistema.n > 5:
+        print(f"   ... (mais {sistema.n - 5} equacoes)")
+
+    for numero, (nome, metodo) in enumerate((("NEWTON AMORTECIDO", metodos.sistemas.newton_sistema),
+                                              ("BROYDEN", metodos.sistemas.broyden)), 1):
+        print(f"\n{numero}. {nome}")
+        print("-" * 30)
+        resultado = metodo(sistema, x0, precisao, iteracoes)
+        print(f"Resultado: {resultado}")
+        if resultado.convergiu:
+            tempo = benchmark.cronometrar(lambda: metodo(sistema, x0, precisao, iteracoes), repeticoes)['mediana_ms']
+            print(f"[OK] Iteracoes: {resultado.iteracoes}")
+            print(f"Avaliacoes: {resultado.avaliacoes_F} de F + {resultado.avaliacoes_J} de J")
+            print(f"Tempo de execucao (mediana): {tempo:.6f} ms")
+            print(f"Precisao final ||F(x)|| = {resultado.residuo:.2e}")
+            for v, valor in list(zip(sistema.variaveis, resultado.x))[:10]:
+                print(f"   {v} = {valor:.10f}")
+            if sistema.n > 10:
+                print(f"   ... (mais {sistema.n - 10} incognitas)")
+        else:
+            print(f"[ERRO] Solucao nao encontrada ({resultado.status.name})")
@@ -0,0 +1,64 @@
+"""
+Proxy de Chebyshev: aproximação de f, todas as raízes de f(x) = y e
+consultas repetidas sem reconstruir.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from metodos import chebyshev, raizes
+from metodos.chebyshev import Proxy
+
+
+@pytest.mark.parametrize("texto, a, b, esperadas", [
+    ("(x - 1)*(x - 2)*(x - 3)", 0, 4, [1, 2, 3]),
+    ("sin(50*x)", 0.01, 10, [k * math.pi / 50 for k in range(1, 160)]),
+    ("cos(x)", -10, 10, [(k + 0.5) * math.pi for k in range(-3, 3)]),
+    ("x**2 + 1", -3, 3, []),
+])
+def test_todas_as_raizes(texto, a, b, esperadas):
+    obtidas = Proxy(texto, a, b).raizes()
+    assert len(obtidas) == len(esperadas)
+    assert np.allclose(obtidas, esperadas, atol=1e-10)
+
+
+def test_igual_a_varredura_por_amostras():
+    texto = "10*exp(-0.5*x)*cos(2*x) - 5"
+    assert np.allclose(chebyshev.todas_raizes(texto, 0, 5), raizes.todas_raizes(texto, 0, 5, precisao=1e-12),
+                       atol=1e-10)
+
+
+def test_raiz_dupla_aparece_uma_vez():
+    obtidas = Proxy("x**3 - 5*x**2 + 8*x - 4", 0, 3).raizes()
+    assert len(obtidas) == 2
+    assert np.allclose(obtidas, [1, 2], atol=1e-6)
+
+
+def test_consultas_de_outros_niveis_sem_reconstruir():
+    texto = "80*exp(-2*x) + 20*exp(-0.1*x)"
+    f = lambda x: 80 * math.exp(-2 * x) + 20 * math.exp(-0.1 * x)
+    proxy = Proxy(texto, 0, 10)
+    coeficientes = proxy.coeficientes.copy()
+    for nivel in (10, 12, 15, 20):
+        (raiz,) = proxy.raizes(nivel)
+        assert f(raiz) == pytest.approx(nivel, abs=1e-12)
+    assert np.array_equal(proxy.coeficientes, coeficientes)
+
+
+def test_aproxima_a_funcao():
+    proxy = Proxy("exp(x)*sin(3*x)", -1, 2)
+    x = np.linspace(-1, 2, 101)
+    assert np.allclose(proxy(x), np.exp(x) * np.sin(3 * x), atol=1e-12)
+    assert np.allclose(proxy.derivada(x), np.exp(x) * (np.sin(3 * x) + 3 * np.cos(3 * x)), atol=1e-9)
+
+
+def test_proxy_em_cache():
+    assert chebyshev.proxy("x**2 - 2", 0, 2) is chebyshev.proxy("x**2 - 2", 0, 2)
+
+
+@pytest.mark.parametrize("texto, a, b", [("x", 1, 1), ("1/x", -1, 1), ("abs(x)", -1, 1)])
+def test_construcao_invalida(texto, a, b):
+    with pytest.raises(ValueError):
+        Proxy(texto, a, b, grau_maximo=1024)
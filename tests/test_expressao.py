@@ -0,0 +1,41 @@
+"""
+Compara o compilador restrito (metodos.expressao) com o sympify nas
+entradas com ^, que o sympify lê como potência.
+"""
+
+import math
+
+import pytest
+import sympy as sp
+
+from metodos.bisseccao import bisseccao
+from metodos.expressao import Expressao
+from metodos import fundido
+
+TEXTOS = [
+    "x^2-1",
+    "2*x^2",
+    "x^3 - 5*x^2 + 8*x - 4",
+    "x^2^3",
+    "-x^2",
+    "2^-x",
+    "(x+1)^2/3",
+    "exp(-x^2) - x^3/4",
+]
+PONTOS = [-1.3, 0.4, 1.7, 3.0]
+
+
+@pytest.mark.parametrize("texto", TEXTOS)
+def test_potencia_com_circunflexo_igual_ao_sympify(texto):
+    simbolica = sp.sympify(texto)
+    derivada = sp.diff(simbolica, sp.Symbol('x'))
+    expressao = Expressao(texto)
+    for ponto in PONTOS:
+        assert expressao.f(ponto) == pytest.approx(float(simbolica.subs('x', ponto)), rel=1e-12)
+        assert expressao.df(ponto) == pytest.approx(float(derivada.subs('x', ponto)), rel=1e-12)
+
+
+def test_bisseccao_com_circunflexo():
+    for resultado in (bisseccao(0, 3, 100, "x^2-4", 1e-8), fundido.bisseccao(0, 3, 100, "x^2-4", 1e-8)):
+        assert resultado.convergiu
+        assert math.isclose(resultado.raiz, 2.0, abs_tol=1e-7)
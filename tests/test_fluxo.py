@@ -0,0 +1,47 @@
+"""
+Leitura das funções no modo em fluxo: só o compilador restrito, a menos que
+o SymPy seja pedido explicitamente.
+"""
+
+import json
+
+import fluxo
+
+
+def _injecao(caminho):
+    return f"x + 0*len(__import__('builtins').open({str(caminho)!r}, 'w').name)"
+
+
+def test_texto_executavel_recusado(tmp_path):
+    alvo = tmp_path / "executado"
+    resultado = fluxo.resolver_problema({"funcao": _injecao(alvo), "a": 0, "b": 3})
+    assert resultado["erro"]
+    assert not resultado["convergiu"]
+    assert not alvo.exists()
+
+
+def test_linha_executavel_recusada(tmp_path):
+    alvo = tmp_path / "executado"
+    saida = fluxo.resolver_bloco([json.dumps({"funcao": _injecao(alvo), "a": 0, "b": 3})], 1)
+    assert json.loads(saida)["erro"]
+    assert not alvo.exists()
+
+
+def test_funcao_que_nao_e_texto():
+    assert fluxo.resolver_problema({"funcao": 4, "a": 0, "b": 3})["erro"]
+
+
+def test_restrita_resolve():
+    for metodo in fluxo.METODOS:
+        resultado = fluxo.resolver_problema({"funcao": "x**2 - 4", "metodo": metodo,
+                                             "a": 0, "b": 3, "x0": 3, "x1": 2.5})
+        assert resultado["convergiu"], metodo
+        assert abs(resultado["raiz"] - 2) < 1e-5
+
+
+def test_simbolica_so_quando_pedida():
+    problema = {"funcao": "besselj(0, x)", "a": 2, "b": 3}
+    assert fluxo.resolver_problema(problema)["erro"]
+    resultado = fluxo.resolver_problema(problema, simbolica=True)
+    assert resultado["convergiu"]
+    assert abs(resultado["raiz"] - 2.404825557695773) < 1e-6
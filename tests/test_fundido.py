@@ -0,0 +1,85 @@
+"""
+Métodos fundidos: mesmo resultado, histórico e estado dos métodos genéricos
+de que a fonte foi gerada.
+"""
+
+import math
+
+import pytest
+
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.newton
+import metodos.secante
+from metodos import avaliador, fundido
+from metodos.resultado import Estado, Status, Traco
+
+FUNCOES = [
+    "x**2 - 4",
+    "80*exp(-2*x) + 20*exp(-0.1*x) - 10",
+    "10*exp(-0.5*x)*cos(2*x) - 5",
+    "sqrt(x) - 1.5",       # NaN à esquerda de zero
+    "x**2 + 1",            # sem raiz real
+    "abs(x - 1.2) - 0.3",
+]
+
+# (método fundido, método genérico, argumentos de cada um para (a, b), precisao, iteracoes)
+CASOS = {
+    "bisseccao": (lambda a, b, f, p, n, **k: fundido.bisseccao(a, b, n, f, p, **k),
+                  lambda a, b, f, p, n, **k: metodos.bisseccao.bisseccao(a, b, n, f, p, **k)),
+    "falsaPosicao": (lambda a, b, f, p, n, **k: fundido.falsaPosicao(a, b, f, p, n, **k),
+                     lambda a, b, f, p, n, **k: metodos.falsaPosicao.falsaPosicao(a, b, f, p, n, **k)),
+    "secante": (lambda a, b, f, p, n, **k: fundido.secante(a, b, f, p, n, **k),
+                lambda a, b, f, p, n, **k: metodos.secante.secante(a, b, f, p, n, **k)),
+    "newton": (lambda a, b, f, p, n, **k: fundido.newton(b, f, p, n, **k),
+               lambda a, b, f, p, n, **k: metodos.newton.newton(b, f, avaliador.compilar_derivada(f), p, n, **k)),
+}
+
+
+def _campos(resultado):
+    return (resultado.status, resultado.raiz, resultado.residuo, resultado.iteracoes,
+            resultado.avaliacoes_f, resultado.avaliacoes_df)
+
+
+def _iguais(x, y):
+    return all(a == b or (isinstance(a, float) and math.isnan(a) and math.isnan(b)) for a, b in zip(x, y))
+
+
+def test_todos_os_genericos_tem_caso():
+    assert set(CASOS) == set(fundido.GENERICOS)
+
+
+@pytest.mark.parametrize("metodo", list(CASOS))
+@pytest.mark.parametrize("texto", FUNCOES)
+@pytest.mark.parametrize("iteracoes", [3, 100])
+def test_igual_ao_generico(metodo, texto, iteracoes):
+    assert fundido.compilar(texto, metodo) is not None
+    chamar_fundido, chamar_generico = CASOS[metodo]
+    for a, b in [(0.0, 3.0), (1.0, 1.7), (-2.0, 0.5)]:
+        traco_fundido, traco_generico = Traco(), Traco()
+        r_fundido = chamar_fundido(a, b, texto, 1e-10, iteracoes, registro=traco_fundido)
+        r_generico = chamar_generico(a, b, texto, 1e-10, iteracoes, registro=traco_generico)
+        assert _iguais(_campos(r_fundido), _campos(r_generico)), (a, b)
+        linhas_fundido, linhas_generico = traco_fundido.linhas(), traco_generico.linhas()
+        assert len(linhas_fundido) == len(linhas_generico)
+        assert all(_iguais(x, y) for x, y in zip(linhas_fundido, linhas_generico))
+
+
+@pytest.mark.parametrize("metodo", list(CASOS))
+def test_retomada_igual_ao_generico(metodo):
+    chamar_fundido, chamar_generico = CASOS[metodo]
+    texto = "80*exp(-2*x) + 20*exp(-0.1*x) - 10"
+    resultados = []
+    for chamar in (chamar_fundido, chamar_generico):
+        estado = Estado()
+        primeiro = chamar(5.0, 8.0, texto, 1e-3, 100, estado=estado)
+        retomado = chamar(5.0, 8.0, texto, 1e-12, 100, estado=estado)
+        resultados.append((_campos(primeiro), _campos(retomado)))
+    assert resultados[0] == resultados[1]
+    assert resultados[0][1][0] == Status.CONVERGIU
+
+
+def test_fora_do_compilador_restrito_usa_o_generico():
+    assert fundido.compilar("besselj(0, x)", "bisseccao") is None
+    with pytest.raises(ValueError):
+        fundido.compilar("x**2 - 4", "brent")
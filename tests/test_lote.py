@@ -0,0 +1,97 @@
+"""
+Métodos em lote: cada posição do lote chega ao mesmo resultado do método
+escalar com as mesmas estimativas.
+"""
+
+import numpy as np
+import pytest
+
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.newton
+import metodos.secante
+from metodos import avaliador
+from metodos.lote import (CONVERGIU, bisseccao_lote, falsaPosicao_lote, newton_lote,
+                          secante_lote)
+
+# (função, tolerância na raiz): na raiz dupla x = 2 da cúbica, o último bit
+# de f difere entre NumPy e math, e a raiz, mal condicionada, só concorda
+# até perto de 1e-10 (as iterações e o status continuam iguais)
+FUNCOES = [
+    ("x**2 - 4", 1e-12),
+    ("80*exp(-2*x) + 20*exp(-0.1*x) - 10", 1e-12),
+    ("x**3 - 5*x**2 + 8*x - 4", 1e-9),
+    ("10*exp(-0.5*x)*cos(2*x) - 5", 1e-12),
+    ("x**2 + 1", 1e-12),
+]
+
+# Estimativas de cada problema do lote: extremos (ou x0, x1) variados, com
+# intervalos sem mudança de sinal e partidas que divergem
+PRIMEIRAS = np.linspace(-3.0, 1.5, 19)
+SEGUNDAS = np.linspace(0.5, 6.0, 19)
+
+# (lote, escalar) com os argumentos (u, v, func, precisao, maxIter)
+CASOS = {
+    "bisseccao": (lambda u, v, func, p, n: bisseccao_lote(u, v, func, p, n),
+                  lambda u, v, func, p, n: metodos.bisseccao.bisseccao(u, v, n, func, p)),
+    "falsaPosicao": (lambda u, v, func, p, n: falsaPosicao_lote(u, v, func, p, n),
+                     lambda u, v, func, p, n: metodos.falsaPosicao.falsaPosicao(u, v, func, p, n)),
+    "secante": (lambda u, v, func, p, n: secante_lote(u, v, func, p, n),
+                lambda u, v, func, p, n: metodos.secante.secante(u, v, func, p, n)),
+    "newton": (lambda u, v, func, p, n: newton_lote(v, func, p, n),
+               lambda u, v, func, p, n: metodos.newton.newton(v, func, avaliador.compilar_derivada(func),
+                                                             p, n)),
+}
+
+
+# Métodos de intervalo em lote aceitam um extremo que já é raiz; os escalares não
+INTERVALO = ("bisseccao", "falsaPosicao")
+
+
+@pytest.mark.parametrize("metodo", list(CASOS))
+@pytest.mark.parametrize("texto, tolerancia", FUNCOES)
+def test_igual_ao_escalar_elemento_a_elemento(metodo, texto, tolerancia):
+    lote, escalar = CASOS[metodo]
+    f = avaliador.compilar(texto)
+    raizes, indices, status = lote(PRIMEIRAS, SEGUNDAS, texto, 1e-10, 60)
+    for k, (u, v) in enumerate(zip(PRIMEIRAS, SEGUNDAS)):
+        if metodo in INTERVALO and 0.0 in (f(u), f(v)):
+            continue
+        r = escalar(float(u), float(v), texto, 1e-10, 60)
+        assert status[k] == r.status, (k, u, v)
+        if r.convergiu:
+            assert raizes[k] == pytest.approx(r.raiz, rel=1e-12, abs=tolerancia), (k, u, v)
+            # O lote guarda o índice da iteração de convergência
+            assert indices[k] + 1 == r.iteracoes, (k, u, v)
+
+
+def test_parametros_iguais_a_expressoes_substituidas():
+    niveis = np.linspace(5, 50, 10)
+    raizes, indices, status = bisseccao_lote(0, 60, "80*exp(-2*x) + 20*exp(-0.1*x) - C", 1e-8, 100,
+                                             {"C": niveis})
+    for k, c in enumerate(niveis):
+        r = metodos.bisseccao.bisseccao(0, 60, 100, f"80*exp(-2*x) + 20*exp(-0.1*x) - {float(c)!r}", 1e-8)
+        assert status[k] == r.status
+        assert raizes[k] == pytest.approx(r.raiz, abs=1e-12)
+        assert indices[k] + 1 == r.iteracoes
+
+
+@pytest.mark.parametrize("lote", [bisseccao_lote, falsaPosicao_lote])
+def test_extremo_que_ja_e_raiz(lote):
+    raizes, indices, status = lote(np.array([-2.0, 0.0]), np.array([1.0, 2.0]), "x**2 - 4", 1e-10, 60)
+    assert raizes.tolist() == [-2.0, 2.0]
+    assert indices.tolist() == [0, 0]
+    assert np.all(status == CONVERGIU)
+
+
+def test_forma_do_lote_preservada():
+    a = np.zeros((3, 4))
+    b = np.full((3, 4), 3.0)
+    raizes, indices, status = bisseccao_lote(a, b, "x**2 - 4", 1e-8, 100)
+    assert raizes.shape == indices.shape == status.shape == (3, 4)
+    assert np.all(status == CONVERGIU)
+
+
+def test_newton_de_funcao_numerica_exige_derivada():
+    with pytest.raises(ValueError):
+        newton_lote(np.ones(3), avaliador.compilar_vetorial("x**2 - 4"), 1e-8, 10)
@@ -0,0 +1,51 @@
+"""
+Lote de arquivos: função lida só pelo compilador restrito e a mesma
+serialização JSON do modo em fluxo.
+"""
+
+import json
+import math
+
+import fluxo
+import lote_arquivos
+
+
+def _arquivo(diretorio, nome, funcao):
+    caminho = diretorio / nome
+    caminho.write_text("\n".join([funcao, "1", "3", "1.5", "2.5", "0.000001", "100"]) + "\n")
+    return str(caminho)
+
+
+def test_texto_executavel_recusado(tmp_path):
+    alvo = tmp_path / "executado"
+    nome = _arquivo(tmp_path, "p.txt", f"x + 0*len(__import__('builtins').open({str(alvo)!r}, 'w').name)")
+    linhas = lote_arquivos.resolver_arquivo(nome)
+    assert len(linhas) == 1 and linhas[0]["erro"]
+    assert not alvo.exists()
+
+
+def test_todos_os_metodos(tmp_path):
+    linhas = lote_arquivos.resolver_arquivo(_arquivo(tmp_path, "p.txt", "x**2 - 4"))
+    assert [l["metodo"] for l in linhas] == ["bisseccao", "falsaPosicao", "secante", "newton", "brent"]
+    assert all(l["convergiu"] and abs(l["raiz"] - 2) < 1e-5 for l in linhas)
+
+
+def test_simbolica_so_quando_pedida(tmp_path):
+    nome = _arquivo(tmp_path, "p.txt", "besselj(0, x) + 2")
+    assert lote_arquivos.resolver_arquivo(nome)[0]["erro"]
+    assert lote_arquivos.resolver_arquivo(nome, simbolica=True)[0]["erro"] is None
+
+
+def test_saida_jsonl(tmp_path, capsys):
+    _arquivo(tmp_path, "a.txt", "x**2 - 4")
+    _arquivo(tmp_path, "b.txt", "nao_e_funcao(x)")
+    assert lote_arquivos.main_lote([str(tmp_path), "--processos", "1"]) == 0
+    linhas = [json.loads(l) for l in capsys.readouterr().out.splitlines()]
+    assert len(linhas) == 6
+    assert linhas[-1]["erro"] and linhas[-1]["raiz"] is None
+
+
+def test_valor_json():
+    assert fluxo.valor_json(math.nan) is None
+    assert fluxo.valor_json(math.inf) is None
+    assert fluxo.valor_json(1.5) == 1.5
@@ -0,0 +1,41 @@
+"""
+Raízes de polinômios: deflação, multiplicidade e raízes simples próximas.
+"""
+
+import numpy as np
+import pytest
+
+from metodos.polinomio import deflacionar, horner, raizes_reais
+
+
+def test_raizes_simples_proximas_nao_viram_duplas():
+    esperadas = [-9.10188614535164, -8.825817716323227, -8.55431567853977, -8.068656898884512,
+                 -6.4484305714959405, -5.933069608424788, -1.4379634183400452, 9.44722916963823]
+    raizes = raizes_reais(list(np.poly(esperadas)))
+    assert [m for _, m in raizes] == [1] * len(esperadas)
+    assert np.allclose([r for r, _ in raizes], esperadas, atol=1e-6)
+
+
+@pytest.mark.parametrize("raizes, esperado", [
+    ([1, 2, 2], [(1, 1), (2, 2)]),
+    ([-3, 1, 1, 1, 2, 2], [(-3, 1), (1, 3), (2, 2)]),
+    ([-2, 1, 1, 1, 1], [(-2, 1), (1, 4)]),
+    ([0, 0, 5], [(0, 2), (5, 1)]),
+])
+def test_multiplicidades(raizes, esperado):
+    obtido = raizes_reais(list(np.poly(raizes)))
+    assert [m for _, m in obtido] == [m for _, m in esperado]
+    assert np.allclose([r for r, _ in obtido], [r for r, _ in esperado], atol=1e-4)
+
+
+def test_so_raizes_complexas_fora():
+    assert raizes_reais("x**4 - 1") == [(-1.0, 1), (1.0, 1)]
+    assert raizes_reais("x**2 + 1") == []
+
+
+def test_deflacao():
+    # (x - 1)(x - 2)(x + 3) dividido por (x - 2)
+    coefs = list(np.poly([1, 2, -3]))
+    quociente = deflacionar(coefs, 2.0)
+    assert np.allclose(quociente, np.poly([1, -3]))
+    assert horner(coefs, 2.0)[0] == pytest.approx(0.0)
@@ -0,0 +1,51 @@
+"""
+Portfólio: todos os métodos avançam antes de um vencer, e o vencedor chega
+ao resultado de uma execução isolada.
+"""
+
+import pathlib
+
+import pytest
+
+import main
+from metodos import avaliador
+from metodos.portfolio import METODOS, portfolio
+from metodos.resultado import Estado
+
+RAIZ = pathlib.Path(__file__).resolve().parent.parent
+PROBLEMAS = ["input.txt", "input2.txt", "problema_bacterias.txt", "problema_deslocamento.txt"]
+
+
+@pytest.mark.parametrize("arquivo", PROBLEMAS)
+def test_todos_avancam_antes_do_vencedor(arquivo):
+    func, a, b, x0, x1, precisao, iteracoes = main.ler_problema(str(RAIZ / arquivo), simbolica=False)
+    corrida = portfolio(a, b, x0, x1, func, precisao, iteracoes)
+    assert corrida.convergiu
+    assert all(gasto > 0 for gasto in corrida.avaliacoes.values()), corrida.avaliacoes
+
+
+@pytest.mark.parametrize("arquivo", PROBLEMAS)
+def test_vencedor_igual_a_execucao_isolada(arquivo):
+    func, a, b, x0, x1, precisao, iteracoes = main.ler_problema(str(RAIZ / arquivo), simbolica=False)
+    corrida = portfolio(a, b, x0, x1, func, precisao, iteracoes)
+    f, df = avaliador.compilar(func), avaliador.compilar_derivada(func)
+    isolado = METODOS[corrida.vencedor](a, b, x0, x1, f, df, precisao, iteracoes, Estado())
+    assert corrida.resultado.raiz == isolado.raiz
+    assert corrida.resultado.iteracoes == isolado.iteracoes
+    assert corrida.resultado.avaliacoes == isolado.avaliacoes
+
+
+def test_newton_que_cicla_nao_impede_a_resposta():
+    # O Newton a partir de 0 cicla entre 0 e 1 sem achar a raiz
+    corrida = portfolio(-3.0, 0.0, 0.0, 1.0, "x**3 - 2*x + 2", 1e-6, 100, orcamento=40)
+    assert corrida.convergiu and corrida.vencedor != 'newton'
+    assert corrida.resultado.raiz == pytest.approx(-1.7692923542, abs=1e-5)
+
+
+def test_orcamento_esgotado():
+    corrida = portfolio(-3.0, 0.0, 0.0, 1.0, "x**3 - 2*x + 2", 1e-6, 100,
+                        metodos=('newton',), orcamento=10)
+    assert not corrida.convergiu
+    assert corrida.estados == {'newton': 'ORCAMENTO'}
+    # Só as avaliações iniciais do método podem passar do orçamento
+    assert corrida.avaliacoes['newton'] <= 12
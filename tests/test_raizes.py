@@ -0,0 +1,47 @@
+"""
+Todas as raízes de um intervalo: contagem em funções oscilantes, raízes
+tangentes e pares próximos que não trocam de sinal na malha inicial.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from metodos.raizes import isolar, todas_raizes
+
+
+@pytest.mark.parametrize("texto, a, b, esperadas", [
+    ("sin(50*x)", 0.01, 10, [k * math.pi / 50 for k in range(1, 160)]),
+    ("cos(x)", -10, 10, [(k + 0.5) * math.pi for k in range(-3, 3)]),
+    ("(x - 1)*(x - 2)*(x - 3)", 0, 4, [1, 2, 3]),
+])
+def test_contagem_e_posicao(texto, a, b, esperadas):
+    raizes = todas_raizes(texto, a, b, precisao=1e-10)
+    assert len(raizes) == len(esperadas)
+    assert np.allclose(raizes, sorted(esperadas), atol=1e-8)
+
+
+def test_raiz_tangente():
+    # input2.txt: raiz simples em 1 e dupla em 2, sem troca de sinal em 2
+    raizes = todas_raizes("x**3 - 5*x**2 + 8*x - 4", 0, 3)
+    assert len(raizes) == 2
+    assert np.allclose(raizes, [1, 2], atol=1e-3)
+
+
+def test_par_proximo_entre_duas_amostras():
+    # As duas raízes ficam no mesmo subintervalo da malha inicial
+    h = 1e-4
+    raizes = todas_raizes(f"(x - 0.5 - {h})*(x - 0.5 + {h})", 0, 1, precisao=1e-12, amostras=64)
+    assert np.allclose(raizes, [0.5 - h, 0.5 + h], atol=1e-9)
+
+
+def test_isolar_intervalos_com_troca_de_sinal():
+    esq, dir, exatas = isolar("x**2 - 2", -2, 2, amostras=9)
+    assert len(esq) == 2 and len(exatas) == 0
+    for e, d in zip(esq, dir):
+        assert (e**2 - 2) * (d**2 - 2) < 0
+
+
+def test_sem_raizes():
+    assert todas_raizes("x**2 + 1", -5, 5).size == 0
@@ -0,0 +1,104 @@
+"""
+Refinamento incremental: um resultado retomado do armazém é igual ao de uma
+execução nova com a precisão pedida, pagando só as avaliações novas.
+"""
+
+import pytest
+
+import metodos.bisseccao
+import metodos.falsaPosicao
+import metodos.newton
+import metodos.secante
+from metodos.refinamento import Armazem
+from metodos.resultado import Status
+
+FUNCAO = "80*exp(-2*x) + 20*exp(-0.1*x) - 10"
+DERIVADA = "-160*exp(-2*x) - 2*exp(-0.1*x)"
+
+# (armazém, execução nova) com os argumentos (func, precisao, maxIter)
+CASOS = {
+    "bisseccao": (lambda arm, func, p, n: arm.bisseccao(5.0, 8.0, n, func, p),
+                  lambda func, p, n: metodos.bisseccao.bisseccao(5.0, 8.0, n, func, p)),
+    "falsaPosicao": (lambda arm, func, p, n: arm.falsaPosicao(5.0, 8.0, func, p, n),
+                     lambda func, p, n: metodos.falsaPosicao.falsaPosicao(5.0, 8.0, func, p, n)),
+    "illinois": (lambda arm, func, p, n: arm.falsaPosicao(5.0, 8.0, func, p, n, variante='illinois'),
+                 lambda func, p, n: metodos.falsaPosicao.falsaPosicao(5.0, 8.0, func, p, n,
+                                                                      variante='illinois')),
+    "secante": (lambda arm, func, p, n: arm.secante(5.0, 6.0, func, p, n),
+                lambda func, p, n: metodos.secante.secante(5.0, 6.0, func, p, n)),
+    "newton": (lambda arm, func, p, n: arm.newton(5.0, func, DERIVADA, p, n),
+               lambda func, p, n: metodos.newton.newton(5.0, func, DERIVADA, p, n)),
+}
+
+
+@pytest.mark.parametrize("metodo", list(CASOS))
+@pytest.mark.parametrize("primeira, segunda", [(1e-3, 1e-12), (1e-6, 1e-10), (1e-2, 1e-8)])
+def test_retomado_igual_a_execucao_nova(metodo, primeira, segunda):
+    pelo_armazem, nova = CASOS[metodo]
+    armazem = Armazem()
+    anterior = pelo_armazem(armazem, FUNCAO, primeira, 100)
+    assert armazem.origem == "novo"
+    retomado = pelo_armazem(armazem, FUNCAO, segunda, 100)
+    esperado = nova(FUNCAO, segunda, 100)
+
+    assert retomado.status == esperado.status == Status.CONVERGIU
+    assert retomado.raiz == esperado.raiz
+    assert retomado.iteracoes == esperado.iteracoes
+    # Só as avaliações novas: as da primeira execução não se repetem
+    assert armazem.origem == "retomado"
+    assert retomado.avaliacoes == esperado.avaliacoes - anterior.avaliacoes
+
+
+@pytest.mark.parametrize("metodo", list(CASOS))
+def test_precisao_ja_atendida_reaproveita(metodo):
+    pelo_armazem, _ = CASOS[metodo]
+    armazem = Armazem()
+    primeiro = pelo_armazem(armazem, FUNCAO, 1e-10, 100)
+    segundo = pelo_armazem(armazem, FUNCAO, 1e-4, 100)
+    assert armazem.origem == "reaproveitado"
+    assert segundo.raiz == primeiro.raiz and segundo.avaliacoes == 0
+
+
+def test_limite_de_iteracoes_conta_desde_a_primeira_execucao():
+    armazem = Armazem()
+    armazem.bisseccao(5.0, 8.0, 10, FUNCAO, 1e-3)
+    retomado = armazem.bisseccao(5.0, 8.0, 15, FUNCAO, 1e-12)
+    esperado = metodos.bisseccao.bisseccao(5.0, 8.0, 15, FUNCAO, 1e-12)
+    assert retomado.status == esperado.status == Status.MAX_ITER
+    assert retomado.iteracoes == esperado.iteracoes == 15
+
+
+def test_falha_sem_iteracoes_sempre_reaproveitada():
+    armazem = Armazem()
+    assert armazem.bisseccao(0.0, 3.0, 100, FUNCAO, 1e-6).status == Status.SEM_MUDANCA_SINAL
+    assert armazem.bisseccao(0.0, 3.0, 100, FUNCAO, 1e-2).status == Status.SEM_MUDANCA_SINAL
+    assert armazem.origem == "reaproveitado"
+
+
+def test_falha_com_precisao_maior_executa_de_novo():
+    # A Secante diverge em atan a partir de 3 e 4 e para por divisão por zero
+    armazem = Armazem()
+    assert armazem.secante(3.0, 4.0, "atan(x)", 1e-6, 100).status == Status.DIVISAO_ZERO
+    armazem.secante(3.0, 4.0, "atan(x)", 1e-8, 100)
+    assert armazem.origem == "reaproveitado"
+    armazem.secante(3.0, 4.0, "atan(x)", 1e-1, 100)
+    assert armazem.origem == "novo"
+
+
+def test_chave_ignora_espacos_e_separa_variantes():
+    armazem = Armazem()
+    armazem.falsaPosicao(5.0, 8.0, FUNCAO, 1e-6, 100)
+    armazem.falsaPosicao(5.0, 8.0, FUNCAO.replace(" ", ""), 1e-6, 100)
+    assert armazem.origem == "reaproveitado"
+    armazem.falsaPosicao(5.0, 8.0, FUNCAO, 1e-6, 100, variante='illinois')
+    assert armazem.origem == "novo"
+    assert armazem.estatisticas()["problemas"] == 2
+
+
+def test_descarte_lru():
+    armazem = Armazem(capacidade=2)
+    for b in (6.0, 7.0, 8.0):
+        armazem.bisseccao(5.0, b, 100, FUNCAO, 1e-6)
+    assert armazem.estatisticas()["problemas"] == 2
+    armazem.bisseccao(5.0, 6.0, 100, FUNCAO, 1e-6)
+    assert armazem.origem == "novo"
@@ -0,0 +1,124 @@
+"""
+Serviço HTTP: funções lidas só pelo compilador restrito, em pedidos isolados,
+em lotes e em grupos vetorizados.
+"""
+
+import json
+import threading
+import urllib.request
+
+import pytest
+
+import servico
+
+
+def _injecao(caminho):
+    return f"x + 0*len(__import__('builtins').open({str(caminho)!r}, 'w').name)"
+
+
+@pytest.fixture(scope="module")
+def url():
+    rodando = servico.iniciar()
+    yield rodando.url
+    rodando.shutdown()
+    rodando.server_close()
+
+
+def _post(url, caminho, corpo):
+    pedido = urllib.request.Request(url + caminho, data=json.dumps(corpo).encode(),
+                                    headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(pedido, timeout=30) as resposta:
+        return json.loads(resposta.read())
+
+
+@pytest.mark.parametrize("metodo", ["brent", "bisseccao", "newton"])
+def test_resolver_recusa_texto_executavel(url, tmp_path, metodo):
+    alvo = tmp_path / "executado"
+    resultado = _post(url, "/resolver", {"funcao": _injecao(alvo), "metodo": metodo, "a": 0, "b": 3, "x0": 1})
+    assert resultado["erro"]
+    assert not resultado["convergiu"]
+    assert not alvo.exists()
+
+
+def test_lote_recusa_texto_executavel(url, tmp_path):
+    alvo = tmp_path / "executado"
+    problemas = [{"funcao": _injecao(alvo), "metodo": "newton", "x0": x0} for x0 in range(100)]
+    problemas.append({"funcao": "x**2 - 4", "metodo": "brent", "a": 0, "b": 3})
+    resultados = _post(url, "/lote", {"problemas": problemas})["resultados"]
+    assert all(r["erro"] for r in resultados[:-1])
+    assert resultados[-1]["convergiu"]
+    assert not alvo.exists()
+
+
+def test_grupo_vetorizado_recusa_texto_executavel(tmp_path):
+    alvo = tmp_path / "executado"
+    chave = (_injecao(alvo), "bisseccao", 1e-6, 100)
+    problemas = [{**servico.fluxo.PADROES, "funcao": chave[0], "metodo": "bisseccao", "a": 0, "b": 3}] * 4
+    resultados = servico._resolver_grupo(chave, problemas, minimo=1)
+    assert all(r["erro"] for r in resultados)
+    assert not alvo.exists()
+
+
+def _espiar(monkeypatch, metodo):
+    """Troca a função do lote do método por uma que registra os tamanhos dos grupos."""
+    vetorizado, campos, avaliacoes = servico.VETORIZADOS[metodo]
+    tamanhos = []
+
+    def espia(*args, **kwargs):
+        tamanhos.append(len(args[0]))
+        return vetorizado(*args, **kwargs)
+
+    monkeypatch.setitem(servico.VETORIZADOS, metodo, (espia, campos, avaliacoes))
+    return tamanhos
+
+
+def test_pedidos_simultaneos_passam_pelo_lote(monkeypatch):
+    tamanhos = _espiar(monkeypatch, "bisseccao")
+    # Grupo fechado ao chegar o oitavo pedido; o pedido a mais em andamento
+    # impede o líder de dispensar a janela se os outros ainda não chegaram
+    rodando = servico.iniciar(janela=10, maximo=8, minimo=8)
+    rodando.agrupador._ativos += 1
+    problemas = [{"funcao": "x**2 - 4", "metodo": "bisseccao", "a": 0, "b": 3 + k / 8} for k in range(8)]
+    resultados = [None] * len(problemas)
+    largada = threading.Barrier(len(problemas))
+
+    def cliente(k):
+        largada.wait()
+        resultados[k] = _post(rodando.url, "/resolver", problemas[k])
+
+    try:
+        threads = [threading.Thread(target=cliente, args=(k,)) for k in range(len(problemas))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert rodando.agrupador.vetorizados == len(problemas)
+    finally:
+        rodando.shutdown()
+        rodando.server_close()
+
+    assert tamanhos == [len(problemas)]
+    # Mesmos resultados do caminho escalar, inclusive iterações e avaliações
+    for problema, resultado in zip(problemas, resultados):
+        escalar = servico.fluxo.resolver_problema(problema)
+        assert resultado["raiz"] == pytest.approx(escalar["raiz"])
+        assert (resultado["iteracoes"], resultado["avaliacoes"]) == (escalar["iteracoes"], escalar["avaliacoes"])
+
+
+@pytest.mark.parametrize("metodo", list(servico.VETORIZADOS))
+def test_lote_do_tamanho_minimo_vetorizado(url, monkeypatch, metodo):
+    tamanhos = _espiar(monkeypatch, metodo)
+    problemas = [{"funcao": "x**2 - 4", "metodo": metodo, "a": 0, "b": 3 + k / 64, "x0": 3 + k / 64,
+                  "x1": 2.5} for k in range(servico.MINIMO)]
+    resultados = _post(url, "/lote", {"problemas": problemas})["resultados"]
+    assert tamanhos == [servico.MINIMO]
+    assert all(r["convergiu"] and abs(r["raiz"] - 2) < 1e-5 for r in resultados)
+
+
+@pytest.mark.parametrize("metodo", ["bisseccao", "falsaPosicao"])
+def test_grupo_com_extremo_raiz_igual_ao_escalar(metodo):
+    chave = ("x**2 - 4", metodo, 1e-6, 100)
+    problemas = [{**servico.fluxo.PADROES, "funcao": chave[0], "metodo": metodo, "a": a, "b": 3.0}
+                 for a in [-2.0, 2.0, 0.0, 1.0]]
+    resultados = servico._resolver_grupo(chave, problemas, minimo=1)
+    assert resultados == [servico.fluxo.resolver_problema(p) for p in problemas]
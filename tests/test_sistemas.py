@@ -0,0 +1,73 @@
+"""
+Sistemas não lineares: Jacobiana esparsa simbólica, Newton amortecido e
+Broyden chegando às mesmas soluções.
+"""
+
+import pathlib
+
+import numpy as np
+import pytest
+
+import main
+from metodos.resultado import Status
+from metodos.sistemas import Sistema, broyden, newton_sistema
+
+RAIZ = pathlib.Path(__file__).resolve().parent.parent
+METODOS = [newton_sistema, broyden]
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_sistema_de_exemplo(metodo):
+    sistema, x0, precisao, iteracoes = main.ler_sistema(str(RAIZ / "sistema_exemplo.txt"))
+    r = metodo(sistema, x0, precisao, iteracoes)
+    assert r.convergiu
+    assert np.max(np.abs(sistema.F(r.x))) < precisao
+    assert r.residuo < precisao
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_solucao_conhecida(metodo):
+    # Círculo de raio 2 e reta y = x: solução (sqrt(2), sqrt(2)) a partir de (1, 2)
+    sistema = Sistema(["x**2 + y**2 - 4", "x - y"], ["x", "y"])
+    r = metodo(sistema, [1.0, 2.0], 1e-12, 50)
+    assert r.status == Status.CONVERGIU
+    assert np.allclose(r.x, [np.sqrt(2), np.sqrt(2)], atol=1e-10)
+
+
+def test_newton_e_broyden_concordam_e_broyden_avalia_menos_jacobianas():
+    # Sistema tridiagonal de Broyden: (3 - 2x_i) x_i - x_{i-1} - 2 x_{i+1} + 1 = 0
+    n = 20
+    x = [f"x{i}" for i in range(n)] + ["0"]
+    equacoes = [f"(3 - 2*{x[i]})*{x[i]} - {x[i - 1] if i else 0} - 2*{x[i + 1]} + 1" for i in range(n)]
+    sistema = Sistema(equacoes, x[:n])
+    r_newton = newton_sistema(sistema, -1.0, 1e-10, 100)
+    r_broyden = broyden(sistema, -1.0, 1e-10, 100)
+    assert r_newton.convergiu and r_broyden.convergiu
+    assert np.allclose(r_newton.x, r_broyden.x, atol=1e-8)
+    assert r_broyden.avaliacoes_J < r_newton.avaliacoes_J
+
+
+def test_jacobiana_so_com_entradas_nao_nulas():
+    sistema = Sistema(["x**2 + y - 1", "y*z - 2", "z - 3"], ["x", "y", "z"])
+    assert sorted((i, j) for i, j, _ in sistema.jacobiana) == [(0, 0), (0, 1), (1, 1), (1, 2), (2, 2)]
+    J = sistema.J(np.array([1.0, 2.0, 3.0]))
+    assert np.allclose(J, [[2, 1, 0], [0, 3, 2], [0, 0, 1]])
+
+
+def test_variaveis_padrao_em_ordem_alfabetica():
+    sistema = Sistema(["y - 1", "x - 2"])
+    assert [v.name for v in sistema.variaveis] == ["x", "y"]
+    assert np.allclose(newton_sistema(sistema, 0.0, 1e-12, 10).x, [2, 1])
+
+
+def test_sistemas_invalidos():
+    with pytest.raises(ValueError):
+        Sistema(["x + y", "x - y", "x*y"], ["x", "y"])
+    with pytest.raises(ValueError):
+        Sistema(["x + a"], ["x"])
+
+
+@pytest.mark.parametrize("metodo", METODOS)
+def test_valor_invalido_no_ponto_inicial(metodo):
+    sistema = Sistema(["log(x) - 1", "y - 2"], ["x", "y"])
+    assert metodo(sistema, [-1.0, 0.0], 1e-8, 10).status == Status.VALOR_INVALIDO
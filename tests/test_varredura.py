@@ -0,0 +1,61 @@
+"""
+Varredura paramétrica: ordem da grade, raízes em cada ponto, continuação
+pela raiz anterior e recuperação por intervalo.
+"""
+
+import numpy as np
+import pytest
+
+from metodos.newton import newton
+from metodos.varredura import CONTINUACAO, FALHOU, INTERVALO, _ordem_zigue_zague, varredura
+
+
+def test_zigue_zague_cobre_a_grade_com_passos_unitarios():
+    ordem = _ordem_zigue_zague([3, 4, 2])
+    assert sorted(ordem) == [(i, j, k) for i in range(3) for j in range(4) for k in range(2)]
+    for anterior, atual in zip(ordem, ordem[1:]):
+        assert sum(abs(x - y) for x, y in zip(anterior, atual)) == 1
+
+
+@pytest.mark.parametrize("metodo", ["newton", "secante", "bisseccao", "falsaPosicao"])
+def test_raiz_em_cada_ponto(metodo):
+    tabela = varredura("x**2 - c", {"c": np.linspace(1, 4, 31)}, x0=1.0, x1=1.5, a=0.5, b=2.5,
+                       precisao=1e-10, metodo=metodo)
+    assert len(tabela) == 31
+    assert np.all(tabela['status'] == CONTINUACAO)
+    assert np.allclose(tabela['raiz'], np.sqrt(tabela['c']), atol=1e-8)
+
+
+def test_grade_de_dois_parametros_na_ordem_resolvida():
+    grade = {"k": [1.0, 2.0, 3.0], "c": [1.0, 4.0]}
+    tabela = varredura("k*x - c", grade, x0=0.5)
+    assert [(l['k'], l['c']) for l in tabela] == [(1, 1), (1, 4), (2, 4), (2, 1), (3, 1), (3, 4)]
+    assert np.allclose(tabela['raiz'], tabela['c'] / tabela['k'])
+
+
+def test_continuacao_economiza_iteracoes():
+    valores = np.linspace(1, 2, 11)
+    tabela = varredura("x**3 - c", {"c": valores}, x0=5.0, precisao=1e-12)
+    frias = [newton(5.0, f"x**3 - {float(c)!r}", "3*x**2", 1e-12, 100).iteracoes for c in valores[1:]]
+    assert tabela['iteracoes'][1:].sum() < sum(frias)
+    assert np.all(tabela['iteracoes'][1:] <= 4)
+
+
+def test_salto_de_ramo_recupera_por_intervalo():
+    # Com salto quase nulo, toda raiz depois da primeira conta como ramo perdido
+    tabela = varredura("x**2 - c", {"c": np.linspace(1, 4, 5)}, x0=1.0, a=0.0, b=3.0,
+                       precisao=1e-10, salto=1e-12)
+    assert tabela['status'][0] == CONTINUACAO
+    assert np.all(tabela['status'][1:] == INTERVALO)
+    assert np.allclose(tabela['raiz'], np.sqrt(tabela['c']), atol=1e-8)
+
+
+def test_sem_raiz_falha():
+    tabela = varredura("x**2 + c", {"c": [1.0, 2.0]}, x0=1.0, a=-2.0, b=2.0, metodo='bisseccao')
+    assert np.all(tabela['status'] == FALHOU)
+    assert np.all(np.isnan(tabela['raiz']))
+
+
+def test_metodo_desconhecido():
+    with pytest.raises(ValueError):
+        varredura("x - c", {"c": [1.0]}, x0=0.0, metodo='brent')